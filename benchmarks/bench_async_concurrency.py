@@ -0,0 +1,50 @@
+"""
+Benchmark: N concurrent `fetch_conversation_by_id` tool calls against the stub API.
+
+With the asyncio client each call runs on a worker thread, so N concurrent calls should
+finish in roughly one upstream latency instead of N of them.
+
+    python benchmarks/bench_async_concurrency.py --calls 20 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_dixa import StubDixaServer  # noqa: E402
+
+
+async def run(calls: int) -> float:
+    from tools.conversations.fetch_conversation_by_id import fetch_conversation_by_id
+
+    # Warm-up: first call pays one-off imports and client construction
+    await fetch_conversation_by_id("warm-up")
+    start = time.perf_counter()
+    await asyncio.gather(*(fetch_conversation_by_id(str(i)) for i in range(calls)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent fetch_conversation_by_id benchmark")
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with StubDixaServer(latency=args.latency) as stub:
+        os.environ["DIXA_API_BASE_URL"] = stub.base_url
+        os.environ.setdefault("DIXA_API_KEY", "benchmark-key")
+        elapsed = asyncio.run(run(args.calls))
+
+    print(f"calls:          {args.calls}")
+    print(f"latency/call:   {args.latency * 1000:.0f} ms")
+    print(f"sum-latency:    {args.calls * args.latency * 1000:.0f} ms")
+    print(f"wall time:      {elapsed * 1000:.0f} ms")
+    print(f"speedup:        {args.calls * args.latency / elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
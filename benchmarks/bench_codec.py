@@ -0,0 +1,144 @@
+"""
+Benchmark: JSON encode/decode time per codec backend for typical Dixa payloads.
+
+Covers three shapes: a conversation with its messages, a page of end users and an
+analytics records page. Every installed backend (orjson, msgspec, json) is measured,
+followed by the cost of turning each payload into an MCP tool result: FastMCP's default
+conversion and JsonTool on the decoded dict (add the decode time above for the full
+cost), and JsonTool on the undecoded body in passthrough mode.
+
+    python benchmarks/bench_codec.py --repeat 200
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dixa_api.codec import RawJson, available_codecs, codec as default_codec  # noqa: E402
+
+
+def conversation_payload(messages: int = 60) -> Dict[str, Any]:
+    return {
+        "data": {
+            "id": 48213,
+            "requesterId": "6c4d2a9e-0000-4b1f-9c3e-a1b2c3d4e5f6",
+            "channel": "Email",
+            "createdAt": "2024-03-01T12:00:00Z",
+            "direction": "Inbound",
+            "state": "Open",
+            "assignment": {"agentId": "a9d8c7b6-1111-4e2f-8a9b-0c1d2e3f4a5b", "assignedAt": "2024-03-01T12:05:00Z"},
+            "tags": ["billing", "priority", "vip"],
+            "customAttributes": [{"id": "b2c1", "name": "Plan", "identifier": "plan", "value": ["premium"]}],
+            "messages": [
+                {
+                    "id": f"m-{i}",
+                    "authorId": "6c4d2a9e-0000-4b1f-9c3e-a1b2c3d4e5f6",
+                    "createdAt": "2024-03-01T12:00:00Z",
+                    "attributes": {
+                        "_type": "EmailAttributes",
+                        "content": {"value": "Hello, I have a question about my last invoice. " * 6, "_type": "Text"},
+                        "from": {"email": "customer@example.com", "name": "Customer"},
+                        "to": [{"email": "support@example.com"}],
+                        "isAutomated": False,
+                    },
+                }
+                for i in range(messages)
+            ],
+        }
+    }
+
+
+def end_users_payload(users: int = 100) -> Dict[str, Any]:
+    return {
+        "data": [
+            {
+                "id": f"6c4d2a9e-{i:08d}-4b1f-9c3e-a1b2c3d4e5f6",
+                "name": f"Customer {i}",
+                "email": f"customer{i}@example.com",
+                "phoneNumber": f"+4512{i:06d}",
+                "additionalEmails": [],
+                "additionalPhoneNumbers": [],
+                "createdAt": "2024-03-01T12:00:00Z",
+                "customAttributes": [{"id": "b2c1", "name": "Plan", "identifier": "plan", "value": ["premium"]}],
+            }
+            for i in range(users)
+        ],
+        "meta": {"next": "/endusers?pageKey=abc", "previous": None},
+    }
+
+
+def analytics_payload(records: int = 500) -> Dict[str, Any]:
+    return {
+        "data": [
+            {
+                "id": f"{i:08d}-csid",
+                "value": {"value": i * 1.5, "_type": "DoubleField"},
+                "fields": [
+                    {"field": {"value": "Email", "_type": "StringField"}, "name": "channel"},
+                    {"field": {"value": f"a{i % 40}", "_type": "StringField"}, "name": "agent_id"},
+                    {"field": {"value": i % 2 == 0, "_type": "BooleanField"}, "name": "is_closed"},
+                    {"field": {"value": "2024-03-01T12:00:00Z", "_type": "TimestampField"}, "name": "created_at"},
+                ],
+            }
+            for i in range(records)
+        ],
+        "meta": {"next": None},
+    }
+
+
+SHAPES: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "conversation": conversation_payload,
+    "end_users": end_users_payload,
+    "analytics": analytics_payload,
+}
+
+
+def per_call_us(func: Callable[[], Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON codec backends on Dixa payload shapes")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    codecs = available_codecs()
+    print(f"backends: {', '.join(codecs)}")
+    print(f"{'shape':<14} {'bytes':>8} {'backend':<8} {'encode (us)':>12} {'decode (us)':>12}")
+    for shape, build in SHAPES.items():
+        payload = build()
+        for name, codec in codecs.items():
+            encoded = codec.dumps(payload)
+            assert codec.loads(encoded) == payload
+            encode = per_call_us(lambda: codec.dumps(payload), args.repeat)
+            decode = per_call_us(lambda: codec.loads(encoded), args.repeat)
+            print(f"{shape:<14} {len(encoded):>8} {name:<8} {encode:>12.1f} {decode:>12.1f}")
+
+    from fastmcp.tools import FunctionTool
+    from tools.base import JsonTool
+
+    async def tool() -> Dict[str, Any]:
+        return {}
+
+    default_tool = FunctionTool.from_function(tool)
+    json_tool = JsonTool.from_function(tool)
+    print()
+    print(f"{'shape':<14} {'FastMCP result (us)':>20} {'JsonTool result (us)':>21} {'passthrough (us)':>17}")
+    for shape, build in SHAPES.items():
+        payload = build()
+        default = per_call_us(lambda: default_tool.convert_result(payload), args.repeat)
+        fast = per_call_us(lambda: json_tool.convert_result(payload), args.repeat)
+        body = RawJson(default_codec.dumps(payload))
+        passthrough = per_call_us(lambda: json_tool.convert_result(body), args.repeat)
+        print(f"{shape:<14} {default:>20.1f} {fast:>21.1f} {passthrough:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
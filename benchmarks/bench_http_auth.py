@@ -0,0 +1,201 @@
+"""
+Benchmark: MCP tool calls per second over the streamable HTTP transport, by auth middleware.
+
+Starts the server under uvicorn in a subprocess per mode, opens one MCP session with
+an `Authorization: Bearer` header and sends `--requests` `tools/call` requests from
+`--concurrency` concurrent workers. It reports requests/sec and latency percentiles
+of the median of `--rounds` interleaved rounds per mode:
+
+- basehttp: the API key extracted by a Starlette BaseHTTPMiddleware, as the server
+  used to (each request gets an extra task and a wrapped response stream)
+- asgi: tools.http_auth.AuthContextMiddleware, the plain ASGI middleware the server uses
+
+Both modes run the same tool against the local stub API, so the difference is the
+per-request cost of the middleware.
+
+    python benchmarks/bench_http_auth.py --requests 2000 --concurrency 16 --rounds 3
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_dixa import StubDixaServer  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ("basehttp", "asgi")
+
+CHILD = """
+import os, sys, uvicorn
+sys.path.insert(0, os.environ["BENCH_ROOT"])
+import server
+
+if os.environ["BENCH_MODE"] == "asgi":
+    from tools.http_auth import http_middleware
+    middleware = http_middleware()
+else:
+    from benchmarks.bench_http_auth import legacy_middleware
+    middleware = legacy_middleware()
+app = server.mcp.http_app(transport="http", middleware=middleware)
+uvicorn.run(app, host="127.0.0.1", port=int(os.environ["BENCH_PORT"]), log_level="warning")
+"""
+
+HEADERS = {"Accept": "application/json, text/event-stream", "Authorization": "Bearer benchmark-key"}
+
+
+def legacy_middleware() -> list:
+    """The API key extraction the server did before, as a BaseHTTPMiddleware."""
+    from starlette.middleware import Middleware
+    from starlette.middleware.base import BaseHTTPMiddleware
+    from tools.http_auth import CREDENTIAL_STATE
+    from tools.shared import Credential, _client_api_key
+
+    class LegacyAuthMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            auth_header = request.headers.get("Authorization", "")
+            if auth_header:
+                token = auth_header.replace("Bearer ", "").strip()
+                if token:
+                    request.scope.setdefault("state", {})[CREDENTIAL_STATE] = Credential(token)
+                    _client_api_key.set(token)
+            return await call_next(request)
+
+    return [Middleware(LegacyAuthMiddleware)]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server did not start on port {port}")
+
+
+def _rpc(method: str, params: Dict, request_id: Optional[int] = None) -> Dict:
+    message = {"jsonrpc": "2.0", "method": method, "params": params}
+    if request_id is not None:
+        message["id"] = request_id
+    return message
+
+
+def _is_error(body: str) -> bool:
+    """Whether a (JSON or SSE-framed) JSON-RPC response reports an error."""
+    for line in body.splitlines():
+        if line.startswith("data:"):
+            body = line[5:]
+            break
+    result = json.loads(body)
+    return "error" in result or result.get("result", {}).get("isError", False)
+
+
+def run_load(url: str, tool: str, requests_total: int, concurrency: int) -> Tuple[float, List[float], int]:
+    """Open a session and send `requests_total` tool calls; return (seconds, latencies, errors)."""
+    response = requests.post(url, headers=HEADERS, json=_rpc("initialize", {
+        "protocolVersion": "2025-06-18", "capabilities": {},
+        "clientInfo": {"name": "bench_http_auth", "version": "1"},
+    }, 0))
+    response.raise_for_status()
+    headers = {**HEADERS, "mcp-session-id": response.headers["mcp-session-id"],
+               "mcp-protocol-version": "2025-06-18"}
+    requests.post(url, headers=headers, json=_rpc("notifications/initialized", {}))
+
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(1, requests_total + 1))
+    lock = threading.Lock()
+
+    def worker() -> None:
+        nonlocal errors
+        # One keep-alive connection per worker
+        with requests.Session() as http:
+            while True:
+                with lock:
+                    request_id = next(counter, None)
+                if request_id is None:
+                    return
+                start = time.perf_counter()
+                response = http.post(url, headers=headers,
+                                     json=_rpc("tools/call", {"name": tool, "arguments": {}}, request_id))
+                elapsed = time.perf_counter() - start
+                failed = response.status_code != 200 or _is_error(response.text)
+                with lock:
+                    latencies.append(elapsed)
+                    errors += failed
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies, errors
+
+
+def bench_mode(mode: str, stub_url: str, args: argparse.Namespace) -> Dict[str, float]:
+    port = free_port()
+    env = {**os.environ, "BENCH_ROOT": ROOT, "BENCH_MODE": mode, "BENCH_PORT": str(port),
+           "DIXA_API_BASE_URL": stub_url}
+    env.pop("DIXA_API_KEY", None)
+    child = subprocess.Popen([sys.executable, "-c", CHILD], cwd=ROOT, env=env)
+    try:
+        wait_for_port(port)
+        url = f"http://127.0.0.1:{port}/mcp"
+        # Warm-up: first calls pay tool imports and client construction
+        run_load(url, args.tool, args.concurrency * 4, args.concurrency)
+        elapsed, latencies, errors = run_load(url, args.tool, args.requests, args.concurrency)
+    finally:
+        child.terminate()
+        child.wait()
+    latencies.sort()
+    return {
+        "rps": args.requests / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streamable HTTP tool calls/sec by auth middleware")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--tool", default="list_tags", help="tool to call (without arguments)")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    results: Dict[str, List[Dict[str, float]]] = {mode: [] for mode in MODES}
+    with StubDixaServer() as stub:
+        # Alternate the modes, so load from anything else on the machine hits both alike
+        for _ in range(args.rounds):
+            for mode in MODES:
+                results[mode].append(bench_mode(mode, stub.base_url, args))
+
+    print(f"{'mode':<9} {'req/s':>8} {'p50 (ms)':>9} {'p99 (ms)':>9} {'errors':>7}")
+    for mode in MODES:
+        result = sorted(results[mode], key=lambda r: r["rps"])[len(results[mode]) // 2]
+        print(f"{mode:<9} {result['rps']:>8.0f} {result['p50']:>9.2f} {result['p99']:>9.2f} "
+              f"{result['errors']:>7}")
+
+if __name__ == "__main__":
+    main()
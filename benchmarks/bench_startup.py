@@ -0,0 +1,97 @@
+"""
+Benchmark: cold start of the MCP server, lazy vs eager tool registration.
+
+Imports `server` (which registers every tool) in a fresh `python -X importtime`
+subprocess per run and mode, reporting the median and best wall time, the number of
+modules loaded and the number of tools registered:
+
+- lazy: the default; tools are registered from stubs and their modules imported on first call
+- eager: DIXA_MCP_EAGER_TOOLS=1; every tool module and the dixa_api client imported up front
+
+It then prints the slowest imports of the last lazy run by cumulative time, in the
+`-X importtime` layout, to show where startup time goes. Pass --max-seconds to fail
+(exit status 1) when the lazy median exceeds it, e.g. in CI.
+
+    python benchmarks/bench_startup.py --runs 5 --top 15
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    "lazy": {},
+    "eager": {"DIXA_MCP_EAGER_TOOLS": "1"},
+}
+
+CHILD = (
+    "import asyncio, json, sys, time\n"
+    "start = time.perf_counter()\n"
+    "import server\n"
+    "elapsed = time.perf_counter() - start\n"
+    "tools = len(asyncio.run(server.mcp.list_tools()))\n"
+    "print(json.dumps({'seconds': elapsed, 'modules': len(sys.modules), 'tools': tools,"
+    " 'dixa_api_loaded': 'dixa_api.client' in sys.modules}))\n"
+)
+
+
+def run_child(extra_env: Dict[str, str]) -> Tuple[Dict[str, Any], str]:
+    """Start the server once; return its measurements and the -X importtime report."""
+    env = {**os.environ, "DIXA_API_KEY": "benchmark-key", "PYTHONPATH": ROOT, **extra_env}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def slowest_imports(report: str, top: int) -> List[Tuple[int, int, str]]:
+    """Parse `-X importtime` output into (self us, cumulative us, module) rows, slowest first."""
+    rows = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), module.rstrip()))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MCP server cold start, lazy vs eager tool registration")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    parser.add_argument("--max-seconds", type=float, help="fail if the lazy median exceeds this")
+    args = parser.parse_args()
+
+    print(f"{'mode':<6} {'median (s)':>11} {'best (s)':>9} {'modules':>8} {'tools':>6} {'dixa_api loaded':>16}")
+    medians = {}
+    reports = {}
+    for mode, extra_env in MODES.items():
+        samples = []
+        for _ in range(args.runs):
+            result, reports[mode] = run_child(extra_env)
+            samples.append(result["seconds"])
+        medians[mode] = statistics.median(samples)
+        print(f"{mode:<6} {medians[mode]:>11.3f} {min(samples):>9.3f} {result['modules']:>8} "
+              f"{result['tools']:>6} {str(result['dixa_api_loaded']):>16}")
+
+    print()
+    print("slowest imports (lazy, cumulative):")
+    print(f"{'self [us]':>10} | {'cumulative':>10} | imported package")
+    for self_us, cumulative_us, module in slowest_imports(reports["lazy"], args.top):
+        print(f"{self_us:>10} | {cumulative_us:>10} | {module}")
+
+    if args.max_seconds is not None and medians["lazy"] > args.max_seconds:
+        print(f"\nlazy startup {medians['lazy']:.3f}s exceeds --max-seconds {args.max_seconds}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark: peak memory of decoding one large list page, buffered vs streamed.
+
+Serves a single synthetic `/endusers` page of about `--size-mb` megabytes from the stub
+API and decodes it in a fresh subprocess per mode, reporting the child's peak RSS:
+
+- buffered: `get_end_users()` (response.json() on the whole body), then iterate the items
+- streamed: `get_end_users(stream=True)`, items decoded as they arrive off the socket
+
+    python benchmarks/bench_streaming_decode.py --size-mb 50
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_dixa import StubDixaHandler, StubDixaServer  # noqa: E402
+
+MODES = ("baseline", "buffered", "streamed")
+
+
+def build_page(size_mb: float) -> bytes:
+    """Build an end-users page of roughly size_mb megabytes."""
+    items = []
+    size = 0
+    i = 0
+    while size < size_mb * 1024 * 1024:
+        item = {
+            "id": f"6c4d2a9e-{i:08d}-4b1f-9c3e-a1b2c3d4e5f6",
+            "name": f"Customer {i}",
+            "email": f"customer{i}@example.com",
+            "phoneNumber": f"+4512{i:06d}",
+            "additionalEmails": [f"alt{i}@example.com"],
+            "additionalPhoneNumbers": [],
+            "createdAt": "2024-03-01T12:00:00Z",
+            "customAttributes": [
+                {"id": "b2c1", "name": "Plan", "identifier": "plan", "value": ["premium"]},
+                {"id": "b2c2", "name": "Region", "identifier": "region", "value": "EU"},
+            ],
+        }
+        encoded = json.dumps(item)
+        items.append(encoded)
+        size += len(encoded) + 1
+        i += 1
+    return ('{"data":[' + ",".join(items) + '],"meta":{}}').encode()
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(mode: str) -> None:
+    from dixa_api import DixaClient
+
+    client = DixaClient(api_key="benchmark-key")
+    start = time.perf_counter()
+    items = 0
+    if mode == "buffered":
+        page = client.get_end_users()
+        items = sum(1 for _ in page["data"])
+    elif mode == "streamed":
+        items = sum(1 for _ in client.get_end_users(stream=True))
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"mode": mode, "items": items, "seconds": elapsed, "peak_rss_mb": peak_rss_mb()}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Buffered vs streamed decode of a large page")
+    parser.add_argument("--size-mb", type=float, default=50)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        return
+
+    body = build_page(args.size_mb)
+
+    class LargePageHandler(StubDixaHandler):
+        def _respond(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = _respond
+
+    print(f"page size: {len(body) / (1024 * 1024):.1f} MB")
+    print(f"{'mode':<10} {'items':>8} {'seconds':>8} {'peak RSS (MB)':>14}")
+    with StubDixaServer(handler=LargePageHandler) as stub:
+        env = {**os.environ, "DIXA_API_BASE_URL": stub.base_url}
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", mode],
+                env=env, capture_output=True, text=True, check=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:<10} {result['items']:>8} {result['seconds']:>8.2f} {result['peak_rss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Check: a client evicted from the registry while a tool call uses it is closed only after the call.
+
+With a client registry of one client, a tool call for API key A looks up its client,
+makes a request and waits; meanwhile a call for key B evicts A's client. A's client
+must stay open until A's call has made its second request and returned, and be closed
+once, right after. Runs against the stub Dixa API.
+
+Exits non-zero if a check fails.
+
+    python benchmarks/check_client_eviction.py
+"""
+
+import asyncio
+import os
+import sys
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_dixa import StubDixaServer  # noqa: E402
+
+
+def main() -> None:
+    with StubDixaServer() as stub:
+        os.environ["DIXA_API_BASE_URL"] = stub.base_url
+        from tools import base
+        from tools.shared import _client_api_key
+
+        base.clients = base.ClientRegistry(max_clients=1, idle_seconds=0)
+        events: List[str] = []
+        started = asyncio.Event()
+        finish = asyncio.Event()
+
+        async def long_scan() -> Dict[str, Any]:
+            client = base.get_async_dixa_client()
+            close = client.client.close
+
+            def recording_close() -> None:
+                events.append("closed")
+                close()
+
+            client.client.close = recording_close
+            await client.get_conversation("1")
+            started.set()
+            await finish.wait()
+            await client.get_conversation("2")
+            events.append("scan finished")
+            return {"ok": True}
+
+        async def short_call() -> Dict[str, Any]:
+            return await base.get_async_dixa_client().get_conversation("3")
+
+        scan_tool = base.JsonTool.from_function(long_scan)
+        short_tool = base.JsonTool.from_function(short_call)
+
+        async def call(tool: Any, api_key: str) -> Any:
+            token = _client_api_key.set(api_key)
+            try:
+                return await tool.run({})
+            finally:
+                _client_api_key.reset(token)
+
+        async def scenario() -> None:
+            scan = asyncio.create_task(call(scan_tool, "key-a"))
+            await started.wait()
+            await call(short_tool, "key-b")
+            events.append("evicted")
+            finish.set()
+            await scan
+            events.append("scan returned")
+
+        asyncio.run(scenario())
+
+    results = [
+        ("deferred", events.index("closed") > events.index("scan finished") if "closed" in events else False,
+         " -> ".join(events)),
+        ("closed", events.count("closed") == 1, f"client closed {events.count('closed')} time(s)"),
+        ("registry", len(base.clients) == 1, f"{len(base.clients)} client(s) left in the registry"),
+    ]
+    for name, passed, detail in results:
+        print(f"{'ok' if passed else 'FAIL':<5} {name:<9} {detail}")
+    if not all(passed for _, passed, _ in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
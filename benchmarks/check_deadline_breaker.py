@@ -0,0 +1,66 @@
+"""
+Check: requests cut short by a caller's deadline don't trip the circuit breaker.
+
+Against the stub Dixa API with `--latency` seconds per request, makes more than
+DIXA_BREAKER_FAILURES `get_agent` calls under a deadline shorter than the latency.
+Each must fail with DeadlineExceeded, and the `agents` breaker must stay closed, so
+a following call without a deadline succeeds.
+
+Exits non-zero if a check fails.
+
+    python benchmarks/check_deadline_breaker.py --latency 0.5 --deadline 0.1
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_dixa import StubDixaServer  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deadline timeouts vs. the circuit breaker")
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--deadline", type=float, default=0.1)
+    args = parser.parse_args()
+
+    with StubDixaServer(latency=args.latency) as stub:
+        os.environ["DIXA_API_BASE_URL"] = stub.base_url
+        from dixa_api import DixaClient
+        from dixa_api.breaker import DEFAULT_FAILURE_THRESHOLD, CLOSED, circuit_breakers
+        from dixa_api.deadline import DeadlineExceeded, deadline
+
+        client = DixaClient(api_key="check-key")
+        calls = DEFAULT_FAILURE_THRESHOLD + 2
+        deadline_errors = 0
+        for index in range(calls):
+            try:
+                with deadline(args.deadline):
+                    client.get_agent(f"agent-{index}")
+            except DeadlineExceeded:
+                deadline_errors += 1
+            except Exception as e:
+                print(f"call {index} under deadline raised {type(e).__name__}: {e}")
+        state = circuit_breakers.state("agents") or CLOSED
+        try:
+            client.get_agent("agent-after")
+            after = "ok"
+        except Exception as e:
+            after = f"{type(e).__name__}: {e}"
+        client.close()
+
+    results = [
+        ("deadline", deadline_errors == calls, f"{deadline_errors}/{calls} calls raised DeadlineExceeded"),
+        ("breaker", state == CLOSED, f"agents breaker {state}"),
+        ("after", after == "ok", f"call without a deadline: {after}"),
+    ]
+    for name, passed, detail in results:
+        print(f"{'ok' if passed else 'FAIL':<5} {name:<9} {detail}")
+    if not all(passed for _, passed, _ in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Check: sampled DEBUG log lines reach the log handler only once every N records per call site.
+
+Enables DEBUG logging with DIXA_MCP_LOG_SAMPLE_EVERY=`--every` and sends `--requests`
+HTTP requests with an API key through AuthContextMiddleware, whose per-request line is
+sampled, and then logs as many records from an unsampled call site. Exactly
+ceil(requests / every) of the sampled lines and all of the unsampled ones must be
+written, and no raw API key may appear in the output.
+
+Exits non-zero if a check fails.
+
+    python benchmarks/check_log_sampling.py --every 100 --requests 250
+"""
+
+import argparse
+import asyncio
+import atexit
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+API_KEY = "sampling-check-key"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sampling of hot-path DEBUG log lines")
+    parser.add_argument("--every", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=250)
+    args = parser.parse_args()
+
+    os.environ["DIXA_MCP_LOG_LEVEL"] = "DEBUG"
+    os.environ["DIXA_MCP_LOG_SAMPLE_EVERY"] = str(args.every)
+    from tools import log as tools_log
+    output = io.StringIO()
+    tools_log.configure_logging(stream=output)
+    from tools.http_auth import AuthContextMiddleware
+
+    async def app(scope, receive, send):
+        pass
+
+    async def send_requests() -> None:
+        middleware = AuthContextMiddleware(app)
+        scope = {"type": "http", "method": "POST", "path": "/mcp",
+                 "headers": [(b"authorization", f"Bearer {API_KEY}".encode())]}
+        for _ in range(args.requests):
+            await middleware(dict(scope), None, None)
+
+    asyncio.run(send_requests())
+    logger = tools_log.get_logger("check")
+    for index in range(args.requests):
+        logger.debug("unsampled record %d", index)
+    # Flush the queue; the server stops the writer at exit
+    atexit.unregister(tools_log._listener.stop)
+    tools_log._listener.stop()
+
+    lines = output.getvalue().splitlines()
+    sampled_lines = sum("with API key key#" in line for line in lines)
+    unsampled_lines = sum("unsampled record" in line for line in lines)
+    expected = -(-args.requests // args.every)
+    results = [
+        ("sampled", sampled_lines == expected,
+         f"{sampled_lines}/{args.requests} per-request auth lines written, expected {expected}"),
+        ("unsampled", unsampled_lines == args.requests,
+         f"{unsampled_lines}/{args.requests} unsampled lines written"),
+        ("redacted", API_KEY not in output.getvalue(), "no raw API key in the log output"),
+    ]
+    for name, passed, detail in results:
+        print(f"{'ok' if passed else 'FAIL':<5} {name:<10} {detail}")
+    if not all(passed for _, passed, _ in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
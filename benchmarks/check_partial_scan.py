@@ -0,0 +1,98 @@
+"""
+Check: aggregate_analytics_records returns a partial result when the record stream stalls.
+
+The stub Dixa API answers the first records page with `--records` records and then
+stalls in the middle of the JSON body, longer than the tool's `--budget`. The read
+timeout fires while the streamed page is being decoded, where requests raises it as a
+ConnectionError rather than a Timeout. The tool must still return the records read so
+far, marked "partial" and "timed_out", within about its budget.
+
+Exits non-zero if a check fails.
+
+    python benchmarks/check_partial_scan.py --records 120 --budget 1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_dixa import StubDixaHandler, StubDixaServer  # noqa: E402
+
+
+class StallingHandler(StubDixaHandler):
+    """Sends `server.records` records of a page, then stalls before finishing the body."""
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.server.request_count += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        records = ",".join(json.dumps({"agent_id": f"agent-{i % 5}", "handling_time": i})
+                           for i in range(self.server.records))
+        self._chunk(('{"data":[' + records + ",").encode())
+        time.sleep(self.server.stall)
+        self._chunk(b'{"agent_id":"late"}]}')
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Partial record aggregates when the stream stalls")
+    parser.add_argument("--records", type=int, default=120)
+    parser.add_argument("--budget", type=float, default=1.0)
+    args = parser.parse_args()
+
+    with StubDixaServer(handler=StallingHandler) as stub:
+        stub.httpd.records = args.records
+        stub.httpd.stall = args.budget + 2
+        os.environ["DIXA_API_BASE_URL"] = stub.base_url
+        os.environ["DIXA_API_KEY"] = "check-key"
+        from dixa_api.deadline import reset_deadline, set_deadline
+        from tools.analytics.aggregate_analytics_records import aggregate_analytics_records
+
+        async def scan():
+            token = set_deadline(args.budget)
+            try:
+                return await aggregate_analytics_records(
+                    record_id="closed_conversations", timezone="UTC", period_filter={"_type": "Preset"},
+                    filters=[{"attribute": "channel", "values": ["email"]}],
+                    group_by=["agent_id"], aggregations=["count"])
+            finally:
+                reset_deadline(token)
+
+        start = time.perf_counter()
+        try:
+            result = asyncio.run(scan())
+            error = None
+        except Exception as e:
+            result, error = {}, f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+
+    results = [
+        ("returned", error is None, error or f"returned after {elapsed:.2f}s"),
+        ("records", result.get("records_scanned") == args.records,
+         f"{result.get('records_scanned')}/{args.records} records aggregated"),
+        ("partial", bool(result.get("partial") and result.get("timed_out")),
+         f"partial={result.get('partial')} timed_out={result.get('timed_out')}"),
+        ("budget", elapsed < args.budget + 1, f"{elapsed:.2f}s for a {args.budget}s budget"),
+    ]
+    for name, passed, detail in results:
+        print(f"{'ok' if passed else 'FAIL':<5} {name:<9} {detail}")
+    if not all(passed for _, passed, _ in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
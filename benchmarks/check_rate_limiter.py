@@ -0,0 +1,108 @@
+"""
+Check: the rate limiter's lanes, settings and counters.
+
+- lanes: reads, including `POST /analytics/...` queries and `POST /search/conversations`,
+  get the interactive lane (priority_for); writes get the bulk lane
+- settings: a malformed DIXA_RATE_LIMIT, DIXA_RATE_BURST or DIXA_MAX_RETRIES leaves
+  `import dixa_api` working and fails the client with an error naming the variable
+- retries: `--threads` threads retrying 429 responses at once count every retry
+
+Exits non-zero if a check fails.
+
+    python benchmarks/check_rate_limiter.py --threads 16 --retries 50
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BASE_URL = "https://dev.dixa.io/v1"
+
+LANES = [
+    ("GET", "/agents", "interactive"),
+    ("POST", "/analytics/metrics", "interactive"),
+    ("POST", "/search/conversations", "interactive"),
+    ("POST", "/conversations/1/notes", "bulk"),
+    ("PATCH", "/endusers/1", "bulk"),
+    ("DELETE", "/tags/1", "bulk"),
+]
+
+# Imports the package with the setting, then creates a client
+_SETTING_PROBE = """
+import dixa_api
+try:
+    dixa_api.DixaClient(api_key="check-key")
+except ValueError as e:
+    print(e)
+"""
+
+
+def check_lanes() -> Tuple[bool, str]:
+    from dixa_api.ratelimit import priority_for
+    wrong = [f"{method} {path} -> {priority_for(method, BASE_URL + path)}"
+             for method, path, lane in LANES if priority_for(method, BASE_URL + path) != lane]
+    return not wrong, "; ".join(wrong) or f"{len(LANES)} requests in the expected lane"
+
+
+def check_settings() -> Tuple[bool, str]:
+    failures = []
+    for name in ("DIXA_RATE_LIMIT", "DIXA_RATE_BURST", "DIXA_MAX_RETRIES"):
+        env = {**os.environ, name: "ten"}
+        probe = subprocess.run([sys.executable, "-c", _SETTING_PROBE], cwd=ROOT, env=env,
+                               capture_output=True, text=True)
+        if probe.returncode != 0 or name not in probe.stdout:
+            failures.append(f"{name}: {(probe.stdout + probe.stderr).strip().splitlines()[-1:]}")
+    return not failures, "; ".join(failures) or "malformed settings are reported by name, not at import"
+
+
+def check_retries(threads: int, retries: int) -> Tuple[bool, str]:
+    from dixa_api.ratelimit import RequestScheduler, TokenBucket
+
+    class Response:
+        def __init__(self, status_code: int):
+            self.status_code = status_code
+            self.headers = {"Retry-After": "0"}
+
+        def close(self) -> None:
+            pass
+
+    bucket = TokenBucket(rate=1e9, capacity=1e6)
+    scheduler = RequestScheduler(bucket, max_retries=retries)
+
+    def one(_: int) -> None:
+        responses = iter([Response(429)] * retries + [Response(200)])
+        scheduler.execute("GET", BASE_URL + "/agents", lambda: next(responses))
+
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(one, range(threads)))
+    expected = threads * retries
+    counted = bucket.snapshot()["retries"]
+    return counted == expected, f"{counted}/{expected} retries counted"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rate limiter lanes, settings and retry counters")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--retries", type=int, default=50)
+    args = parser.parse_args()
+
+    results = [
+        ("lanes", *check_lanes()),
+        ("settings", *check_settings()),
+        ("retries", *check_retries(args.threads, args.retries)),
+    ]
+    for name, passed, detail in results:
+        print(f"{'ok' if passed else 'FAIL':<5} {name:<9} {detail}")
+    if not all(passed for _, passed, _ in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
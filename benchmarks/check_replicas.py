@@ -0,0 +1,248 @@
+"""
+Check: stateless streamable HTTP across several server replicas behind an L4 balancer.
+
+Starts the stub Dixa API, `--replicas` servers (`server.py --http PORT --stateless`,
+sharing one DIXA_CURSOR_SECRET) and a round-robin TCP balancer in front of them that
+hands every new connection to the next replica. Every MCP request below is sent on
+a fresh connection, so consecutive requests land on different replicas:
+
+- handshake: initialize and tools/list succeed without an MCP session
+- auth: `--calls` tool calls from `--concurrency` threads, alternating two API keys,
+  each reach the stub API with the key of their own request
+- pagination: list_end_users is paged to the end by passing each page's cursor back
+  as page_key, and returns every item once, in order
+- cursors: a cursor is rejected with another API key, or when altered
+
+Exits non-zero if a check fails.
+
+    python benchmarks/check_replicas.py --replicas 3 --calls 60 --concurrency 6
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import secrets
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_http_auth import free_port, wait_for_port  # noqa: E402
+from benchmarks.stub_dixa import StubDixaHandler, StubDixaServer  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+KEYS = ("replica-key-a", "replica-key-b")
+PAGE_LIMIT = 40
+
+
+class EchoAuthHandler(StubDixaHandler):
+    """Stub handler that echoes the request's Authorization header as `caller`."""
+
+    def _payload(self) -> Dict[str, Any]:
+        payload = super()._payload()
+        payload["caller"] = self.headers.get("Authorization")
+        return payload
+
+
+class RoundRobinBalancer:
+    """TCP (L4) balancer handing each new connection to the next replica, in a background thread."""
+
+    def __init__(self, ports: List[int]):
+        self.ports = ports
+        self.connections = [0] * len(ports)
+        self.port = 0
+        self._next = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop = asyncio.new_event_loop()
+
+    @staticmethod
+    async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        index = self._next % len(self.ports)
+        self._next += 1
+        self.connections[index] += 1
+        upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", self.ports[index])
+        try:
+            await asyncio.gather(self._pipe(reader, upstream_writer), self._pipe(upstream_reader, writer))
+        except asyncio.CancelledError:
+            # Shutting down (see _close)
+            pass
+
+    def __enter__(self) -> "RoundRobinBalancer":
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self._server = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self._handle, "127.0.0.1", 0), self._loop).result()
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def _close(self) -> None:
+        self._server.close()
+        # Connections the replicas still keep alive
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        asyncio.run_coroutine_threadsafe(self._close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+def start_replicas(count: int, stub_url: str, secret: str, verbose: bool) -> Tuple[List[int], List[subprocess.Popen]]:
+    env = {**os.environ, "DIXA_API_BASE_URL": stub_url, "DIXA_CURSOR_SECRET": secret}
+    for name in ("DIXA_API_KEY", "DIXA_MCP_WORKERS", "DIXA_SHARED_CACHE"):
+        env.pop(name, None)
+    output = None if verbose else subprocess.DEVNULL
+    ports = [free_port() for _ in range(count)]
+    children = [subprocess.Popen([sys.executable, "server.py", "--http", str(port), "--stateless"],
+                                 cwd=ROOT, env=env, stdout=output, stderr=output)
+                for port in ports]
+    for port in ports:
+        wait_for_port(port)
+    return ports, children
+
+
+class Client:
+    """MCP over stateless streamable HTTP, one new connection per request."""
+
+    def __init__(self, url: str, api_key: str):
+        self.url = url
+        self.headers = {"Accept": "application/json, text/event-stream",
+                        "Authorization": f"Bearer {api_key}", "mcp-protocol-version": "2025-06-18"}
+        self._id = 0
+
+    def rpc(self, method: str, params: Dict[str, Any]) -> Tuple[requests.Response, Dict[str, Any]]:
+        self._id += 1
+        response = requests.post(self.url, headers=self.headers,
+                                 json={"jsonrpc": "2.0", "id": self._id, "method": method, "params": params})
+        return response, response.json() if response.status_code == 200 else {}
+
+    def call(self, tool: str, **arguments: Any) -> Tuple[bool, str]:
+        """Call a tool; return (is_error, text content)."""
+        _, result = self.rpc("tools/call", {"name": tool, "arguments": arguments})
+        if "result" not in result:
+            return True, json.dumps(result.get("error", result))
+        return bool(result["result"].get("isError")), result["result"]["content"][0]["text"]
+
+
+def check_handshake(url: str) -> Tuple[bool, str]:
+    client = Client(url, KEYS[0])
+    response, result = client.rpc("initialize", {
+        "protocolVersion": "2025-06-18", "capabilities": {},
+        "clientInfo": {"name": "check_replicas", "version": "1"},
+    })
+    if "result" not in result:
+        return False, f"initialize failed: HTTP {response.status_code}"
+    if "mcp-session-id" in response.headers:
+        return False, "initialize returned an mcp-session-id"
+    _, listed = client.rpc("tools/list", {})
+    count = len(listed.get("result", {}).get("tools", []))
+    return count > 0, f"{count} tools listed without a session"
+
+
+def check_auth(url: str, calls: int, concurrency: int) -> Tuple[bool, str]:
+    def one(index: int) -> bool:
+        api_key = KEYS[index % len(KEYS)]
+        is_error, text = Client(url, api_key).call("fetch_conversation_by_id", conversation_id=str(index))
+        return not is_error and json.loads(text).get("caller") == api_key
+
+    with ThreadPoolExecutor(concurrency) as executor:
+        correct = sum(executor.map(one, range(calls)))
+    return correct == calls, f"{correct}/{calls} calls reached the API with their own key"
+
+
+def _next_cursor(page: Dict[str, Any]) -> Optional[str]:
+    next_url = (page.get("meta") or {}).get("next")
+    return parse_qs(urlparse(next_url).query)["pageKey"][0] if next_url else None
+
+
+def check_pagination(url: str, total_items: int) -> Tuple[bool, str, Optional[str]]:
+    client = Client(url, KEYS[0])
+    ids: List[str] = []
+    cursor: Optional[str] = None
+    first_cursor: Optional[str] = None
+    pages = 0
+    while True:
+        arguments: Dict[str, Any] = {"page_limit": PAGE_LIMIT}
+        if cursor:
+            arguments["page_key"] = cursor
+        is_error, text = client.call("list_end_users", **arguments)
+        if is_error:
+            return False, f"page {pages + 1} failed: {text[:120]}", first_cursor
+        page = json.loads(text)
+        pages += 1
+        ids.extend(item["id"] for item in page["data"])
+        cursor = _next_cursor(page)
+        if cursor is None:
+            break
+        if not cursor.startswith("dxc1."):
+            return False, f"page {pages} returned a raw page key {cursor!r}", first_cursor
+        first_cursor = first_cursor or cursor
+    expected = [str(i) for i in range(total_items)]
+    return ids == expected, f"{len(ids)}/{total_items} items in {pages} pages", first_cursor
+
+
+def check_cursors(url: str, cursor: Optional[str]) -> Tuple[bool, str]:
+    if cursor is None:
+        return False, "no cursor to check"
+    other_key, _ = Client(url, KEYS[1]).call("list_end_users", page_limit=PAGE_LIMIT, page_key=cursor)
+    altered = cursor[:-2] + ("AA" if cursor[-2:] != "AA" else "BB")
+    tampered, _ = Client(url, KEYS[0]).call("list_end_users", page_limit=PAGE_LIMIT, page_key=altered)
+    return other_key and tampered, (f"other API key {'rejected' if other_key else 'ACCEPTED'}, "
+                                    f"altered cursor {'rejected' if tampered else 'ACCEPTED'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stateless HTTP across replicas behind a round-robin balancer")
+    parser.add_argument("--replicas", type=int, default=3)
+    parser.add_argument("--calls", type=int, default=60)
+    parser.add_argument("--concurrency", type=int, default=6)
+    parser.add_argument("--verbose", action="store_true", help="show the replicas' output")
+    args = parser.parse_args()
+
+    with StubDixaServer(handler=EchoAuthHandler) as stub:
+        ports, children = start_replicas(args.replicas, stub.base_url, secrets.token_urlsafe(32), args.verbose)
+        try:
+            with RoundRobinBalancer(ports) as balancer:
+                url = f"http://127.0.0.1:{balancer.port}/mcp"
+                results = [("handshake", *check_handshake(url)),
+                           ("auth", *check_auth(url, args.calls, args.concurrency))]
+                passed, detail, cursor = check_pagination(url, stub.httpd.total_items)
+                results.append(("pagination", passed, detail))
+                results.append(("cursors", *check_cursors(url, cursor)))
+                connections = balancer.connections
+        finally:
+            for child in children:
+                child.terminate()
+            for child in children:
+                child.wait()
+
+    for name, passed, detail in results:
+        print(f"{'ok' if passed else 'FAIL':<5} {name:<11} {detail}")
+    print(f"connections per replica: {connections}")
+    if not all(passed for _, passed, _ in results) or not all(connections):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Check: the response cache keeps raw and decoded results of the same request apart.
+
+Against the stub Dixa API, requests the same cached analytics endpoint first with the
+`raw` option (an undecoded RawJson body, as passthrough tools use it) and then decoded.
+The decoded call must get a dict from its own upstream request rather than the cached
+RawJson, and a repeat of each must be served from the cache with the same type.
+
+Exits non-zero if a check fails.
+
+    python benchmarks/check_response_cache.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_dixa import StubDixaServer  # noqa: E402
+
+PATH = "/analytics/filter/agent_id"
+CACHE = "analytics_filter_values"
+
+
+def main() -> None:
+    with StubDixaServer() as stub:
+        os.environ["DIXA_API_BASE_URL"] = stub.base_url
+        os.environ.pop("DIXA_SHARED_CACHE", None)
+        from dixa_api import DixaClient
+        from dixa_api.codec import RawJson
+
+        client = DixaClient(api_key="check-key")
+        raw = client._request("GET", PATH, cache=CACHE, raw=True)
+        decoded = client._request("GET", PATH, cache=CACHE)
+        upstream = stub.request_count
+        raw_again = client._request("GET", PATH, cache=CACHE, raw=True)
+        decoded_again = client._request("GET", PATH, cache=CACHE)
+        cached = stub.request_count == upstream
+        client.close()
+
+    results = [
+        ("raw", isinstance(raw, RawJson) and isinstance(raw_again, RawJson),
+         f"raw calls returned {type(raw).__name__}, then {type(raw_again).__name__}"),
+        ("decoded", isinstance(decoded, dict) and isinstance(decoded_again, dict),
+         f"decoded calls returned {type(decoded).__name__}, then {type(decoded_again).__name__}"),
+        ("cached", upstream == 2 and cached,
+         f"{upstream} upstream requests for the first two calls, repeats {'cached' if cached else 'NOT cached'}"),
+    ]
+    for name, passed, detail in results:
+        print(f"{'ok' if passed else 'FAIL':<5} {name:<8} {detail}")
+    if not all(passed for _, passed, _ in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Minimal local stand-in for the Dixa API, used by the benchmarks.
+
+Serves canned JSON for any path under /v1 with a configurable per-request latency,
+so client-side behaviour (pooling, concurrency, decoding) can be measured without
+touching the real API. List endpoints (/endusers, /agents, /analytics/records, ...)
+are paginated with `meta.next` links over `total_items` synthetic items.
+
+Run standalone:
+    python benchmarks/stub_dixa.py --port 8765 --latency 0.2
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+PAGINATED_PATHS = ("agents", "endusers", "knowledge", "search", "analytics")
+
+
+class StubDixaHandler(BaseHTTPRequestHandler):
+    """Answers every request with a small JSON document after `server.latency` seconds."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _page(self, path: str, query: Dict[str, Any]) -> Dict[str, Any]:
+        start = int(query.get("pageKey", ["0"])[0])
+        limit = int(query.get("pageLimit", [str(self.server.page_size)])[0])
+        end = min(start + limit, self.server.total_items)
+        page: Dict[str, Any] = {
+            "data": [{"id": str(i), "name": f"item-{i}", "value": i % 97} for i in range(start, end)]
+        }
+        if end < self.server.total_items:
+            page["meta"] = {"next": f"{path}?pageKey={end}"}
+        return page
+
+    def _payload(self) -> Dict[str, Any]:
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        if len(parts) >= 3 and parts[1] == "conversations":
+            return {"data": {"id": parts[2], "status": "Closed", "channel": "Email"}}
+        if len(parts) >= 2 and parts[1] in PAGINATED_PATHS:
+            return self._page(url.path, parse_qs(url.query))
+        return {"data": []}
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.server.request_count += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        body = json.dumps(self._payload()).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients that gave up (e.g. on a timeout) before the response was written
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StubDixaServer:
+    """Threaded stub server; use as a context manager to run it in the background."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 total_items: int = 250, page_size: int = 100, handler: Optional[type] = None):
+        self.httpd = _Server((host, port), handler or StubDixaHandler)
+        self.httpd.latency = latency
+        self.httpd.total_items = total_items
+        self.httpd.page_size = page_size
+        self.httpd.request_count = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def request_count(self) -> int:
+        return self.httpd.request_count
+
+    def __enter__(self) -> "StubDixaServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before answering")
+    args = parser.parse_args()
+    server = StubDixaServer(port=args.port, latency=args.latency)
+    print(f"Stub Dixa API listening on {server.base_url}")
+    server.httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,9 @@ for better organization and maintainability.
 """
 
 from dixa_api.client import DixaClient
+from dixa_api.async_client import AsyncDixaClient, attach_async_methods
+from dixa_api.cache import response_cache
+from dixa_api.ratelimit import rate_limit_snapshot
 
 # Import all method modules
 from dixa_api import organization
@@ -27,6 +30,7 @@ DixaClient.get_organization = organization.get_organization
 # Agents
 DixaClient.get_agent = agents.get_agent
 DixaClient.get_agents = agents.get_agents
+DixaClient.iter_agents = agents.iter_agents
 DixaClient.get_agents_presence = agents.get_agents_presence
 DixaClient.get_agent_teams = agents.get_agent_teams
 DixaClient.create_agent = agents.create_agent
@@ -62,6 +66,7 @@ DixaClient.get_conversation_ratings = conversations.get_conversation_ratings
 DixaClient.patch_conversation_custom_attributes = conversations.patch_conversation_custom_attributes
 DixaClient.update_conversation_reopen = conversations.update_conversation_reopen
 DixaClient.post_search_conversations = conversations.post_search_conversations
+DixaClient.iter_search_conversations = conversations.iter_search_conversations
 DixaClient.update_conversation_tag = conversations.update_conversation_tag
 DixaClient.delete_conversation_tag = conversations.delete_conversation_tag
 DixaClient.update_conversation_followup = conversations.update_conversation_followup
@@ -73,6 +78,7 @@ DixaClient.patch_end_user_custom_attributes = custom_attributes.patch_end_user_c
 
 # Users (End Users)
 DixaClient.get_end_users = users.get_end_users
+DixaClient.iter_end_users = users.iter_end_users
 DixaClient.get_end_user = users.get_end_user
 DixaClient.create_end_user = users.create_end_user
 DixaClient.create_end_users_bulk = users.create_end_users_bulk
@@ -81,15 +87,18 @@ DixaClient.patch_end_users_bulk = users.patch_end_users_bulk
 DixaClient.update_end_user = users.update_end_user
 DixaClient.update_end_users_bulk = users.update_end_users_bulk
 DixaClient.get_end_user_conversations = users.get_end_user_conversations
+DixaClient.iter_end_user_conversations = users.iter_end_user_conversations
 DixaClient.patch_end_user_anonymize = users.patch_end_user_anonymize
 
 # Knowledge
 DixaClient.get_knowledge_articles = knowledge.get_knowledge_articles
+DixaClient.iter_knowledge_articles = knowledge.iter_knowledge_articles
 DixaClient.get_knowledge_article = knowledge.get_knowledge_article
 DixaClient.create_knowledge_article = knowledge.create_knowledge_article
 DixaClient.patch_knowledge_article = knowledge.patch_knowledge_article
 DixaClient.delete_knowledge_article = knowledge.delete_knowledge_article
 DixaClient.get_knowledge_categories = knowledge.get_knowledge_categories
+DixaClient.iter_knowledge_categories = knowledge.iter_knowledge_categories
 DixaClient.create_knowledge_category = knowledge.create_knowledge_category
 
 # Queues
@@ -116,6 +125,7 @@ DixaClient.get_teams = teams.get_teams
 DixaClient.get_team = teams.get_team
 DixaClient.get_team_agents = teams.get_team_agents
 DixaClient.get_team_presence = teams.get_team_presence
+DixaClient.iter_team_presence = teams.iter_team_presence
 DixaClient.create_team = teams.create_team
 DixaClient.patch_team_add_agents = teams.patch_team_add_agents
 DixaClient.delete_team_remove_agents = teams.delete_team_remove_agents
@@ -123,12 +133,17 @@ DixaClient.delete_team = teams.delete_team
 
 # Analytics
 DixaClient.get_analytics_filter_values = analytics.get_analytics_filter_values
+DixaClient.iter_analytics_filter_values = analytics.iter_analytics_filter_values
 DixaClient.get_analytics_metrics_catalogue = analytics.get_analytics_metrics_catalogue
 DixaClient.get_analytics_metric_description = analytics.get_analytics_metric_description
 DixaClient.post_analytics_metric_data = analytics.post_analytics_metric_data
 DixaClient.get_analytics_records_catalogue = analytics.get_analytics_records_catalogue
 DixaClient.get_analytics_record_description = analytics.get_analytics_record_description
 DixaClient.post_analytics_metric_records_data = analytics.post_analytics_metric_records_data
+DixaClient.iter_analytics_metric_records = analytics.iter_analytics_metric_records
 
-__all__ = ['DixaClient']
+# Mirror all endpoints on the asyncio client
+attach_async_methods()
+
+__all__ = ['DixaClient', 'AsyncDixaClient', 'response_cache', 'rate_limit_snapshot']
 
@@ -2,9 +2,8 @@
 Agents-related API methods for DixaClient.
 """
 
-import requests
-from typing import Dict, Any, Optional, List, Literal
-from requests.exceptions import RequestException, HTTPError
+from typing import Dict, Any, Optional, List, Literal, Iterator
+from dixa_api.pagination import iterate_items
 
 def get_agent(self, agent_id: str) -> Dict[str, Any]:
     """
@@ -36,22 +35,7 @@ def get_agent(self, agent_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/agents/{agent_id}"
-        
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/agents/{agent_id}")
     
 
 
@@ -102,7 +86,6 @@ def get_agents(
     if email and phone:
         raise ValueError("email and phone parameters are mutually exclusive. Provide only one.")
         
-    url = f"{self.base_url}/agents"
     params = {}
         
     if email:
@@ -114,23 +97,45 @@ def get_agents(
     if page_limit is not None:
         params["pageLimit"] = str(page_limit)
         
-    try:
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", "/agents", params=params)
     
 
 
+def iter_agents(
+    self,
+    email: Optional[str] = None,
+    phone: Optional[str] = None,
+    page_limit: Optional[int] = None,
+    prefetch: bool = False,
+    max_items: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all agents/admins in an organization, following pagination lazily.
+    
+    Args:
+        email: Filter by email address (mutually exclusive with phone).
+        phone: Filter by phone number (mutually exclusive with email).
+        page_limit: Maximum number of results per page.
+        prefetch: Fetch the next page in the background while the current one is consumed.
+        max_items: Stop after this many agents.
+    
+    Yields:
+        Agent dictionaries, in the same shape as the items of get_agents.
+    
+    Raises:
+        ValueError: If both email and phone are provided (mutually exclusive).
+        HTTPError: If the API returns an HTTP error status (4xx, 5xx).
+        RequestException: If there's an error making the request.
+    """
+    if email and phone:
+        raise ValueError("email and phone parameters are mutually exclusive. Provide only one.")
+    return iterate_items(
+        lambda page_key: self.get_agents(email=email, phone=phone, page_key=page_key, page_limit=page_limit),
+        prefetch=prefetch,
+        max_items=max_items
+    )
+
+
 def get_agents_presence(self) -> list:
     """
     Get (list) the presence status for all agents/admins in an organization.
@@ -153,22 +158,7 @@ def get_agents_presence(self) -> list:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/agents/presence"
-        
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", "/agents/presence", hedge=True)
     
 
 
@@ -194,22 +184,7 @@ def get_agent_teams(self, agent_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/agents/{agent_id}/teams"
-        
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/agents/{agent_id}/teams")
     
 
 
@@ -262,8 +237,6 @@ def create_agent(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/agents"
-        
     payload = {
         "displayName": display_name,
         "email": email
@@ -283,26 +256,8 @@ def create_agent(
         payload["middleNames"] = middle_names
     if avatar_url:
         payload["avatarUrl"] = avatar_url
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", "/agents", json=payload)
     
 
 
@@ -353,8 +308,6 @@ def patch_agent(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/agents/{agent_id}"
-        
     payload = {}
         
     if display_name is not None:
@@ -371,26 +324,8 @@ def patch_agent(
         payload["middleNames"] = middle_names
     if avatar_url is not None:
         payload["avatarUrl"] = avatar_url
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.patch(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("PATCH", f"/agents/{agent_id}", json=payload)
     
 
 
@@ -443,8 +378,6 @@ def update_agent(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/agents/{agent_id}"
-        
     payload = {
         "displayName": display_name
     }
@@ -463,26 +396,8 @@ def update_agent(
         payload["middleNames"] = middle_names
     if avatar_url is not None:
         payload["avatarUrl"] = avatar_url
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.put(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("PUT", f"/agents/{agent_id}", json=payload)
     
 
 
@@ -518,37 +433,16 @@ def update_agent_working_channel(
             f"Invalid channel value: '{channel}'. "
             f"Accepted values are: {', '.join(accepted_channels)}"
         )
-        
-    url = f"{self.base_url}/agents/{agent_id}/presence/working-channel"
-        
+
     payload = {
         "channel": channel,
         "working": working
     }
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.put(url, json=payload, headers=headers)
-        response.raise_for_status()
-        # 204 No Content means success
-        if response.status_code == 204:
-            return {"success": True, "message": "Agent working channel updated successfully"}
-        # If there's content, return it
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request(
+        "PUT",
+        f"/agents/{agent_id}/presence/working-channel",
+        json=payload,
+        success_message="Agent working channel updated successfully"
+    )
     
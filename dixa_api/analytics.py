@@ -2,9 +2,9 @@
 Analytics-related API methods for DixaClient.
 """
 
-import requests
-from typing import Dict, Any, Optional, List
-from requests.exceptions import RequestException, HTTPError
+from typing import Dict, Any, Optional, List, Iterator, Union
+from dixa_api.pagination import iterate_items
+from dixa_api.streaming import StreamedPage
 
 
 def get_analytics_filter_values(
@@ -30,27 +30,45 @@ def get_analytics_filter_values(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/analytics/filter/{filter_attribute}"
     params = {}
     if page_key:
         params["pageKey"] = page_key
     if page_limit is not None:
         params["pageLimit"] = page_limit
 
-    try:
-        response = requests.get(url, headers=self.headers, params=params if params else None)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/analytics/filter/{filter_attribute}", params=params, cache="analytics_filter_values")
+
+
+def iter_analytics_filter_values(
+    self,
+    filter_attribute: str,
+    page_limit: Optional[int] = None,
+    prefetch: bool = False,
+    max_items: Optional[int] = None
+) -> Iterator[Any]:
+    """
+    Iterate over all possible values of a filter attribute, following pagination lazily.
+
+    Args:
+        filter_attribute: The filter attribute name (required).
+        page_limit: Optional limit for the number of results per page.
+        prefetch: Fetch the next page in the background while the current one is consumed.
+        max_items: Stop after this many values.
+
+    Yields:
+        Filter values, in the same shape as the items of get_analytics_filter_values.
+
+    Raises:
+        HTTPError: If the API returns an HTTP error status (4xx, 5xx).
+        RequestException: If there's an error making the request.
+    """
+    return iterate_items(
+        lambda page_key: self.get_analytics_filter_values(
+            filter_attribute=filter_attribute, page_key=page_key, page_limit=page_limit
+        ),
+        prefetch=prefetch,
+        max_items=max_items
+    )
 
 
 def get_analytics_metrics_catalogue(
@@ -72,27 +90,13 @@ def get_analytics_metrics_catalogue(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/analytics/metrics"
     params = {}
     if page_key:
         params["pageKey"] = page_key
     if page_limit is not None:
         params["pageLimit"] = page_limit
 
-    try:
-        response = requests.get(url, headers=self.headers, params=params if params else None)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", "/analytics/metrics", params=params, cache="analytics_metrics_catalogue")
 
 
 def get_analytics_metric_description(self, metric_id: str) -> Dict[str, Any]:
@@ -109,21 +113,7 @@ def get_analytics_metric_description(self, metric_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/analytics/metrics/{metric_id}"
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/analytics/metrics/{metric_id}", cache="analytics_metric_description")
 
 
 def post_analytics_metric_data(self, request: Dict[str, Any]) -> Dict[str, Any]:
@@ -146,22 +136,7 @@ def post_analytics_metric_data(self, request: Dict[str, Any]) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/analytics/metrics"
-    headers = {"Content-Type": "application/json", **self.headers}
-    try:
-        response = requests.post(url, json=request, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("POST", "/analytics/metrics", json=request)
 
 
 def get_analytics_records_catalogue(
@@ -183,27 +158,13 @@ def get_analytics_records_catalogue(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/analytics/records"
     params = {}
     if page_key:
         params["pageKey"] = page_key
     if page_limit is not None:
         params["pageLimit"] = page_limit
 
-    try:
-        response = requests.get(url, headers=self.headers, params=params if params else None)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", "/analytics/records", params=params, cache="analytics_records_catalogue")
 
 
 def get_analytics_record_description(self, record_id: str) -> Dict[str, Any]:
@@ -220,29 +181,16 @@ def get_analytics_record_description(self, record_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/analytics/records/{record_id}"
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/analytics/records/{record_id}", cache="analytics_record_description")
 
 
 def post_analytics_metric_records_data(
     self,
     request: Dict[str, Any],
     page_key: Optional[str] = None,
-    page_limit: Optional[int] = None
-) -> Dict[str, Any]:
+    page_limit: Optional[int] = None,
+    stream: bool = False
+) -> Union[Dict[str, Any], StreamedPage]:
     """
     Get data of specific metric records (unaggregated).
 
@@ -258,36 +206,61 @@ def post_analytics_metric_records_data(
             Can be used together with page_limit to change the number of results.
         page_limit: Optional limit for the number of results per page.
             Can be used with or without page_key. When used with page_key, it overrides the page size encoded in the key.
+        stream: Decode the records incrementally while the body is read (optional).
 
     Returns:
-        Dictionary containing the metric records data.
+        Dictionary containing the metric records data, or a StreamedPage yielding
+        the records one at a time when stream is True.
 
     Raises:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/analytics/records"
     params = {}
     if page_key:
         params["pageKey"] = page_key
     if page_limit is not None:
         params["pageLimit"] = page_limit
 
-    headers = {"Content-Type": "application/json", **self.headers}
-    try:
-        # Always use POST request, even when pageKey is provided
-        # The pageKey is just a query parameter, but the same payload should be sent
-        response = requests.post(url, json=request, headers=headers, params=params if params else None)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    # Always use POST request, even when pageKey is provided
+    # The pageKey is just a query parameter, but the same payload should be sent
+    if stream:
+        return self._request("POST", "/analytics/records", params=params, json=request, stream_items="data")
+    return self._request("POST", "/analytics/records", params=params, json=request)
+
+
+def iter_analytics_metric_records(
+    self,
+    request: Dict[str, Any],
+    page_limit: Optional[int] = None,
+    prefetch: bool = False,
+    max_items: Optional[int] = None,
+    stream: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all records of a metric record query (unaggregated), following pagination lazily.
+
+    Every page is requested with the same POST payload; only the pageKey query parameter changes.
 
+    Args:
+        request: The request body, as for post_analytics_metric_records_data.
+        page_limit: Optional limit for the number of results per page.
+        prefetch: Fetch the next page in the background while the current one is consumed.
+        max_items: Stop after this many records.
+        stream: Decode each page incrementally off the socket instead of buffering it.
+            Keeps memory flat for large pages; prefetch is not applied when streaming.
+
+    Yields:
+        Record dictionaries, in the same shape as the items of post_analytics_metric_records_data.
+
+    Raises:
+        HTTPError: If the API returns an HTTP error status (4xx, 5xx).
+        RequestException: If there's an error making the request.
+    """
+    return iterate_items(
+        lambda page_key: self.post_analytics_metric_records_data(
+            request=request, page_key=page_key, page_limit=page_limit, stream=stream
+        ),
+        prefetch=prefetch and not stream,
+        max_items=max_items
+    )
@@ -0,0 +1,147 @@
+"""
+Asyncio facade for DixaClient.
+
+Every endpoint attached to DixaClient is mirrored on AsyncDixaClient as a coroutine.
+The blocking request runs on a worker thread sharing the client's pooled session,
+so a slow Dixa call no longer stalls the event loop (and every other MCP session
+served by it).
+"""
+
+import asyncio
+import contextvars
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from dixa_api.client import DixaClient, DEFAULT_POOL_MAXSIZE, _env_int
+
+# Number of items pulled from a paginated iterator per worker-thread hop.
+ITER_BATCH_SIZE = 100
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared worker pool, sized to match the HTTP connection pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_env_int("DIXA_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE),
+            thread_name_prefix="dixa-api",
+        )
+    return _executor
+
+
+async def run_sync(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking callable on the shared worker pool and await its result.
+
+    The caller's context variables are copied into the worker thread so request-scoped
+    state (e.g. the client API key) is visible to the callable.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_get_executor(), call)
+
+
+def _async_method(name: str) -> Callable[..., Any]:
+    """Build a coroutine method that delegates to the DixaClient method of the same name."""
+    sync_method = getattr(DixaClient, name)
+
+    @functools.wraps(sync_method)
+    async def method(self, *args: Any, **kwargs: Any) -> Any:
+        return await run_sync(getattr(self.client, name), *args, **kwargs)
+
+    return method
+
+
+def _next_batch(iterator: Iterator[Any], size: int) -> Tuple[List[Any], Optional[Exception]]:
+    """
+    Pull up to `size` items from an iterator.
+
+    An error raised after some items were pulled is returned along with them rather
+    than raised, so those items are not lost with it.
+    """
+    batch: List[Any] = []
+    try:
+        batch.extend(itertools.islice(iterator, size))
+    except Exception as e:
+        return batch, e
+    return batch, None
+
+
+def _async_iter_method(name: str) -> Callable[..., AsyncIterator[Any]]:
+    """Build an async generator method that drains the DixaClient iterator of the same name."""
+    sync_method = getattr(DixaClient, name)
+
+    @functools.wraps(sync_method)
+    async def method(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        iterator = await run_sync(getattr(self.client, name), *args, **kwargs)
+        try:
+            while True:
+                batch, error = await run_sync(_next_batch, iterator, ITER_BATCH_SIZE)
+                for item in batch:
+                    yield item
+                # Raised once the items read before it have been consumed
+                if error is not None:
+                    raise error
+                if len(batch) < ITER_BATCH_SIZE:
+                    return
+        finally:
+            iterator.close()
+
+    return method
+
+
+class AsyncDixaClient:
+    """Asyncio client for interacting with the Dixa API."""
+
+    def __init__(self, api_key: Optional[str] = None, client: Optional[DixaClient] = None, **client_options: Any):
+        """
+        Initialize the async Dixa API client.
+
+        Args:
+            api_key: API key for authentication. If not provided, will use
+                    DIXA_API_KEY environment variable.
+            client: Existing DixaClient to wrap. Its connection pool is shared.
+            **client_options: Extra keyword arguments for DixaClient when no client is given.
+
+        Raises:
+            ValueError: If no API key is provided and DIXA_API_KEY env var is not set.
+        """
+        self.client = client or DixaClient(api_key=api_key, **client_options)
+
+    @property
+    def api_key(self) -> str:
+        return self.client.api_key
+
+    @property
+    def base_url(self) -> str:
+        return self.client.base_url
+
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """Return the state of this API key's token bucket."""
+        return self.client.rate_limit_stats()
+
+    async def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self.client.close()
+
+    async def __aenter__(self) -> "AsyncDixaClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def attach_async_methods() -> None:
+    """Mirror every public DixaClient endpoint method onto AsyncDixaClient."""
+    for name, value in list(vars(DixaClient).items()):
+        if name.startswith("_") or not callable(value) or name in ("close", "rate_limit_stats"):
+            continue
+        if name.startswith("iter_"):
+            setattr(AsyncDixaClient, name, _async_iter_method(name))
+        else:
+            setattr(AsyncDixaClient, name, _async_method(name))
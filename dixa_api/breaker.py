@@ -0,0 +1,137 @@
+"""
+Circuit breakers per Dixa endpoint family.
+
+When one Dixa subsystem degrades (e.g. analytics or conversation search), requests to it
+keep failing slowly, and callers that retry only add load. Each endpoint family ("agents",
+"analytics", "search", ...) therefore has a breaker:
+
+- closed: requests pass; consecutive failures (5xx responses, connection errors and
+  timeouts) are counted, and reaching DEFAULT_FAILURE_THRESHOLD opens the breaker.
+  Timeouts that only fired because a caller's deadline clipped them are not failures.
+- open: requests fail immediately with CircuitOpenError for DEFAULT_RESET_TIMEOUT seconds.
+- half-open: after that a single probe request is let through. If it succeeds the breaker
+  closes, and if it fails the breaker opens again.
+
+Breakers are process-wide and shared by all API keys, since an outage of a subsystem
+affects every organization alike.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from requests.exceptions import RequestException
+
+DEFAULT_FAILURE_THRESHOLD = int(os.getenv("DIXA_BREAKER_FAILURES", "5"))
+DEFAULT_RESET_TIMEOUT = float(os.getenv("DIXA_BREAKER_RESET_SECONDS", "30"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Numeric encoding of the states for the Prometheus gauge.
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(RequestException):
+    """The endpoint family is failing, so the request was rejected without being sent."""
+
+    def __init__(self, family: str, retry_after: float):
+        super().__init__(f"Circuit open for '{family}' endpoints; retry in {retry_after:.1f}s")
+        self.family = family
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    def __init__(self, family: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT):
+        self.family = family
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.times_opened = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def before_request(self) -> None:
+        """
+        Admit a request, or reject it while the breaker is open.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a probe in flight.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = time.monotonic()
+            if self.state == OPEN and now - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self.probing:
+                self.probing = True
+                return
+            self.rejected += 1
+            retry_after = max(0.0, self.opened_at + self.reset_timeout - now)
+        raise CircuitOpenError(self.family, retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; return True if it opened the breaker."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                opened = self.state != OPEN
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.probing = False
+                self.times_opened += int(opened)
+                return opened
+            return False
+
+    def release_probe(self) -> None:
+        """Let another probe through when the current one ended without a verdict."""
+        with self._lock:
+            self.probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"state": self.state, "consecutive_failures": self.failures,
+                    "times_opened": self.times_opened, "rejected": self.rejected}
+
+
+class CircuitBreakers:
+    """Lazily created breakers, one per endpoint family."""
+
+    def __init__(self) -> None:
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, family: str) -> CircuitBreaker:
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(family, CircuitBreaker(family))
+        return breaker
+
+    def state(self, family: str) -> Optional[str]:
+        """Current state of a family's breaker, or None if it has not seen a request yet."""
+        breaker = self._breakers.get(family)
+        return breaker.state if breaker is not None else None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.family: breaker.stats() for breaker in breakers}
+
+
+circuit_breakers = CircuitBreakers()
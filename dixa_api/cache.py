@@ -0,0 +1,224 @@
+"""
+In-process response caches for near-static Dixa API data.
+
+`response_cache` holds analytics discovery responses keyed by (API key fingerprint,
+endpoint, parameters, raw) for a per-endpoint TTL. `revalidation_cache` holds reference data
+(tags, queues, teams, ...) together with its ETag / Last-Modified validators, so the
+request pipeline can revalidate it with conditional requests. Both evict entries
+least-recently-used first once the entry count or the approximate memory bound is exceeded.
+
+With DIXA_SHARED_CACHE set, both caches are backed by a SQLite database shared by the
+server processes on the host (see dixa_api.shared_cache).
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from dixa_api.codec import codec
+from dixa_api.shared_cache import SharedCache, shared_cache_from_env
+
+# Time-to-live in seconds per cached endpoint. Endpoints not listed are not cached.
+DEFAULT_TTLS: Dict[str, float] = {
+    "analytics_metrics_catalogue": 3600,
+    "analytics_metric_description": 3600,
+    "analytics_records_catalogue": 3600,
+    "analytics_record_description": 3600,
+    "analytics_filter_values": 600,
+}
+
+# Reference data served with conditional requests, per endpoint family. The TTL applies
+# to responses without ETag / Last-Modified validators; responses with validators are
+# kept for VALIDATED_TTL but revalidated on every use.
+REVALIDATE_TTLS: Dict[str, float] = {
+    "tags": 300,
+    "queues": 300,
+    "teams": 300,
+    "custom-attributes": 300,
+    "business-hours": 300,
+    "contact-endpoints": 300,
+}
+VALIDATED_TTL = 24 * 3600
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# With a shared backend, entries are kept in-process for at most this many seconds, which
+# bounds how long another process's invalidation takes to be seen.
+SHARED_LOCAL_TTL = float(os.getenv("DIXA_SHARED_CACHE_LOCAL_TTL", "5"))
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a JSON-compatible value by its encoded length."""
+    try:
+        return len(codec.dumps(value))
+    except (TypeError, ValueError):
+        return 1024
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry and an approximate memory bound."""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        name: str = "",
+        shared: Optional[SharedCache] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttls: Time-to-live in seconds per endpoint name. Defaults to DEFAULT_TTLS.
+            max_entries: Maximum number of cached entries.
+            max_bytes: Approximate upper bound on the size of all cached values.
+            name: Name of the cache in the shared backend.
+            shared: Backend shared with other processes; misses are looked up there and
+                    every entry stored is also written there.
+        """
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (expires_at, size, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.name = name
+        self.shared = shared
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the TTL configured for an endpoint (0 means not cached)."""
+        return self.ttls.get(endpoint, 0)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, size, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._remove(key)
+            if self.shared is None:
+                self.misses += 1
+                return default
+        # Looked up outside the lock, so other threads aren't held up by the database
+        found = self.shared.get(self.name, key)
+        if found is None:
+            with self._lock:
+                self.misses += 1
+            return default
+        value, remaining, size = found
+        self._store(key, value, min(remaining, SHARED_LOCAL_TTL), size)
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float, size: Optional[int] = None) -> None:
+        """
+        Store a value for `ttl` seconds.
+
+        Args:
+            key: Cache key.
+            value: Value to store. Callers must treat cached values as read-only.
+            ttl: Time-to-live in seconds.
+            size: Size of the value in bytes, estimated from its JSON encoding if omitted.
+        """
+        if ttl <= 0:
+            return
+        if self.shared is not None:
+            self.shared.set(self.name, key, value, ttl)
+            ttl = min(ttl, SHARED_LOCAL_TTL)
+        if size is None:
+            size = _estimate_size(value)
+        self._store(key, value, ttl, size)
+
+    def _store(self, key: Hashable, value: Any, ttl: float, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, match: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key satisfies `match` and return how many were dropped."""
+        with self._lock:
+            keys = [key for key in self._entries if match(key)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def invalidate_prefix(self, prefix: Tuple[Any, ...]) -> int:
+        """
+        Drop every entry whose key tuple starts with the items of `prefix`, here and in
+        the shared backend, and return how many were dropped in this process.
+        """
+        if self.shared is not None:
+            self.shared.invalidate_prefix(self.name, prefix)
+        length = len(prefix)
+        return self.invalidate(lambda key: isinstance(key, tuple) and key[:length] == prefix)
+
+    def clear(self) -> None:
+        """Drop all entries, including the shared backend's (counters are kept)."""
+        if self.shared is not None:
+            self.shared.clear(self.name)
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+        if self.shared is not None:
+            stats["shared"] = self.shared.stats()
+        return stats
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+_shared_backend = shared_cache_from_env()
+
+# Shared by all clients; entries are partitioned by API key fingerprint.
+response_cache = TTLCache(
+    max_entries=int(os.getenv("DIXA_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+    max_bytes=int(os.getenv("DIXA_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+    name="response",
+    shared=_shared_backend,
+)
+
+# Reference data with validators; keyed by (fingerprint, family, path, parameters, raw).
+revalidation_cache = TTLCache(
+    ttls=REVALIDATE_TTLS,
+    max_entries=int(os.getenv("DIXA_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+    max_bytes=int(os.getenv("DIXA_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+    name="revalidation",
+    shared=_shared_backend,
+)
@@ -5,21 +5,84 @@ This module provides the core client class that all API methods are attached to.
 """
 
 import os
-from typing import Optional
+from typing import Any, Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, HTTPError
 
+from dixa_api.fingerprint import key_fingerprint
+from dixa_api.pipeline import ApiRequest, DEFAULT_STAGES, Stage, build_pipeline
+from dixa_api.ratelimit import RequestScheduler, bucket_for
+
+# Connection pool defaults. All requests go to a single host, so one pool with
+# enough slots for concurrent tool calls is what matters.
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 32
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _enable_http2() -> bool:
+    """
+    Enable HTTP/2 for urllib3 connections if the installed stack supports it.
+
+    Requires urllib3 >= 2.3 and the ``h2`` package. The injection is process-wide
+    and experimental in urllib3, so it is only done when explicitly requested.
+
+    Returns:
+        True if HTTP/2 was enabled, False otherwise.
+    """
+    try:
+        import h2  # noqa: F401
+        from urllib3 import http2
+    except ImportError:
+        return False
+    http2.inject_into_urllib3()
+    return True
+
 
 class DixaClient:
     """Client for interacting with the Dixa API."""
-    
-    def __init__(self, api_key: Optional[str] = None):
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        http2: Optional[bool] = None,
+        max_retries: Optional[int] = None
+    ):
         """
         Initialize the Dixa API client.
-        
+
+        The client owns a pooled ``requests.Session`` so that consecutive calls reuse
+        keep-alive connections instead of paying a new TCP+TLS handshake each time.
+        Every endpoint goes through the request pipeline (see dixa_api.pipeline), which
+        paces requests by a token bucket shared by all clients using the same API key
+        and retries HTTP 429 responses with backoff.
+
         Args:
             api_key: API key for authentication. If not provided, will use
                     DIXA_API_KEY environment variable.
-        
+            pool_connections: Number of connection pools to cache. Defaults to
+                    DIXA_HTTP_POOL_CONNECTIONS or 4.
+            pool_maxsize: Maximum number of connections kept alive per pool. Defaults to
+                    DIXA_HTTP_POOL_MAXSIZE or 32.
+            http2: Enable HTTP/2 when urllib3 and h2 support it. Defaults to the
+                    DIXA_HTTP2 environment variable ("1"/"true").
+            max_retries: Maximum retries of a rate-limited (HTTP 429) request. Defaults to
+                    DIXA_MAX_RETRIES or 4.
+
         Raises:
             ValueError: If no API key is provided and DIXA_API_KEY env var is not set.
         """
@@ -29,6 +92,88 @@ class DixaClient:
                 "API key is required. Either pass it as a parameter or set "
                 "DIXA_API_KEY environment variable."
             )
-        self.base_url = "https://dev.dixa.io/v1"
+        self.base_url = os.getenv("DIXA_API_BASE_URL", "https://dev.dixa.io/v1").rstrip("/")
+        # Precomputed once; endpoint calls reuse these dicts instead of merging per call
+        self.key_fingerprint = key_fingerprint(self.api_key)
         self.headers = {"Authorization": self.api_key}
+        self.json_headers = {"Content-Type": "application/json", **self.headers}
+
+        if http2 is None:
+            http2 = os.getenv("DIXA_HTTP2", "").lower() in ("1", "true", "yes")
+        self.http2 = _enable_http2() if http2 else False
+
+        self.scheduler = RequestScheduler(bucket_for(self.api_key))
+        if max_retries is not None:
+            self.scheduler.max_retries = max_retries
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections or _env_int("DIXA_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS),
+            pool_maxsize=pool_maxsize or _env_int("DIXA_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Connection": "keep-alive"})
+
+        self.stages = list(DEFAULT_STAGES)
+        self._pipeline = build_pipeline(self.stages)
+
+    def add_stage(self, stage: Stage, before: Optional[Stage] = None) -> None:
+        """
+        Add a stage to this client's request pipeline.
+
+        Args:
+            stage: Callable ``stage(request, call_next)``, see dixa_api.pipeline.
+            before: Existing stage to insert in front of. Appended (innermost) if not given.
+        """
+        index = self.stages.index(before) if before is not None else len(self.stages)
+        self.stages.insert(index, stage)
+        self._pipeline = build_pipeline(self.stages)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        cache: Optional[str] = None,
+        success_message: Optional[str] = None,
+        **options: Any
+    ) -> Any:
+        """
+        Send a request to the Dixa API through the request pipeline.
+
+        Args:
+            method: HTTP method.
+            path: Path relative to the API base URL, e.g. "/tags".
+            params: Query parameters (omitted when empty).
+            json: JSON request body.
+            cache: Endpoint name for `response_cache`; GET results are cached under its TTL.
+            success_message: Message returned as {"success": True, "message": ...} on 204 No Content.
+            **options: Extra options for pipeline stages: `stream_items` (field to stream),
+                `raw` (return the undecoded body), `revalidate` (serve via conditional
+                requests from `revalidation_cache`) and `hedge` (send a second copy of
+                slow requests, see dixa_api.hedging).
+
+        Returns:
+            The decoded response.
+
+        Raises:
+            HTTPError: If the API returns an HTTP error status (4xx, 5xx).
+            RequestException: If there's an error making the request.
+        """
+        request = ApiRequest(self, method, path, params, json, cache, success_message, options)
+        return self._pipeline(request)
+
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """Return the state of this API key's token bucket (tokens, waits, 429s, retries)."""
+        return self.scheduler.bucket.snapshot()
+
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "DixaClient":
+        return self
 
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,128 @@
+"""
+Pluggable JSON codec.
+
+Request bodies, API responses, cache size estimates and MCP tool results are all
+encoded or decoded through `codec`, which uses the fastest library available:
+orjson, then msgspec, then the standard library. Set DIXA_JSON_CODEC to "orjson",
+"msgspec" or "json" to force a backend.
+
+All backends behave the same for the JSON the Dixa API produces: `dumps` returns
+compact UTF-8 bytes, values that are not JSON types are encoded with `str()`, and
+`loads` raises ValueError on malformed input.
+
+Read endpoints called with raw=True skip decoding altogether and return the upstream
+body as RawJson, which the tool layer forwards to the MCP client as is.
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, Union
+
+
+class Codec:
+    """A JSON backend: compact `dumps` to bytes, `loads` from bytes or str."""
+
+    def __init__(self, name: str, dumps: Callable[[Any], bytes],
+                 loads: Callable[[Union[bytes, str]], Any],
+                 dumps_pretty: Callable[[Any], str]):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+        self.dumps_pretty = dumps_pretty
+
+    def dumps_str(self, value: Any) -> str:
+        """Encode to a compact JSON string."""
+        return self.dumps(value).decode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"Codec({self.name!r})"
+
+
+def _stdlib_codec() -> Codec:
+    encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str)
+
+    def dumps(value: Any) -> bytes:
+        return encoder.encode(value).encode("utf-8")
+
+    def dumps_pretty(value: Any) -> str:
+        return json.dumps(value, indent=2, ensure_ascii=False, default=str)
+
+    return Codec("json", dumps, json.loads, dumps_pretty)
+
+
+def _orjson_codec() -> Codec:
+    import orjson
+
+    options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=str, option=options)
+
+    def dumps_pretty(value: Any) -> str:
+        return orjson.dumps(value, default=str, option=options | orjson.OPT_INDENT_2).decode("utf-8")
+
+    # orjson.JSONDecodeError is a ValueError subclass
+    return Codec("orjson", dumps, orjson.loads, dumps_pretty)
+
+
+def _msgspec_codec() -> Codec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder(enc_hook=str)
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps_pretty(value: Any) -> str:
+        return msgspec.json.format(encoder.encode(value), indent=2).decode("utf-8")
+
+    return Codec("msgspec", encoder.encode, loads, dumps_pretty)
+
+
+_BACKENDS: Dict[str, Callable[[], Codec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def available_codecs() -> Dict[str, Codec]:
+    """Return every backend that can be loaded in this environment, fastest first."""
+    codecs = {}
+    for name, factory in _BACKENDS.items():
+        try:
+            codecs[name] = factory()
+        except ImportError:
+            continue
+    return codecs
+
+
+def load_codec(name: str = "") -> Codec:
+    """
+    Return the named backend, or the fastest installed one if no name is given.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the named backend is not installed.
+    """
+    if name:
+        if name not in _BACKENDS:
+            raise ValueError(f"Unknown JSON codec '{name}'; expected one of {', '.join(_BACKENDS)}")
+        return _BACKENDS[name]()
+    return next(iter(available_codecs().values()))
+
+
+# Process-wide codec used by the client, cache and tool layers.
+codec = load_codec(os.getenv("DIXA_JSON_CODEC", ""))
+
+
+class RawJson(bytes):
+    """An upstream JSON body passed through undecoded."""
+
+    def parse(self) -> Any:
+        """Decode the body when a caller needs the value after all."""
+        return codec.loads(self)
@@ -2,9 +2,10 @@
 Conversations-related API methods for DixaClient.
 """
 
-import requests
-from typing import Dict, Any, Optional, List, Literal
-from requests.exceptions import RequestException, HTTPError
+from typing import Dict, Any, Optional, List, Literal, Iterator, Union
+from dixa_api.codec import RawJson
+from dixa_api.pagination import iterate_items
+from dixa_api.streaming import StreamedPage
 
 def create_conversation_note(
     self,
@@ -38,8 +39,6 @@ def create_conversation_note(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/notes"
-        
     payload = {
         "message": message
     }
@@ -49,26 +48,8 @@ def create_conversation_note(
         
     if created_at:
         payload["createdAt"] = created_at
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", f"/conversations/{conversation_id}/notes", json=payload)
     
 
 
@@ -114,8 +95,6 @@ def create_conversation_notes_bulk(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/notes/bulk"
-        
     # Prepare the notes data
     notes_data = []
     for note in notes:
@@ -131,26 +110,8 @@ def create_conversation_notes_bulk(
     payload = {
         "data": notes_data
     }
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", f"/conversations/{conversation_id}/notes/bulk", json=payload)
     
 
 
@@ -183,26 +144,11 @@ def patch_conversation_anonymize(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/anonymize"
-        
     params = {
         "force": str(force).lower()
     }
         
-    try:
-        response = requests.patch(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("PATCH", f"/conversations/{conversation_id}/anonymize", params=params)
     
 
 
@@ -235,22 +181,7 @@ def patch_conversation_message_anonymize(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/messages/{message_id}/anonymize"
-        
-    try:
-        response = requests.patch(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("PATCH", f"/conversations/{conversation_id}/messages/{message_id}/anonymize")
     
 
 
@@ -274,31 +205,11 @@ def create_conversation_tags_bulk(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/tags/bulk"
-        
     payload = {
         "data": [{"name": name} for name in tag_names]
     }
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", f"/conversations/{conversation_id}/tags/bulk", json=payload)
     
 
 
@@ -324,36 +235,17 @@ def update_conversation_claim(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/claim"
-        
     payload = {
         "agentId": agent_id,
         "force": force
     }
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.put(url, json=payload, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Conversation claimed successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request(
+        "PUT",
+        f"/conversations/{conversation_id}/claim",
+        json=payload,
+        success_message="Conversation claimed successfully"
+    )
     
 
 
@@ -377,35 +269,16 @@ def update_conversation_close(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/close"
-        
     payload = {}
     if user_id:
         payload["userId"] = user_id
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.put(url, json=payload, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Conversation closed successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request(
+        "PUT",
+        f"/conversations/{conversation_id}/close",
+        json=payload,
+        success_message="Conversation closed successfully"
+    )
     
 
 
@@ -478,9 +351,7 @@ def create_conversation(
             "Sms conversations only support Outbound messages. "
             "Please use message_type='Outbound' for Sms conversations."
         )
-        
-    url = f"{self.base_url}/conversations"
-        
+
     payload = {
         "requesterId": requester_id,
         "message": {
@@ -505,62 +376,31 @@ def create_conversation(
         
     if agent_id:
         payload["agentId"] = agent_id
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", "/conversations", json=payload)
     
 
 
 def get_conversation(
     self,
-    conversation_id: str
-) -> Dict[str, Any]:
+    conversation_id: str,
+    raw: bool = False
+) -> Union[Dict[str, Any], RawJson]:
     """
     Get a conversation by its ID.
         
     Args:
         conversation_id: The ID of the conversation to retrieve (required).
+        raw: Return the response body undecoded as RawJson (optional).
         
     Returns:
-        Dictionary containing the conversation details.
+        Dictionary containing the conversation details, or the raw JSON body when raw is True.
         
     Raises:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}"
-        
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/conversations/{conversation_id}", raw=raw, hedge=True)
     
 
 
@@ -581,22 +421,7 @@ def get_conversation_flows(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/flows"
-        
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/conversations/{conversation_id}/flows")
     
 
 
@@ -617,22 +442,7 @@ def get_conversation_activity_log(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/activity-log"
-        
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/conversations/{conversation_id}/activity-log")
     
 
 
@@ -656,35 +466,16 @@ def update_conversation_link(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/link"
-        
     payload = {
         "parentConversationId": parent_conversation_id
     }
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.put(url, json=payload, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Conversation linked successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request(
+        "PUT",
+        f"/conversations/{conversation_id}/link",
+        json=payload,
+        success_message="Conversation linked successfully"
+    )
     
 
 
@@ -711,31 +502,11 @@ def create_conversations_import(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/import"
-        
     payload = {
         "conversations": conversations
     }
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", "/conversations/import", json=payload)
     
 
 
@@ -756,26 +527,7 @@ def get_conversation_notes(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/notes"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/conversations/{conversation_id}/notes")
     
 
 
@@ -796,102 +548,55 @@ def get_conversation_linked(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/linked"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/conversations/{conversation_id}/linked")
     
 
 
 def get_conversation_messages(
     self,
-    conversation_id: str
-) -> Dict[str, Any]:
+    conversation_id: str,
+    raw: bool = False
+) -> Union[Dict[str, Any], RawJson]:
     """
     List messages for a conversation.
         
     Args:
         conversation_id: The ID of the conversation to get messages for (required).
+        raw: Return the response body undecoded as RawJson (optional).
         
     Returns:
-        Dictionary containing the list of messages for the conversation.
+        Dictionary containing the list of messages for the conversation, or the raw
+        JSON body when raw is True.
         
     Raises:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/messages"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/conversations/{conversation_id}/messages", raw=raw)
     
 
 
 def get_organization_activity_log(
-    self
-) -> Dict[str, Any]:
+    self,
+    stream: bool = False
+) -> Union[Dict[str, Any], StreamedPage]:
     """
     List organization activity log for all conversations.
         
+    Args:
+        stream: Decode the log entries incrementally while the body is read (optional).
+        
     Returns:
-        Dictionary containing the organization activity log entries.
+        Dictionary containing the organization activity log entries, or a StreamedPage
+        yielding them one at a time when stream is True.
         
     Raises:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/activity-log"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    if stream:
+        return self._request("GET", "/conversations/activity-log", stream_items="data")
+    return self._request("GET", "/conversations/activity-log")
     
 
 
@@ -912,26 +617,7 @@ def get_conversation_ratings(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/ratings"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/conversations/{conversation_id}/ratings")
     
 
 
@@ -955,27 +641,7 @@ def patch_conversation_custom_attributes(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/custom-attributes"
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.patch(url, json=custom_attributes, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("PATCH", f"/conversations/{conversation_id}/custom-attributes", json=custom_attributes)
     
 
 
@@ -997,31 +663,11 @@ def update_conversation_reopen(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/reopen"
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.put(url, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Conversation reopened successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request(
+        "PUT",
+        f"/conversations/{conversation_id}/reopen",
+        success_message="Conversation reopened successfully"
+    )
     
 
 
@@ -1059,8 +705,6 @@ def post_search_conversations(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/search/conversations"
-    
     # Validate page_limit doesn't exceed API maximum
     if page_limit is not None and page_limit > 50:
         raise ValueError(f"page_limit must be less than or equal to 50, but got {page_limit}")
@@ -1076,31 +720,45 @@ def post_search_conversations(
         payload["filters"] = filters
     if query:
         payload["query"] = query
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        # Only send JSON body if there's something to send
-        if payload:
-            response = requests.post(url, json=payload, headers=headers, params=params)
-        else:
-            response = requests.post(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    # Only send JSON body if there's something to send
+    return self._request("POST", "/search/conversations", params=params, json=payload or None)
+    
+
+
+def iter_search_conversations(
+    self,
+    page_limit: Optional[int] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    query: Optional[Dict[str, Any]] = None,
+    prefetch: bool = False,
+    max_items: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all conversations matching a search, following pagination lazily.
+    
+    Args:
+        page_limit: Maximum number of results per page. Must be less than or equal to 50 (optional).
+        filters: Dictionary containing filter conditions to apply to the search (optional).
+        query: Dictionary containing query parameters for text search (optional).
+        prefetch: Fetch the next page in the background while the current one is consumed.
+        max_items: Stop after this many search hits.
     
+    Yields:
+        Search hit dictionaries, in the same shape as the items of post_search_conversations.
+    
+    Raises:
+        ValueError: If page_limit is greater than 50.
+        HTTPError: If the API returns an HTTP error status (4xx, 5xx).
+        RequestException: If there's an error making the request.
+    """
+    if page_limit is not None and page_limit > 50:
+        raise ValueError(f"page_limit must be less than or equal to 50, but got {page_limit}")
+    return iterate_items(
+        lambda page_key: self.post_search_conversations(page_key=page_key, page_limit=page_limit, filters=filters, query=query),
+        prefetch=prefetch,
+        max_items=max_items
+    )
 
 
 def update_conversation_tag(
@@ -1123,31 +781,11 @@ def update_conversation_tag(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/tags/{tag_id}"
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.put(url, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Conversation tagged successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request(
+        "PUT",
+        f"/conversations/{conversation_id}/tags/{tag_id}",
+        success_message="Conversation tagged successfully"
+    )
     
 
 
@@ -1171,30 +809,11 @@ def delete_conversation_tag(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/tags/{tag_id}"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.delete(url, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Conversation untagged successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request(
+        "DELETE",
+        f"/conversations/{conversation_id}/tags/{tag_id}",
+        success_message="Conversation untagged successfully"
+    )
     
 
 
@@ -1218,33 +837,14 @@ def update_conversation_followup(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/followup"
-        
     payload = {
         "followUp": follow_up
     }
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.put(url, json=payload, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Conversation follow-up status updated successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request(
+        "PUT",
+        f"/conversations/{conversation_id}/followup",
+        json=payload,
+        success_message="Conversation follow-up status updated successfully"
+    )
     
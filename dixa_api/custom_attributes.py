@@ -2,9 +2,7 @@
 Custom_Attributes-related API methods for DixaClient.
 """
 
-import requests
 from typing import Dict, Any, Optional, List, Literal
-from requests.exceptions import RequestException, HTTPError
 
 def get_custom_attribute(
     self,
@@ -23,26 +21,7 @@ def get_custom_attribute(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/custom-attributes/{custom_attribute_id}"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/custom-attributes/{custom_attribute_id}")
     
 
 
@@ -59,26 +38,7 @@ def get_custom_attributes(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/custom-attributes"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", "/custom-attributes", revalidate=True)
     
 
 
@@ -108,25 +68,5 @@ def patch_end_user_custom_attributes(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/endusers/{user_id}/custom-attributes"
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.patch(url, json=custom_attributes, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("PATCH", f"/endusers/{user_id}/custom-attributes", json=custom_attributes)
     
@@ -0,0 +1,98 @@
+"""
+Request timeouts and deadline propagation.
+
+Every upstream request is sent with a connect and read timeout, so a stalled connection
+can no longer hang a tool call (and its worker thread) forever. On top of that a caller
+can set a deadline, an absolute time budget stored in a context variable: the MCP server
+gives each tool invocation DEFAULT_TOOL_BUDGET seconds. The deadline flows into every
+request made in that context, including requests made from the async client's worker
+threads and from concurrent fan-out tasks, which all copy the context. Each request's
+timeouts are clipped to the budget that is left, and once it is spent requests fail
+fast with DeadlineExceeded instead of being sent.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Iterator, Optional, Tuple
+
+from requests.exceptions import Timeout
+
+from dixa_api.metrics import record_timeout
+
+DEFAULT_CONNECT_TIMEOUT = float(os.getenv("DIXA_CONNECT_TIMEOUT", "5"))
+DEFAULT_READ_TIMEOUT = float(os.getenv("DIXA_READ_TIMEOUT", "30"))
+# Time budget of one MCP tool call, covering all of its upstream requests.
+DEFAULT_TOOL_BUDGET = float(os.getenv("DIXA_TOOL_TIMEOUT", "60"))
+
+_deadline: ContextVar[Optional[float]] = ContextVar("dixa_deadline", default=None)
+
+
+class DeadlineExceeded(Timeout):
+    """The time budget of the current call ran out before the request could complete."""
+
+
+def set_deadline(seconds: float) -> Token:
+    """
+    Give the current context `seconds` from now to finish its work.
+
+    A deadline already in effect is never extended, so nested budgets only shrink.
+
+    Returns:
+        Token for reset_deadline.
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    return _deadline.set(deadline)
+
+
+def reset_deadline(token: Token) -> None:
+    """Restore the deadline that was in effect before set_deadline."""
+    _deadline.reset(token)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Run the enclosed block with a deadline of `seconds` from now."""
+    token = set_deadline(seconds)
+    try:
+        yield
+    finally:
+        reset_deadline(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left until the current deadline (may be negative), or None if there is none."""
+    current = _deadline.get()
+    return None if current is None else current - time.monotonic()
+
+
+def check_deadline() -> None:
+    """
+    Raise if the current deadline has passed.
+
+    Raises:
+        DeadlineExceeded: If no budget is left.
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        record_timeout("deadline")
+        raise DeadlineExceeded("Deadline exceeded before the request could be sent")
+
+
+def request_timeout(connect: float = DEFAULT_CONNECT_TIMEOUT,
+                    read: float = DEFAULT_READ_TIMEOUT) -> Tuple[float, float]:
+    """
+    Return the (connect, read) timeout for a request, clipped to the remaining budget.
+
+    Raises:
+        DeadlineExceeded: If no budget is left.
+    """
+    check_deadline()
+    left = remaining()
+    if left is None:
+        return connect, read
+    return min(connect, left), min(read, left)
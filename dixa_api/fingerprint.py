@@ -0,0 +1,20 @@
+"""
+API key fingerprints.
+
+A fingerprint is a short, non-reversible hash of an API key. It identifies the key
+wherever the key itself must not appear: cache keys, the client registry, rate-limit
+buckets and log lines. Every one of those uses the functions here, so the same key
+always gets the same fingerprint and label. Only the standard library is imported.
+"""
+
+import hashlib
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Return the fingerprint of an API key (16 hex digits of its SHA-256)."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def fingerprint_label(fingerprint: str) -> str:
+    """Short label of a fingerprint for log lines, e.g. "key#1a2b3c4d"."""
+    return "key#" + fingerprint[:8]
@@ -0,0 +1,118 @@
+"""
+Hedged requests for latency-critical idempotent reads.
+
+Endpoints that opt in with the `hedge` option (e.g. get_conversation) are sent once as
+usual. If no response has arrived after the endpoint family's hedge delay, a second
+identical request is sent on another pooled connection, and whichever response arrives
+first is used; the other is discarded when it completes.
+
+The delay adapts to observed latency: it is the DEFAULT_PERCENTILE of the family's
+recent response times, so only the slow tail gets hedged. Until a family has
+MIN_SAMPLES observations it is not hedged at all. A process-wide budget caps the
+extra load: every eligible request earns DEFAULT_BUDGET of a hedge, and a hedge is only
+sent when a whole one has been earned, so hedges never exceed that fraction of requests.
+"""
+
+import math
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, Optional
+
+# Fraction of eligible requests that may be hedged (0 disables hedging).
+DEFAULT_BUDGET = float(os.getenv("DIXA_HEDGE_BUDGET", "0.05"))
+# Latency percentile after which a request is hedged.
+DEFAULT_PERCENTILE = float(os.getenv("DIXA_HEDGE_PERCENTILE", "95"))
+# Latency observations kept per family, and needed before hedging starts.
+WINDOW_SIZE = 256
+MIN_SAMPLES = 20
+# Never hedge sooner than this, however fast the family usually is.
+MIN_DELAY = 0.01
+# Hedges that may be saved up for a burst of slow responses.
+MAX_SAVED_HEDGES = 10.0
+
+
+class HedgePolicy:
+    """Adaptive hedge delays per endpoint family plus the shared hedge budget."""
+
+    def __init__(self, budget: float = DEFAULT_BUDGET, percentile: float = DEFAULT_PERCENTILE):
+        self.budget = budget
+        self.percentile = percentile
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.budget > 0
+
+    def observe(self, family: str, seconds: float) -> None:
+        """Record the latency of a completed attempt."""
+        with self._lock:
+            window = self._latencies.get(family)
+            if window is None:
+                window = self._latencies[family] = deque(maxlen=WINDOW_SIZE)
+            window.append(seconds)
+
+    def delay_for(self, family: str) -> Optional[float]:
+        """Seconds to wait before hedging a request, or None while too few latencies are known."""
+        with self._lock:
+            window = self._latencies.get(family)
+            if window is None or len(window) < MIN_SAMPLES:
+                return None
+            ordered = sorted(window)
+        index = min(len(ordered) - 1, math.ceil(len(ordered) * self.percentile / 100) - 1)
+        return max(MIN_DELAY, ordered[max(0, index)])
+
+    def admit(self) -> None:
+        """Count an eligible request, earning its share of the hedge budget."""
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(MAX_SAVED_HEDGES, self._tokens + self.budget)
+
+    def try_spend(self) -> bool:
+        """Take one hedge from the budget; False if the budget is used up."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedged += 1
+            return True
+
+    def record_win(self) -> None:
+        """Count a hedge that answered before the original request."""
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters and the current hedge delay per family."""
+        with self._lock:
+            families = list(self._latencies)
+            stats: Dict[str, Any] = {"requests": self.requests, "hedged": self.hedged,
+                                     "hedge_wins": self.hedge_wins, "budget": self.budget}
+        stats["delay_seconds"] = {family: self.delay_for(family) for family in families}
+        return stats
+
+
+hedge_policy = HedgePolicy()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the worker pool that runs hedged attempts, sized like the HTTP connection pool."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from dixa_api.client import DEFAULT_POOL_MAXSIZE, _env_int
+                _executor = ThreadPoolExecutor(
+                    max_workers=_env_int("DIXA_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE),
+                    thread_name_prefix="dixa-hedge",
+                )
+    return _executor
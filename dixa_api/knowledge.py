@@ -2,9 +2,8 @@
 Knowledge-related API methods for DixaClient.
 """
 
-import requests
-from typing import Dict, Any, Optional, List, Literal
-from requests.exceptions import RequestException, HTTPError
+from typing import Dict, Any, Optional, List, Literal, Iterator
+from dixa_api.pagination import iterate_items
 
 def get_knowledge_articles(
     self,
@@ -25,35 +24,44 @@ def get_knowledge_articles(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/knowledge/articles"
-        
     params = {}
     if page_key:
         params["pageKey"] = page_key
     if page_limit is not None:
         params["pageLimit"] = page_limit
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers, params=params if params else None)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("GET", "/knowledge/articles", params=params)
     
 
 
+def iter_knowledge_articles(
+    self,
+    page_limit: Optional[int] = None,
+    prefetch: bool = False,
+    max_items: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all knowledge articles, following pagination lazily.
+    
+    Args:
+        page_limit: Optional limit for the number of results per page.
+        prefetch: Fetch the next page in the background while the current one is consumed.
+        max_items: Stop after this many articles.
+    
+    Yields:
+        Article dictionaries, in the same shape as the items of get_knowledge_articles.
+    
+    Raises:
+        HTTPError: If the API returns an HTTP error status (4xx, 5xx).
+        RequestException: If there's an error making the request.
+    """
+    return iterate_items(
+        lambda page_key: self.get_knowledge_articles(page_key=page_key, page_limit=page_limit),
+        prefetch=prefetch,
+        max_items=max_items
+    )
+
+
 def get_knowledge_article(
     self,
     article_id: str
@@ -71,26 +79,7 @@ def get_knowledge_article(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/knowledge/articles/{article_id}"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/knowledge/articles/{article_id}")
     
 
 
@@ -119,8 +108,6 @@ def create_knowledge_article(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/knowledge/articles"
-        
     payload = {
         "title": title,
         "content": content
@@ -133,26 +120,8 @@ def create_knowledge_article(
         
     # Add any additional kwargs
     payload.update(kwargs)
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", "/knowledge/articles", json=payload)
     
 
 
@@ -183,8 +152,6 @@ def patch_knowledge_article(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/knowledge/articles/{article_id}"
-        
     payload = {}
         
     if title is not None:
@@ -198,26 +165,8 @@ def patch_knowledge_article(
         
     # Add any additional kwargs
     payload.update(kwargs)
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.patch(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("PATCH", f"/knowledge/articles/{article_id}", json=payload)
     
 
 
@@ -239,30 +188,11 @@ def delete_knowledge_article(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/knowledge/articles/{article_id}"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.delete(url, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Knowledge article deleted successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request(
+        "DELETE",
+        f"/knowledge/articles/{article_id}",
+        success_message="Knowledge article deleted successfully"
+    )
     
 
 
@@ -285,33 +215,42 @@ def get_knowledge_categories(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/knowledge/categories"
-        
     params = {}
     if page_key:
         params["pageKey"] = page_key
     if page_limit is not None:
         params["pageLimit"] = page_limit
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers, params=params if params else None)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("GET", "/knowledge/categories", params=params)
+    
+
+
+def iter_knowledge_categories(
+    self,
+    page_limit: Optional[int] = None,
+    prefetch: bool = False,
+    max_items: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all knowledge categories, following pagination lazily.
+    
+    Args:
+        page_limit: Optional limit for the number of results per page.
+        prefetch: Fetch the next page in the background while the current one is consumed.
+        max_items: Stop after this many categories.
     
+    Yields:
+        Category dictionaries, in the same shape as the items of get_knowledge_categories.
+    
+    Raises:
+        HTTPError: If the API returns an HTTP error status (4xx, 5xx).
+        RequestException: If there's an error making the request.
+    """
+    return iterate_items(
+        lambda page_key: self.get_knowledge_categories(page_key=page_key, page_limit=page_limit),
+        prefetch=prefetch,
+        max_items=max_items
+    )
 
 
 def create_knowledge_category(
@@ -335,8 +274,6 @@ def create_knowledge_category(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/knowledge/categories"
-        
     payload = {
         "name": name
     }
@@ -346,24 +283,6 @@ def create_knowledge_category(
         
     # Add any additional kwargs
     payload.update(kwargs)
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", "/knowledge/categories", json=payload)
 
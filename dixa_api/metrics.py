@@ -0,0 +1,350 @@
+"""
+Latency and upstream-call metrics for the Dixa MCP server.
+
+The request pipeline records every upstream Dixa API call (latency, status, bytes sent
+and received), response cache lookups, rate-limit retries and timeouts. While a tool call is in
+progress these are also attributed to the tool through a context variable, which the
+async client copies into its worker threads.
+
+The registry is process-wide and can be exported as Prometheus text or as a JSON snapshot.
+"""
+
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional, Tuple
+
+from dixa_api.breaker import STATE_VALUES, circuit_breakers
+from dixa_api.cache import response_cache, revalidation_cache
+from dixa_api.hedging import hedge_policy
+from dixa_api.singleflight import inflight_requests
+
+# Histogram bucket upper bounds in seconds, shared by tool and upstream latencies.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class CallStats:
+    """Counters for a single tool call, filled in by the request pipeline."""
+
+    __slots__ = ("upstream_calls", "upstream_errors", "upstream_seconds", "bytes_in", "bytes_out",
+                 "cache_hits", "cache_misses", "retries", "timeouts", "_lock")
+
+    def __init__(self) -> None:
+        self.upstream_calls = 0
+        self.upstream_errors = 0
+        self.upstream_seconds = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.retries = 0
+        self.timeouts = 0
+        # Fan-out tools record from several worker threads at once
+        self._lock = threading.Lock()
+
+    def add(self, **values: float) -> None:
+        with self._lock:
+            for name, value in values.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {name: getattr(self, name) for name in self.__slots__ if not name.startswith("_")}
+
+
+_current_call: ContextVar[Optional[CallStats]] = ContextVar("dixa_call_stats", default=None)
+
+
+class _Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus layout."""
+
+    __slots__ = ("counts", "total", "sum", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+        self.total += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "avg_seconds": round(self.sum / self.total, 4) if self.total else 0.0,
+            "max_seconds": round(self.max, 4),
+        }
+
+
+def family_for(path: str) -> str:
+    """Endpoint family of an API path, i.e. its first segment ("/agents/123" -> "agents")."""
+    return path.lstrip("/").split("/", 1)[0].split("?", 1)[0] or "root"
+
+
+class MetricsRegistry:
+    """Process-wide tool and upstream metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.tools: Dict[str, Dict[str, Any]] = {}
+        self.upstream: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+
+    def record_tool(self, tool: str, seconds: float, stats: CallStats, error: bool = False,
+                    budget_remaining: Optional[float] = None) -> None:
+        """Record a finished tool call, the upstream work attributed to it and its unused budget."""
+        values = stats.as_dict()
+        with self._lock:
+            entry = self.tools.get(tool)
+            if entry is None:
+                entry = self.tools[tool] = {"calls": 0, "errors": 0, "latency": _Histogram(),
+                                            "budget_remaining": _Histogram(),
+                                            **{name: 0 for name in values}}
+            entry["calls"] += 1
+            entry["errors"] += int(error)
+            entry["latency"].observe(seconds)
+            if budget_remaining is not None:
+                entry["budget_remaining"].observe(max(0.0, budget_remaining))
+            for name, value in values.items():
+                entry[name] += value
+
+    def record_upstream(self, method: str, path: str, status: Optional[int], seconds: float,
+                        bytes_in: int, bytes_out: int) -> None:
+        """Record one HTTP request sent to the Dixa API (status None on connection errors)."""
+        error = status is None or status >= 400
+        key = (method, family_for(path))
+        with self._lock:
+            entry = self.upstream.get(key)
+            if entry is None:
+                entry = self.upstream[key] = {"requests": 0, "errors": 0, "latency": _Histogram(),
+                                              "bytes_in": 0, "bytes_out": 0}
+            entry["requests"] += 1
+            entry["errors"] += int(error)
+            entry["latency"].observe(seconds)
+            entry["bytes_in"] += bytes_in
+            entry["bytes_out"] += bytes_out
+        stats = _current_call.get()
+        if stats is not None:
+            stats.add(upstream_calls=1, upstream_errors=int(error), upstream_seconds=seconds,
+                      bytes_in=bytes_in, bytes_out=bytes_out)
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """Increment a free-form counter, exported as dixa_api_<name>_total."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def reset(self) -> None:
+        with self._lock:
+            self.tools.clear()
+            self.upstream.clear()
+            self.counters.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all metrics as a JSON-serializable dictionary."""
+        with self._lock:
+            tools = {
+                name: {**{k: v for k, v in entry.items() if not isinstance(v, _Histogram)},
+                       **entry["latency"].summary(),
+                       "avg_budget_remaining_seconds": entry["budget_remaining"].summary()["avg_seconds"]}
+                for name, entry in sorted(self.tools.items())
+            }
+            upstream = {
+                f"{method} {family}": {**{k: v for k, v in entry.items() if k != "latency"},
+                                       **entry["latency"].summary()}
+                for (method, family), entry in sorted(self.upstream.items())
+            }
+            counters: Dict[str, Any] = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                label = ",".join(f"{k}={v}" for k, v in labels)
+                counters[f"{name}{{{label}}}" if label else name] = value
+        return {
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "tools": tools,
+            "upstream": upstream,
+            "counters": counters,
+        }
+
+    def render_prometheus(self) -> str:
+        """Return tool and upstream metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            _histogram(lines, "dixa_mcp_tool_duration_seconds", "Tool call wall time.",
+                       [({"tool": name}, entry["latency"]) for name, entry in sorted(self.tools.items())])
+            for field, help_text in (
+                ("errors", "Tool calls that raised an error."),
+                ("upstream_calls", "Dixa API requests made by tool calls."),
+                ("upstream_errors", "Failed Dixa API requests made by tool calls."),
+                ("bytes_in", "Response bytes received from the Dixa API by tool calls."),
+                ("bytes_out", "Request bytes sent to the Dixa API by tool calls."),
+                ("cache_hits", "Response cache hits during tool calls."),
+                ("cache_misses", "Response cache misses during tool calls."),
+                ("retries", "Rate-limited requests retried during tool calls."),
+                ("timeouts", "Upstream requests that timed out or ran out of deadline budget during tool calls."),
+            ):
+                _counter(lines, f"dixa_mcp_tool_{field}_total", help_text,
+                         [({"tool": name}, entry[field]) for name, entry in sorted(self.tools.items())])
+
+            _histogram(lines, "dixa_mcp_tool_budget_remaining_seconds", "Deadline budget left when a tool call finished.",
+                       [({"tool": name}, entry["budget_remaining"]) for name, entry in sorted(self.tools.items())
+                        if entry["budget_remaining"].total])
+
+            upstream = sorted(self.upstream.items())
+            _histogram(lines, "dixa_api_request_duration_seconds", "Dixa API request latency.",
+                       [({"method": m, "family": f}, entry["latency"]) for (m, f), entry in upstream])
+            for field, help_text in (
+                ("errors", "Dixa API requests that failed or returned an error status."),
+                ("bytes_in", "Response bytes received from the Dixa API."),
+                ("bytes_out", "Request bytes sent to the Dixa API."),
+            ):
+                _counter(lines, f"dixa_api_request_{field}_total", help_text,
+                         [({"method": m, "family": f}, entry[field]) for (m, f), entry in upstream])
+
+            by_name: Dict[str, List[Tuple[Dict[str, str], float]]] = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                by_name.setdefault(name, []).append((dict(labels), value))
+            for name, samples in by_name.items():
+                _counter(lines, f"dixa_api_{name}_total", f"Dixa API {name.replace('_', ' ')}.", samples)
+        return "".join(f"{line}\n" for line in lines)
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        for value in labels.values()
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + "}"
+
+
+def _counter(lines: List[str], name: str, help_text: str, samples: List[Tuple[Dict[str, str], float]]) -> None:
+    if not samples:
+        return
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} counter")
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(labels)} {value}")
+
+
+def _gauge(lines: List[str], name: str, help_text: str, samples: List[Tuple[Dict[str, str], float]]) -> None:
+    if not samples:
+        return
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} gauge")
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(labels)} {value}")
+
+
+def _histogram(lines: List[str], name: str, help_text: str, samples: List[Tuple[Dict[str, str], _Histogram]]) -> None:
+    if not samples:
+        return
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, hist in samples:
+        for bound, count in zip(LATENCY_BUCKETS, hist.counts):
+            lines.append(f"{name}_bucket{_labels({**labels, 'le': str(bound)})} {count}")
+        lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {hist.total}")
+        lines.append(f"{name}_sum{_labels(labels)} {hist.sum}")
+        lines.append(f"{name}_count{_labels(labels)} {hist.total}")
+
+
+metrics = MetricsRegistry()
+
+
+def start_call() -> Tuple[CallStats, Token]:
+    """Begin attributing upstream work in the current context to a new tool call."""
+    stats = CallStats()
+    return stats, _current_call.set(stats)
+
+
+def end_call(token: Token) -> None:
+    """Stop attributing upstream work to the tool call started with start_call."""
+    _current_call.reset(token)
+
+
+def current_call() -> Optional[CallStats]:
+    """Return the stats of the tool call in progress, if any."""
+    return _current_call.get()
+
+
+def record_cache_lookup(hit: bool) -> None:
+    """Attribute a response cache lookup to the current tool call."""
+    stats = _current_call.get()
+    if stats is not None:
+        stats.add(cache_hits=int(hit), cache_misses=int(not hit))
+
+
+def record_retry(reason: str) -> None:
+    """Count a retried upstream request, globally and for the current tool call."""
+    metrics.increment("retries", reason=reason)
+    stats = _current_call.get()
+    if stats is not None:
+        stats.add(retries=1)
+
+
+def record_timeout(kind: str) -> None:
+    """Count an upstream timeout ("connect", "read" or "deadline"), globally and for the current tool call."""
+    metrics.increment("timeouts", kind=kind)
+    stats = _current_call.get()
+    if stats is not None:
+        stats.add(timeouts=1)
+
+
+def render_prometheus() -> str:
+    """Prometheus text for tool/upstream metrics, caches, rate limits, coalescing, breakers and hedging."""
+    # Imported here: the rate limiter records its retries in this module
+    from dixa_api.ratelimit import rate_limit_snapshot
+
+    lines: List[str] = []
+    cache = response_cache.stats()
+    for field, kind in (("hits", "counter"), ("misses", "counter"), ("evictions", "counter"),
+                        ("entries", "gauge"), ("bytes", "gauge")):
+        name = f"dixa_api_cache_{field}" + ("_total" if kind == "counter" else "")
+        (_counter if kind == "counter" else _gauge)(lines, name, f"Response cache {field}.", [({}, cache[field])])
+    revalidation = revalidation_cache.stats()
+    for field in ("entries", "bytes"):
+        _gauge(lines, f"dixa_api_revalidation_cache_{field}", f"Revalidation cache {field}.",
+               [({}, revalidation[field])])
+    if response_cache.shared is not None:
+        # One backend serves both caches
+        shared = response_cache.shared.stats()
+        for field in ("hits", "misses", "errors"):
+            _counter(lines, f"dixa_api_shared_cache_{field}_total", f"Shared cache lookups: {field}.",
+                     [({}, shared[field])])
+
+    buckets = rate_limit_snapshot()
+    _gauge(lines, "dixa_api_rate_limit_tokens", "Tokens available in the API key's bucket.",
+           [({"key": key}, state["tokens"]) for key, state in buckets.items()])
+    _counter(lines, "dixa_api_rate_limit_throttled_total", "Requests that waited for a token.",
+             [({"key": key, "lane": lane}, count) for key, state in buckets.items()
+              for lane, count in state["throttled"].items()])
+    _counter(lines, "dixa_api_rate_limit_wait_seconds_total", "Time spent waiting for tokens.",
+             [({"key": key}, state["wait_seconds_total"]) for key, state in buckets.items()])
+    _counter(lines, "dixa_api_rate_limited_responses_total", "HTTP 429 responses received.",
+             [({"key": key}, state["rate_limited_responses"]) for key, state in buckets.items()])
+    _gauge(lines, "dixa_api_singleflight_in_flight", "GET requests currently being shared by concurrent callers.",
+           [({}, inflight_requests.stats()["in_flight"])])
+    _gauge(lines, "dixa_api_circuit_state", "Circuit breaker state per endpoint family (0 closed, 1 half-open, 2 open).",
+           [({"family": family}, STATE_VALUES[state["state"]])
+            for family, state in sorted(circuit_breakers.stats().items())])
+    _gauge(lines, "dixa_api_hedge_delay_seconds", "Current delay before a request of the endpoint family is hedged.",
+           [({"family": family}, delay) for family, delay in sorted(hedge_policy.stats()["delay_seconds"].items())
+            if delay is not None])
+    return metrics.render_prometheus() + "".join(f"{line}\n" for line in lines)
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    """JSON snapshot of tool/upstream metrics, caches, rate-limit buckets, coalescing, breakers and hedging."""
+    from dixa_api.ratelimit import rate_limit_snapshot
+
+    return {**metrics.snapshot(), "cache": response_cache.stats(),
+            "revalidation_cache": revalidation_cache.stats(), "rate_limit": rate_limit_snapshot(),
+            "singleflight": inflight_requests.stats(), "circuit_breakers": circuit_breakers.stats(),
+            "hedging": hedge_policy.stats()}
@@ -0,0 +1,106 @@
+"""
+Pagination helpers for pageKey-based Dixa API endpoints.
+
+List endpoints return one page at a time together with a continuation key, either as
+`meta.next` (a URL carrying a `pageKey` query parameter) or as a top-level `pageKey`.
+These helpers walk those pages lazily so callers can stream items with constant memory.
+"""
+
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional
+from urllib.parse import parse_qs, urlparse
+
+from dixa_api.streaming import StreamedPage
+
+# Fetches one page given the continuation key (None for the first page).
+PageFetcher = Callable[[Optional[str]], Dict[str, Any]]
+
+
+def next_page_key(page: Dict[str, Any]) -> Optional[str]:
+    """
+    Extract the continuation key from a page response.
+
+    Args:
+        page: A decoded page response.
+
+    Returns:
+        The pageKey for the next page, or None if this was the last page.
+    """
+    meta = page.get("meta") or {}
+    next_url = meta.get("next")
+    if next_url:
+        values = parse_qs(urlparse(next_url).query).get("pageKey")
+        if values:
+            return values[0]
+    return page.get("pageKey") or meta.get("pageKey") or None
+
+
+def iterate_pages(fetch_page: PageFetcher, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Yield successive pages until the API stops returning a continuation key.
+
+    Args:
+        fetch_page: Callable fetching one page for a given pageKey.
+        prefetch: Fetch the next page on a background thread while the current
+            page is being consumed. At most two pages are held in memory.
+    """
+    if not prefetch:
+        page_key = None
+        while True:
+            page = fetch_page(page_key)
+            yield page
+            page_key = next_page_key(page)
+            if not page_key:
+                return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dixa-prefetch")
+    # Pages are fetched in the caller's context so per-call metrics still attribute them
+    ctx = contextvars.copy_context()
+    try:
+        pending: Optional[Future] = executor.submit(ctx.run, fetch_page, None)
+        while pending is not None:
+            page = pending.result()
+            page_key = next_page_key(page)
+            pending = executor.submit(ctx.run, fetch_page, page_key) if page_key else None
+            yield page
+    finally:
+        executor.shutdown(wait=False)
+
+
+def iterate_items(
+    fetch_page: PageFetcher,
+    prefetch: bool = False,
+    max_items: Optional[int] = None,
+    items_field: str = "data"
+) -> Iterator[Any]:
+    """
+    Yield the items of every page, one at a time.
+
+    Pages may be decoded dicts or StreamedPages (see dixa_api.streaming), whose items
+    are decoded while they are read. The next pageKey of a streamed page is only known
+    once its items are consumed, so callers should not combine streaming with prefetch.
+
+    Args:
+        fetch_page: Callable fetching one page for a given pageKey.
+        prefetch: Fetch the next page in the background while the current one is consumed.
+        max_items: Stop after this many items (and stop requesting further pages).
+        items_field: Name of the list field holding the items in each page.
+    """
+    if max_items is not None and max_items <= 0:
+        return
+    count = 0
+    page = None
+    pages = iterate_pages(fetch_page, prefetch=prefetch)
+    try:
+        for page in pages:
+            for item in page.get(items_field) or []:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+    finally:
+        # A streamed page left half-read still holds its connection
+        if isinstance(page, StreamedPage):
+            page.close()
+        pages.close()
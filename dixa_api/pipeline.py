@@ -0,0 +1,429 @@
+"""
+Request pipeline for DixaClient.
+
+Every endpoint method goes through ``DixaClient._request``, which wraps the call in an
+ApiRequest and runs it through an ordered list of stages before it is sent on the
+client's pooled session. A stage is a callable ``stage(request, call_next)`` that may
+inspect or modify the request, answer it without calling further (e.g. from a cache),
+or post-process whatever ``call_next(request)`` returns.
+
+Stages listed before ``decode_stage`` see decoded results (dicts); stages after it see
+the raw ``requests.Response``.
+"""
+
+import contextvars
+import functools
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from requests.exceptions import ConnectTimeout, HTTPError, ReadTimeout, RequestException, Timeout
+
+from dixa_api.breaker import CircuitOpenError, circuit_breakers
+from dixa_api.cache import VALIDATED_TTL, response_cache, revalidation_cache
+from dixa_api.codec import RawJson, codec
+from dixa_api.deadline import (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, DeadlineExceeded, remaining,
+                               request_timeout)
+from dixa_api.hedging import get_executor, hedge_policy
+from dixa_api.metrics import family_for, metrics, record_cache_lookup, record_timeout
+from dixa_api.singleflight import inflight_requests
+from dixa_api.streaming import StreamedPage
+
+Handler = Callable[["ApiRequest"], Any]
+Stage = Callable[["ApiRequest", Handler], Any]
+
+_MISSING = object()
+# Returned by decode_stage for HTTP 304 Not Modified, which has no body to decode.
+NOT_MODIFIED = object()
+
+
+class ApiRequest:
+    """A single Dixa API call as it travels through the pipeline."""
+
+    __slots__ = ("client", "method", "path", "url", "params", "json", "body", "headers",
+                 "extra_headers", "cache", "success_message", "options", "timeout", "response")
+
+    def __init__(
+        self,
+        client: Any,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        cache: Optional[str] = None,
+        success_message: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None
+    ):
+        self.client = client
+        self.method = method
+        self.path = path
+        self.url = f"{client.base_url}{path}"
+        self.params = params or None
+        self.json = json
+        self.body = None
+        self.headers = client.headers
+        # Per-request headers (e.g. conditional request validators) merged in by auth_stage
+        self.extra_headers: Optional[Dict[str, str]] = None
+        self.cache = cache
+        self.success_message = success_message
+        self.options = options or {}
+        # (connect, read) timeout of the next attempt, set by deadline_stage
+        self.timeout: Any = None
+        # The last raw response received, set by send()
+        self.response: Any = None
+
+    def copy(self) -> "ApiRequest":
+        """Shallow copy, e.g. for sending the same request twice concurrently."""
+        clone = object.__new__(ApiRequest)
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+
+def cache_stage(request: ApiRequest, call_next: Handler) -> Any:
+    """Serve GET requests that name a cache endpoint from `response_cache`."""
+    if request.cache is None or request.method != "GET":
+        return call_next(request)
+    ttl = response_cache.ttl_for(request.cache)
+    if ttl <= 0:
+        return call_next(request)
+    params = tuple(sorted((request.params or {}).items()))
+    # Raw (RawJson) and decoded results of the same request are cached apart
+    key = (request.client.key_fingerprint, request.cache, request.path, params,
+           bool(request.options.get("raw")))
+    result = response_cache.get(key, _MISSING)
+    record_cache_lookup(result is not _MISSING)
+    if result is _MISSING:
+        result = call_next(request)
+        response_cache.set(key, result, ttl)
+    return result
+
+
+def singleflight_stage(request: ApiRequest, call_next: Handler) -> Any:
+    """
+    Let concurrent identical GET requests share one upstream call and its decoded result.
+
+    Timeouts are not shared: the first caller's may only mean that its own deadline ran
+    out, so a waiting caller then sends the request itself, within its own deadline.
+    """
+    if request.method != "GET" or request.options.get("stream_items"):
+        return call_next(request)
+    params = tuple(sorted((request.params or {}).items()))
+    key = (request.client.key_fingerprint, request.method, request.url, params,
+           bool(request.options.get("raw")))
+    left = remaining()
+    try:
+        result, shared = inflight_requests.do(key, lambda: call_next(request),
+                                              wait_timeout=None if left is None else max(0.0, left),
+                                              retry_on=(Timeout,))
+    except TimeoutError as e:
+        record_timeout("deadline")
+        raise DeadlineExceeded(f"Request failed: {e}") from e
+    if shared:
+        metrics.increment("singleflight_collapsed", family=family_for(request.path))
+    return result
+
+
+def revalidate_stage(request: ApiRequest, call_next: Handler) -> Any:
+    """
+    Serve reference data (requests made with the `revalidate` option) via conditional GETs.
+
+    The decoded body is stored with its ETag / Last-Modified validators, and later
+    requests send If-None-Match / If-Modified-Since; on 304 Not Modified the stored body
+    is returned without being downloaded or decoded again. Responses without validators
+    are reused for the family's TTL in REVALIDATE_TTLS instead. Any write to the same
+    endpoint family drops that family's stored entries.
+    """
+    fingerprint = request.client.key_fingerprint
+    family = family_for(request.path)
+    if request.method != "GET":
+        try:
+            return call_next(request)
+        finally:
+            if family in revalidation_cache.ttls:
+                revalidation_cache.invalidate_prefix((fingerprint, family))
+    if not request.options.get("revalidate"):
+        return call_next(request)
+
+    params = tuple(sorted((request.params or {}).items()))
+    key = (fingerprint, family, request.path, params, bool(request.options.get("raw")))
+    entry = revalidation_cache.get(key)
+    if entry is not None:
+        value, validators = entry
+        if not validators:
+            metrics.increment("revalidation", result="fresh")
+            record_cache_lookup(True)
+            return value
+        request.extra_headers = validators
+    result = call_next(request)
+    if result is NOT_MODIFIED and entry is not None:
+        metrics.increment("revalidation", result="not_modified")
+        record_cache_lookup(True)
+        # Keep the entry (and its validators) for another round
+        revalidation_cache.set(key, entry, VALIDATED_TTL, size=_stored_size(value))
+        return value
+
+    metrics.increment("revalidation", result="fetched")
+    record_cache_lookup(False)
+    headers = request.response.headers if request.response is not None else {}
+    validators = {}
+    if headers.get("ETag"):
+        validators["If-None-Match"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = headers["Last-Modified"]
+    ttl = VALIDATED_TTL if validators else revalidation_cache.ttl_for(family)
+    revalidation_cache.set(key, (result, validators), ttl, size=_stored_size(result))
+    return result
+
+
+def _stored_size(value: Any) -> Optional[int]:
+    # Raw bodies are sized directly; decoded values are estimated by the cache
+    return len(value) if isinstance(value, bytes) else None
+
+
+def decode_stage(request: ApiRequest, call_next: Handler) -> Any:
+    """
+    Raise for error statuses and decode the response body.
+
+    Requests made with a success_message return {"success": True, "message": ...}
+    on 204 No Content, and {"success": True} for any other empty response. A 304 Not
+    Modified (answering a conditional request) returns NOT_MODIFIED. Requests
+    made with the `stream_items` option return a StreamedPage over that list field,
+    and requests made with the `raw` option return the undecoded body as RawJson.
+
+    Raises:
+        HTTPError: If the API returns an HTTP error status (4xx, 5xx).
+        CircuitOpenError: If the endpoint family's circuit breaker rejected the request.
+        RequestException: If there's an error making the request (a Timeout subclass,
+            e.g. DeadlineExceeded, if it timed out).
+    """
+    response = None
+    try:
+        response = call_next(request)
+        response.raise_for_status()
+        if response.status_code == 304:
+            return NOT_MODIFIED
+        if request.options.get("stream_items"):
+            return StreamedPage(response, request.options["stream_items"])
+        if request.options.get("raw"):
+            return RawJson(response.content)
+        if request.success_message is None:
+            return codec.loads(response.content)
+        if response.status_code == 204:
+            return {"success": True, "message": request.success_message}
+        if response.content:
+            return codec.loads(response.content)
+        return {"success": True}
+    except CircuitOpenError:
+        raise
+    except HTTPError as e:
+        error_msg = f"HTTP {response.status_code} error: {e}"
+        try:
+            error_detail = codec.loads(response.content)
+            error_msg += f" - {error_detail}"
+        except ValueError:
+            error_msg += f" - {response.text}"
+        raise HTTPError(error_msg, response=response) from e
+    except RequestException as e:
+        # Keep the exception type so callers can tell timeouts from other failures
+        raise type(e)(f"Request failed: {e}") from e
+
+
+def auth_stage(request: ApiRequest, call_next: Handler) -> Any:
+    """
+    Attach the client's precomputed headers (plus any per-request ones) and encode the JSON body.
+
+    The body is encoded once with the process codec, so retries resend the same bytes.
+    """
+    if request.json is not None:
+        request.headers = request.client.json_headers
+        request.body = codec.dumps(request.json)
+    else:
+        request.headers = request.client.headers
+    if request.extra_headers:
+        request.headers = {**request.headers, **request.extra_headers}
+    return call_next(request)
+
+
+def circuit_breaker_stage(request: ApiRequest, call_next: Handler) -> Any:
+    """
+    Fail fast while the endpoint family's circuit breaker is open.
+
+    5xx responses, connection errors and timeouts count as failures. Other responses
+    count as successes, except 429s, which the rate limiter already handles. Timeouts
+    clipped to the caller's deadline arrive as DeadlineExceeded (see deadline_stage)
+    and don't count either way.
+    """
+    family = family_for(request.path)
+    breaker = circuit_breakers.get(family)
+    try:
+        breaker.before_request()
+    except CircuitOpenError:
+        metrics.increment("circuit_rejected", family=family)
+        raise
+    try:
+        response = call_next(request)
+    except DeadlineExceeded:
+        # The caller ran out of time; says nothing about the API's health
+        breaker.release_probe()
+        raise
+    except RequestException:
+        if breaker.record_failure():
+            metrics.increment("circuit_opened", family=family)
+        raise
+    except BaseException:
+        breaker.release_probe()
+        raise
+    if response.status_code >= 500:
+        if breaker.record_failure():
+            metrics.increment("circuit_opened", family=family)
+    elif response.status_code == 429:
+        breaker.release_probe()
+    else:
+        breaker.record_success()
+    return response
+
+
+def rate_limit_stage(request: ApiRequest, call_next: Handler) -> Any:
+    """Pace the request through the client's token bucket, retrying on HTTP 429."""
+    return request.client.scheduler.execute(request.method, request.url, lambda: call_next(request))
+
+
+def hedge_stage(request: ApiRequest, call_next: Handler) -> Any:
+    """
+    Send a second copy of slow GET requests made with the `hedge` option; the first response wins.
+
+    See dixa_api.hedging for the adaptive delay and the hedge budget. The hedge only
+    goes out if a rate-limit token is available right away.
+    """
+    if not request.options.get("hedge") or request.method != "GET" or not hedge_policy.enabled:
+        return call_next(request)
+    family = family_for(request.path)
+    hedge_policy.admit()
+    delay = hedge_policy.delay_for(family)
+    if delay is None:
+        start = time.perf_counter()
+        response = call_next(request)
+        hedge_policy.observe(family, time.perf_counter() - start)
+        return response
+
+    primary = _submit_attempt(request, call_next, family)
+    if not wait([primary], timeout=delay).done and hedge_policy.try_spend() \
+            and request.client.scheduler.bucket.try_acquire():
+        metrics.increment("hedged_requests", family=family)
+        hedge = _submit_attempt(request.copy(), call_next, family)
+        winner = _first_response(primary, hedge)
+        loser = hedge if winner is primary else primary
+        loser.add_done_callback(_close_response)
+        if winner is hedge:
+            hedge_policy.record_win()
+            metrics.increment("hedge_wins", family=family)
+    else:
+        winner = primary
+    request.response = winner.result()
+    return request.response
+
+
+def _submit_attempt(request: ApiRequest, call_next: Handler, family: str) -> Future:
+    # Each attempt runs in its own copy of the caller's context (deadline, tool metrics)
+    ctx = contextvars.copy_context()
+
+    def attempt() -> Any:
+        start = time.perf_counter()
+        response = call_next(request)
+        hedge_policy.observe(family, time.perf_counter() - start)
+        return response
+
+    return get_executor().submit(ctx.run, attempt)
+
+
+def _first_response(first: Future, second: Future) -> Future:
+    """Return the attempt that responds first, or the last one to fail if neither responds."""
+    done, pending = wait([first, second], return_when=FIRST_COMPLETED)
+    for future in done:
+        if future.exception() is None:
+            return future
+    if not pending:
+        return first
+    (other,) = pending
+    wait([other])
+    return other
+
+
+def _close_response(future: Future) -> None:
+    # Release the losing attempt's connection back to the pool
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def deadline_stage(request: ApiRequest, call_next: Handler) -> Any:
+    """
+    Give each attempt the default timeouts, clipped to the caller's remaining deadline.
+
+    A timeout that fired before the default one, because it was clipped, is raised as
+    DeadlineExceeded: the caller ran out of time, which says nothing about the API.
+    """
+    request.timeout = connect, read = request_timeout()
+    try:
+        return call_next(request)
+    except ConnectTimeout as e:
+        if connect < DEFAULT_CONNECT_TIMEOUT:
+            raise DeadlineExceeded(f"Deadline exceeded while connecting: {e}") from e
+        raise
+    except ReadTimeout as e:
+        if read < DEFAULT_READ_TIMEOUT:
+            raise DeadlineExceeded(f"Deadline exceeded while waiting for the response: {e}") from e
+        raise
+
+
+def metrics_stage(request: ApiRequest, call_next: Handler) -> Any:
+    """Record latency, status, bytes and timeouts of every request actually sent (including retries)."""
+    start = time.perf_counter()
+    response = None
+    try:
+        response = call_next(request)
+        return response
+    except ConnectTimeout:
+        record_timeout("connect")
+        raise
+    except ReadTimeout:
+        record_timeout("read")
+        raise
+    finally:
+        status = response.status_code if response is not None else None
+        bytes_in = 0
+        bytes_out = 0
+        if response is not None:
+            # Streamed bodies are still unread here; don't buffer them just to measure
+            content_length = response.headers.get("Content-Length")
+            if content_length or not request.options.get("stream_items"):
+                bytes_in = int(content_length or len(response.content))
+            body = response.request.body if response.request is not None else None
+            bytes_out = len(body) if body else 0
+        metrics.record_upstream(request.method, request.path, status,
+                                time.perf_counter() - start, bytes_in, bytes_out)
+
+
+def send(request: ApiRequest) -> Any:
+    """Send the request on the client's pooled session and return the raw response."""
+    request.response = request.client.session.request(
+        request.method,
+        request.url,
+        params=request.params,
+        data=request.body,
+        headers=request.headers,
+        stream=bool(request.options.get("stream_items")),
+        timeout=request.timeout,
+    )
+    return request.response
+
+
+DEFAULT_STAGES = (cache_stage, singleflight_stage, revalidate_stage, decode_stage, auth_stage,
+                  circuit_breaker_stage, rate_limit_stage, hedge_stage, deadline_stage, metrics_stage)
+
+
+def build_pipeline(stages: Iterable[Stage], handler: Handler = send) -> Handler:
+    """Compose stages, outermost first, around the final handler."""
+    for stage in reversed(list(stages)):
+        handler = functools.partial(stage, call_next=handler)
+    return handler
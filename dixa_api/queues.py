@@ -2,9 +2,7 @@
 Queues-related API methods for DixaClient.
 """
 
-import requests
 from typing import Dict, Any, Optional, List
-from requests.exceptions import RequestException, HTTPError
 
 
 def get_queues(self) -> Dict[str, Any]:
@@ -18,22 +16,7 @@ def get_queues(self) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/queues"
-    
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", "/queues", revalidate=True)
 
 
 def get_queue(self, queue_id: str) -> Dict[str, Any]:
@@ -50,22 +33,7 @@ def get_queue(self, queue_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/queues/{queue_id}"
-    
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/queues/{queue_id}")
 
 
 def get_queue_availability(self, queue_id: str) -> Dict[str, Any]:
@@ -82,22 +50,7 @@ def get_queue_availability(self, queue_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/queues/{queue_id}/availability"
-    
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/queues/{queue_id}/availability", hedge=True)
 
 
 def get_queue_conversation_position(
@@ -119,22 +72,7 @@ def get_queue_conversation_position(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/queues/{queue_id}/conversations/{conversation_id}/position"
-    
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/queues/{queue_id}/conversations/{conversation_id}/position")
 
 
 def get_queue_agents(self, queue_id: str) -> Dict[str, Any]:
@@ -151,22 +89,7 @@ def get_queue_agents(self, queue_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/queues/{queue_id}/members"
-    
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/queues/{queue_id}/members")
 
 
 def create_queue(
@@ -218,8 +141,6 @@ def create_queue(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/queues"
-    
     request_payload = {
         "name": name
     }
@@ -261,26 +182,8 @@ def create_queue(
     payload = {
         "request": request_payload
     }
-    
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-    
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", "/queues", json=payload)
 
 
 def patch_queue_assign_agents(
@@ -318,31 +221,11 @@ def patch_queue_assign_agents(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/queues/{queue_id}/members"
-    
     payload = {
         "agentIds": agent_ids
     }
-    
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-    
-    try:
-        response = requests.patch(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("PATCH", f"/queues/{queue_id}/members", json=payload)
 
 
 def delete_queue_remove_agents(
@@ -365,33 +248,14 @@ def delete_queue_remove_agents(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/queues/{queue_id}/members"
-    
     payload = {
         "agentIds": agent_ids
     }
-    
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-    
-    try:
-        response = requests.delete(url, json=payload, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Agents removed from queue successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request(
+        "DELETE",
+        f"/queues/{queue_id}/members",
+        json=payload,
+        success_message="Agents removed from queue successfully"
+    )
 
@@ -0,0 +1,301 @@
+"""
+Rate-limit aware request scheduling for the Dixa API.
+
+Every API key gets a token bucket that paces outgoing requests. Interactive reads
+(GET/HEAD, analytics queries and searches) may use every token, while writes leave a reserve
+untouched and yield to waiting reads, so a large bulk tool cannot starve interactive
+calls. Responses with HTTP 429 are retried with jittered exponential backoff that honours Retry-After.
+"""
+
+import email.utils
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from dixa_api.fingerprint import key_fingerprint
+from dixa_api.deadline import DeadlineExceeded, remaining
+from dixa_api.metrics import record_retry, record_timeout
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+N = TypeVar("N", int, float)
+
+# Default pacing per API key; override with DIXA_RATE_LIMIT / DIXA_RATE_BURST.
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 20.0
+# Share of the bucket that only interactive requests may consume.
+DEFAULT_INTERACTIVE_RESERVE = 0.25
+
+# Retries of a 429 response; override with DIXA_MAX_RETRIES.
+DEFAULT_MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+_IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+# POST endpoints that only query data and belong in the interactive lane.
+_QUERY_PATHS = ("/analytics/", "/search/")
+
+
+def _env_setting(name: str, default: N, parse: Callable[[str], N]) -> N:
+    """
+    Read a numeric setting from the environment.
+
+    Settings are read when a bucket or scheduler is created rather than at import, so
+    a malformed value fails the client that needs it with an error naming the variable,
+    instead of the import of the whole package.
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return parse(value)
+    except ValueError:
+        kind = "an integer" if parse is int else "a number"
+        raise ValueError(f"{name} must be {kind}, got {value!r}") from None
+
+
+def priority_for(method: str, url: str = "") -> str:
+    """Reads, including POST queries and searches, are interactive; writes go through the bulk lane."""
+    if method.upper() in _IDEMPOTENT_METHODS or any(path in url for path in _QUERY_PATHS):
+        return INTERACTIVE
+    return BULK
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, parsed.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Seconds to wait before retry number `attempt` (0-based).
+
+    A server-provided Retry-After wins; otherwise exponential backoff with full jitter.
+    """
+    if retry_after is not None:
+        return min(retry_after, BACKOFF_CAP)
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+
+class TokenBucket:
+    """Thread-safe token bucket with an interactive-only reserve."""
+
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None,
+                 interactive_reserve: float = DEFAULT_INTERACTIVE_RESERVE):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (sustained requests per second). Defaults to
+                DIXA_RATE_LIMIT, or DEFAULT_RATE.
+            capacity: Maximum number of tokens (burst size). Defaults to DIXA_RATE_BURST,
+                or DEFAULT_BURST.
+            interactive_reserve: Fraction of capacity bulk requests may not consume,
+                capped so that bulk requests can always get a token eventually.
+
+        Raises:
+            ValueError: If DIXA_RATE_LIMIT / DIXA_RATE_BURST is not a number, rate is
+                not positive or capacity is below one token.
+        """
+        if rate is None:
+            rate = _env_setting("DIXA_RATE_LIMIT", DEFAULT_RATE, float)
+        if capacity is None:
+            capacity = _env_setting("DIXA_RATE_BURST", DEFAULT_BURST, float)
+        if rate <= 0:
+            raise ValueError(f"Rate limit (DIXA_RATE_LIMIT) must be greater than 0, got {rate}")
+        if capacity < 1:
+            raise ValueError(f"Burst size (DIXA_RATE_BURST) must be at least 1, got {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self.reserve = min(capacity * interactive_reserve, capacity - 1)
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+        self._waiting = {INTERACTIVE: 0, BULK: 0}
+        self.acquired = {INTERACTIVE: 0, BULK: 0}
+        self.throttled = {INTERACTIVE: 0, BULK: 0}
+        self.wait_seconds = 0.0
+        self.rate_limited_responses = 0
+        self.retries = 0
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _available_to(self, priority: str, now: float) -> bool:
+        if now < self._paused_until:
+            return False
+        if priority == INTERACTIVE:
+            return self._tokens >= 1
+        return self._waiting[INTERACTIVE] == 0 and self._tokens - 1 >= self.reserve
+
+    def acquire(self, priority: str = INTERACTIVE) -> float:
+        """
+        Block until a token is available for the given priority lane.
+
+        Returns:
+            Seconds spent waiting.
+
+        Raises:
+            DeadlineExceeded: If the caller's deadline passes while waiting.
+        """
+        start = time.monotonic()
+        with self._cond:
+            self._refill(start)
+            if not self._available_to(priority, start):
+                self.throttled[priority] += 1
+                self._waiting[priority] += 1
+                try:
+                    while True:
+                        now = time.monotonic()
+                        self._refill(now)
+                        if self._available_to(priority, now):
+                            break
+                        needed = 1 if priority == INTERACTIVE else self.reserve + 1
+                        delay = max((needed - self._tokens) / self.rate, self._paused_until - now, 0.001)
+                        left = remaining()
+                        if left is not None:
+                            if left <= 0:
+                                record_timeout("deadline")
+                                raise DeadlineExceeded("Deadline exceeded while waiting for the rate limiter")
+                            delay = min(delay, left)
+                        self._cond.wait(delay)
+                finally:
+                    self._waiting[priority] -= 1
+            self._tokens -= 1
+            self.acquired[priority] += 1
+            waited = time.monotonic() - start
+            self.wait_seconds += waited
+            self._cond.notify_all()
+            return waited
+
+    def try_acquire(self, priority: str = INTERACTIVE) -> bool:
+        """Take a token if one is available right now, without waiting."""
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            if not self._available_to(priority, now):
+                return False
+            self._tokens -= 1
+            self.acquired[priority] += 1
+            return True
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for `seconds`, e.g. after the server answered 429."""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self.rate_limited_responses += 1
+
+    def count_retry(self) -> None:
+        """Count a request retried after a 429 response."""
+        with self._cond:
+            self.retries += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current bucket state and counters."""
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "tokens": round(self._tokens, 3),
+                "capacity": self.capacity,
+                "rate_per_second": self.rate,
+                "interactive_reserve": self.reserve,
+                "paused_for_seconds": round(max(0.0, self._paused_until - now), 3),
+                "waiting": dict(self._waiting),
+                "acquired": dict(self.acquired),
+                "throttled": dict(self.throttled),
+                "wait_seconds_total": round(self.wait_seconds, 3),
+                "rate_limited_responses": self.rate_limited_responses,
+                "retries": self.retries,
+            }
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def bucket_for(api_key: str) -> TokenBucket:
+    """Return the shared token bucket for an API key."""
+    fingerprint = key_fingerprint(api_key)
+    bucket = _buckets.get(fingerprint)
+    if bucket is None:
+        with _buckets_lock:
+            bucket = _buckets.setdefault(fingerprint, TokenBucket())
+    return bucket
+
+
+def rate_limit_snapshot() -> Dict[str, Dict[str, Any]]:
+    """Return the state of every token bucket, keyed by API key fingerprint."""
+    with _buckets_lock:
+        buckets = dict(_buckets)
+    return {fingerprint: bucket.snapshot() for fingerprint, bucket in buckets.items()}
+
+
+class RequestScheduler:
+    """Paces requests through a token bucket and retries rate-limited responses."""
+
+    def __init__(self, bucket: TokenBucket, max_retries: Optional[int] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            bucket: Token bucket of the API key the requests are sent with.
+            max_retries: Retries of a 429 response. Defaults to DIXA_MAX_RETRIES, or
+                DEFAULT_MAX_RETRIES.
+
+        Raises:
+            ValueError: If DIXA_MAX_RETRIES is not an integer, or max_retries is negative.
+        """
+        if max_retries is None:
+            max_retries = _env_setting("DIXA_MAX_RETRIES", DEFAULT_MAX_RETRIES, int)
+        if max_retries < 0:
+            raise ValueError(f"Retries (DIXA_MAX_RETRIES) must be 0 or more, got {max_retries}")
+        self.bucket = bucket
+        self.max_retries = max_retries
+
+    def execute(self, method: str, url: str, send: Callable[[], Any]) -> Any:
+        """
+        Send a request once a token is available, retrying on HTTP 429.
+
+        Args:
+            method: HTTP method, used to pick the priority lane.
+            url: Request URL, used to pick the priority lane.
+            send: Callable performing the request and returning a requests.Response.
+
+        Returns:
+            The final response (which may still be a 429 once retries are exhausted, or
+            when waiting for the retry would outlast the caller's deadline).
+        """
+        priority = priority_for(method, url)
+        attempt = 0
+        while True:
+            self.bucket.acquire(priority)
+            response = send()
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+            delay = backoff_delay(attempt, parse_retry_after(response.headers.get("Retry-After")))
+            # Hold the whole bucket so other requests for this key don't hit the limit too
+            self.bucket.pause(delay)
+            left = remaining()
+            if left is not None and left <= delay:
+                return response
+            self.bucket.count_retry()
+            record_retry("rate_limited")
+            response.close()
+            attempt += 1
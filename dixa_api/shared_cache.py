@@ -0,0 +1,214 @@
+"""
+Host-wide backend for the response caches, shared by worker processes.
+
+With several server processes on one host (`server.py --http PORT --workers N`), each
+worker's in-process caches would fetch the same reference data once per worker. When
+DIXA_SHARED_CACHE names a file, `response_cache` and `revalidation_cache` also store
+their entries in that SQLite database (in WAL mode, so readers never block the writer),
+and a miss in a worker's own cache is looked up there before going upstream.
+
+Values are stored as JSON (or the raw JSON body, for RawJson results) behind a one-byte
+type tag, never pickled, so reading an entry back can't run code. The cached responses
+belong to other API keys, though, so the file is kept readable by the server's user only
+(mode 0600; SQLite gives its -wal and -shm files the same mode). Keys are the repr of the
+in-process cache key, which starts with the API key fingerprint, never the key itself.
+"""
+
+import os
+import sqlite3
+import struct
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from dixa_api.codec import RawJson, codec
+
+# Expired rows are purged, and the table cut back to max_entries, once per this many writes.
+PURGE_EVERY = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    cache TEXT NOT NULL,
+    key TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (cache, key)
+) WITHOUT ROWID
+"""
+
+
+# Type tags of stored values.
+_JSON = b"j"
+_RAW = b"r"
+_TUPLE = b"t"
+_LENGTH = struct.Struct(">I")
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Serialize a cache value: a JSON value, RawJson body, or a tuple of those (such as a
+    (body, validators) revalidation entry).
+
+    Raises:
+        TypeError: If the value can't be stored.
+    """
+    if isinstance(value, RawJson):
+        return _RAW + value
+    if isinstance(value, tuple):
+        parts = [encode_value(item) for item in value]
+        return _TUPLE + b"".join(_LENGTH.pack(len(part)) + part for part in parts)
+    if isinstance(value, (bytes, bytearray)):
+        raise TypeError(f"Can't store {type(value).__name__} values in the shared cache")
+    return _JSON + codec.dumps(value)
+
+
+def decode_value(blob: bytes) -> Any:
+    """
+    Inverse of encode_value.
+
+    Raises:
+        ValueError: If the blob is malformed.
+    """
+    tag, data = blob[:1], blob[1:]
+    if tag == _JSON:
+        return codec.loads(data)
+    if tag == _RAW:
+        return RawJson(data)
+    if tag == _TUPLE:
+        items = []
+        offset = 0
+        while offset < len(data):
+            if offset + _LENGTH.size > len(data):
+                raise ValueError("Truncated shared cache entry")
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            if offset + length > len(data):
+                raise ValueError("Truncated shared cache entry")
+            items.append(decode_value(data[offset:offset + length]))
+            offset += length
+        return tuple(items)
+    raise ValueError(f"Unknown shared cache entry type {tag!r}")
+
+
+def encode_key(key: Hashable) -> str:
+    """Stable text form of a cache key, the same in every process."""
+    return repr(key)
+
+
+def encode_prefix(prefix: Tuple[Any, ...]) -> str:
+    """Text that the encoded form of every key starting with the `prefix` items starts with."""
+    # Tuples repr as "(" + ", ".join(repr(item) ...) + ")"
+    return "(" + "".join(repr(item) + ", " for item in prefix)
+
+
+class SharedCache:
+    """Cache entries in a SQLite database shared by the processes on a host."""
+
+    def __init__(self, path: str, max_entries: int = 16384, timeout: float = 1.0):
+        """
+        Initialize the backend; the database is opened per thread on first use.
+
+        Args:
+            path: Database file, created if missing.
+            max_entries: Rows kept per cache before the soonest-expiring are dropped.
+            timeout: Seconds to wait for a lock held by another process before
+                treating the operation as a miss.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # Owner-only, also if the file already existed (SQLite copies the mode to -wal/-shm)
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            os.fchmod(fd, 0o600)
+        finally:
+            os.close(fd)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                         check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def get(self, cache: str, key: Hashable) -> Optional[Tuple[Any, float, int]]:
+        """Return (value, seconds left, stored size) for a live entry, or None."""
+        try:
+            row = self._connection().execute(
+                "SELECT expires_at, value FROM entries WHERE cache = ? AND key = ?",
+                (cache, encode_key(key)),
+            ).fetchone()
+            remaining = row[0] - time.time() if row is not None else 0.0
+            value = decode_value(row[1]) if remaining > 0 else None
+        except (sqlite3.Error, ValueError):
+            self.errors += 1
+            return None
+        if row is None or remaining <= 0:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value, remaining, len(row[1])
+
+    def set(self, cache: str, key: Hashable, value: Any, ttl: float) -> None:
+        """Store an entry for `ttl` seconds (values encode_value can't store are skipped)."""
+        try:
+            blob = encode_value(value)
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (cache, key, expires_at, value) VALUES (?, ?, ?, ?)",
+                (cache, encode_key(key), time.time() + ttl, blob),
+            )
+            self._writes += 1
+            if self._writes % PURGE_EVERY == 0:
+                self._purge(connection, cache)
+        except (sqlite3.Error, TypeError, ValueError):
+            self.errors += 1
+
+    def _purge(self, connection: sqlite3.Connection, cache: str) -> None:
+        connection.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        connection.execute(
+            "DELETE FROM entries WHERE cache = ? AND key IN (SELECT key FROM entries WHERE cache = ?"
+            " ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (cache, cache, self.max_entries),
+        )
+
+    def invalidate_prefix(self, cache: str, prefix: Tuple[Any, ...]) -> None:
+        """Drop every entry whose key starts with the items of `prefix`."""
+        encoded = encode_prefix(prefix)
+        try:
+            self._connection().execute(
+                "DELETE FROM entries WHERE cache = ? AND substr(key, 1, ?) = ?",
+                (cache, len(encoded), encoded),
+            )
+        except sqlite3.Error:
+            self.errors += 1
+
+    def clear(self, cache: str) -> None:
+        """Drop all entries of a cache."""
+        try:
+            self._connection().execute("DELETE FROM entries WHERE cache = ?", (cache,))
+        except sqlite3.Error:
+            self.errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return lookup counters of this process."""
+        return {"path": self.path, "hits": self.hits, "misses": self.misses, "errors": self.errors}
+
+
+def shared_cache_from_env() -> Optional[SharedCache]:
+    """The backend named by DIXA_SHARED_CACHE, or None when it is unset or "off"."""
+    path = os.getenv("DIXA_SHARED_CACHE", "")
+    if path.lower() in ("", "0", "off", "false", "no"):
+        return None
+    return SharedCache(path, max_entries=int(os.getenv("DIXA_SHARED_CACHE_MAX_ENTRIES", "16384")))
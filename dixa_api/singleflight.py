@@ -0,0 +1,92 @@
+"""
+Coalescing of identical in-flight requests.
+
+When several callers issue the same read at the same moment (e.g. a few MCP sessions
+of one organization all listing tags), only the first one reaches the Dixa API. The
+others wait for it and receive the same decoded result, or the same exception, except
+for errors that only say something about the first caller (such as a timeout clipped
+to its own deadline): those callers make the call again instead.
+Nothing is kept once the call completes; caching across time is `response_cache`'s job.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Type
+
+
+class _Call:
+    """An in-flight call whose outcome is shared with duplicate callers."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome with duplicates."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.collapsed = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any], wait_timeout: Optional[float] = None,
+           retry_on: Tuple[Type[BaseException], ...] = ()) -> Tuple[Any, bool]:
+        """
+        Run func(), or wait for a concurrent call with the same key and share its result.
+
+        Args:
+            key: Identity of the call.
+            func: Performs the call.
+            wait_timeout: Longest time to wait for another caller's call (default: no limit).
+            retry_on: Errors of another caller's call that are not shared: a waiting
+                caller runs func() itself instead (or joins another waiter's new call).
+
+        Returns:
+            A (result, shared) tuple; shared is True if another caller made the call.
+
+        Raises:
+            TimeoutError: If the shared call does not finish within wait_timeout.
+            Whatever the call raised.
+        """
+        wait_until = None if wait_timeout is None else time.monotonic() + wait_timeout
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is None:
+                    call = self._calls[key] = _Call()
+                    self.calls += 1
+                    break
+                self.collapsed += 1
+
+            left = None if wait_until is None else max(0.0, wait_until - time.monotonic())
+            if not call.done.wait(left):
+                raise TimeoutError("Timed out waiting for a concurrent identical call")
+            if call.error is None:
+                return call.result, True
+            if not isinstance(call.error, retry_on):
+                raise call.error
+
+        try:
+            call.result = func()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Return call counters and the number of calls currently in flight."""
+        with self._lock:
+            return {"calls": self.calls, "collapsed": self.collapsed, "in_flight": len(self._calls)}
+
+
+# Process-wide, so requests from different client instances for one API key coalesce too.
+inflight_requests = SingleFlight()
@@ -0,0 +1,223 @@
+"""
+Incremental JSON decoding for large list responses.
+
+`response.json()` buffers the whole body, decodes it to text and then builds the full
+object tree, so a big page briefly holds three copies of itself. StreamedPage instead
+reads the body off the socket in chunks and yields the items of its list field
+(usually "data") one at a time, so memory stays around one chunk plus one item.
+
+The other top-level fields (e.g. "meta" with the next page link) are decoded as they
+are reached and exposed through `StreamedPage.get`, so `pagination.next_page_key`
+works on a fully consumed StreamedPage just like on a decoded page.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+# Bytes read from the socket per chunk.
+CHUNK_SIZE = 64 * 1024
+# Drop consumed text from the buffer once this many characters have been parsed.
+_COMPACT_AFTER = 256 * 1024
+
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[,}\]\s]')
+_NON_WS = re.compile(r'\S')
+
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Text buffer over an iterator of byte chunks, refilled on demand."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.bytes_read = 0
+
+    def more(self) -> bool:
+        """Append the next chunk to the buffer; False once the body is exhausted."""
+        while not self.eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.eof = True
+                self.buf += self._utf8.decode(b"", final=True)
+                return False
+            if chunk:
+                self.bytes_read += len(chunk)
+                self.buf += self._utf8.decode(chunk)
+                return True
+        return False
+
+    def compact(self) -> None:
+        """Discard already parsed text; only call between values."""
+        if self.pos > _COMPACT_AFTER:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            match = _NON_WS.search(self.buf, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.buf[self.pos]
+            self.pos = len(self.buf)
+            if not self.more():
+                raise ValueError("Truncated JSON response")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON response, found '{found}'")
+        self.pos += 1
+
+    def _search(self, pattern: "re.Pattern[str]", start: int) -> "re.Match[str]":
+        while True:
+            match = pattern.search(self.buf, start)
+            if match:
+                return match
+            start = max(start, len(self.buf))
+            if not self.more():
+                raise ValueError("Truncated JSON response")
+
+    def _string_end(self, start: int) -> int:
+        """Index just past the closing quote of a string whose body starts at `start`."""
+        i = start
+        while True:
+            match = self._search(_STRING_SPECIAL, i)
+            if match.group() == '"':
+                return match.end()
+            # Skip the escaped character
+            i = match.end() + 1
+
+    def value_end(self) -> int:
+        """Index just past the JSON value starting at `pos` (reading more data as needed)."""
+        start = self.pos
+        first = self.buf[start]
+        if first == '"':
+            return self._string_end(start + 1)
+        if first not in "{[":
+            while True:
+                match = _SCALAR_END.search(self.buf, start)
+                if match:
+                    return match.start()
+                if not self.more():
+                    return len(self.buf)
+        depth = 0
+        i = start
+        while True:
+            match = self._search(_STRUCTURAL, i)
+            char = match.group()
+            i = match.end()
+            if char == '"':
+                i = self._string_end(i)
+            elif char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return i
+
+    def read_value(self) -> Any:
+        # Fast path: objects, arrays and strings end in an explicit delimiter, so if one
+        # decodes from the buffer as is it is complete. Numbers may be cut off mid-chunk.
+        if self.peek() in '{["':
+            try:
+                value, self.pos = _decoder.raw_decode(self.buf, self.pos)
+                return value
+            except json.JSONDecodeError:
+                pass
+        # Slow path: find where the value ends, reading as much as needed, then decode
+        end = self.value_end()
+        value, _ = _decoder.raw_decode(self.buf[self.pos:end])
+        self.pos = end
+        return value
+
+
+def iter_json_items(chunks: Iterable[bytes], items_field: str = "data",
+                    rest: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """
+    Yield the items of `items_field` from a JSON object streamed as byte chunks.
+
+    Args:
+        chunks: The response body as an iterable of byte chunks.
+        items_field: Top-level field holding the list to stream.
+        rest: Optional dict receiving every other top-level field once it is parsed.
+
+    Raises:
+        ValueError: If the body is not a JSON object or is truncated.
+    """
+    rest = rest if rest is not None else {}
+    reader = _Reader(chunks)
+    reader.expect("{")
+    while True:
+        char = reader.peek()
+        if char == "}":
+            return
+        if char == ",":
+            reader.pos += 1
+            continue
+        key = reader.read_value()
+        reader.expect(":")
+        if key == items_field and reader.peek() == "[":
+            reader.pos += 1
+            while True:
+                char = reader.peek()
+                if char == "]":
+                    reader.pos += 1
+                    break
+                if char == ",":
+                    reader.pos += 1
+                    continue
+                item = reader.read_value()
+                reader.compact()
+                yield item
+        else:
+            rest[key] = reader.read_value()
+
+
+class StreamedPage:
+    """
+    A list response whose items are decoded lazily while reading the body.
+
+    Iterate it (or `page.get(items_field)`) to receive the items. Fields other than
+    the items field are available through `get` once the items have been consumed.
+    The underlying response is closed when the items are exhausted or on `close()`.
+    """
+
+    def __init__(self, response: Any, items_field: str = "data"):
+        self.response = response
+        self.items_field = items_field
+        self.rest: Dict[str, Any] = {}
+        self._items = iter_json_items(
+            response.iter_content(chunk_size=CHUNK_SIZE), items_field, self.rest
+        )
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            yield from self._items
+        finally:
+            self.close()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the item iterator for the items field, else a decoded top-level field."""
+        if key == self.items_field:
+            return iter(self)
+        return self.rest.get(key, default)
+
+    def close(self) -> None:
+        """Stop decoding and release the connection."""
+        self._items.close()
+        self.response.close()
+
+    def __enter__(self) -> "StreamedPage":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
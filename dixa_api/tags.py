@@ -2,12 +2,12 @@
 Tags-related API methods for DixaClient.
 """
 
-import requests
-from typing import Dict, Any, Optional
-from requests.exceptions import RequestException, HTTPError
+from typing import Dict, Any, Optional, Union
 
+from dixa_api.codec import RawJson
 
-def get_tags(self, include_deactivated: Optional[bool] = None) -> Dict[str, Any]:
+
+def get_tags(self, include_deactivated: Optional[bool] = None, raw: bool = False) -> Union[Dict[str, Any], RawJson]:
     """
     List all tags in an organization. Only active tags are returned by default.
     To include deactivated tags use include_deactivated=True.
@@ -15,34 +15,21 @@ def get_tags(self, include_deactivated: Optional[bool] = None) -> Dict[str, Any]
     Args:
         include_deactivated: Whether to include deactivated tags in the response.
                            If not provided, only active tags are listed (default: False).
+        raw: Return the response body undecoded as RawJson (optional).
     
     Returns:
-        Dictionary containing the list of all tags in an organization.
+        Dictionary containing the list of all tags in an organization, or the raw JSON
+        body when raw is True.
     
     Raises:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/tags"
-    
     params = {}
     if include_deactivated is not None:
         params["includeDeactivated"] = include_deactivated
     
-    try:
-        response = requests.get(url, headers=self.headers, params=params if params else None)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", "/tags", params=params, raw=raw, revalidate=True)
 
 
 def get_tag(self, tag_id: str) -> Dict[str, Any]:
@@ -59,22 +46,7 @@ def get_tag(self, tag_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/tags/{tag_id}"
-    
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/tags/{tag_id}")
 
 
 def create_tag(
@@ -97,34 +69,14 @@ def create_tag(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/tags"
-    
     payload = {
         "name": name
     }
     
     if color:
         payload["color"] = color
-    
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-    
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", "/tags", json=payload)
 
 
 def patch_tag_activate(self, tag_id: str) -> Dict[str, Any]:
@@ -142,30 +94,7 @@ def patch_tag_activate(self, tag_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/tags/{tag_id}/activate"
-    
-    headers = {
-        **self.headers
-    }
-    
-    try:
-        response = requests.patch(url, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Tag activated successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("PATCH", f"/tags/{tag_id}/activate", success_message="Tag activated successfully")
 
 
 def patch_tag_deactivate(self, tag_id: str) -> Dict[str, Any]:
@@ -183,30 +112,7 @@ def patch_tag_deactivate(self, tag_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/tags/{tag_id}/deactivate"
-    
-    headers = {
-        **self.headers
-    }
-    
-    try:
-        response = requests.patch(url, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Tag deactivated successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("PATCH", f"/tags/{tag_id}/deactivate", success_message="Tag deactivated successfully")
 
 
 def delete_tag(self, tag_id: str) -> Dict[str, Any]:
@@ -224,30 +130,7 @@ def delete_tag(self, tag_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/tags/{tag_id}"
-    
-    headers = {
-        **self.headers
-    }
-    
-    try:
-        response = requests.delete(url, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Tag deleted successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("DELETE", f"/tags/{tag_id}", success_message="Tag deleted successfully")
 
 
 def get_conversation_tags(self, conversation_id: str) -> Dict[str, Any]:
@@ -264,20 +147,5 @@ def get_conversation_tags(self, conversation_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/conversations/{conversation_id}/tags"
-    
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/conversations/{conversation_id}/tags")
 
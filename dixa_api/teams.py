@@ -2,9 +2,8 @@
 Teams-related API methods for DixaClient.
 """
 
-import requests
-from typing import Dict, Any, Optional, List
-from requests.exceptions import RequestException, HTTPError
+from typing import Dict, Any, Optional, List, Iterator
+from dixa_api.pagination import iterate_items
 
 
 def get_teams(self) -> Dict[str, Any]:
@@ -18,22 +17,7 @@ def get_teams(self) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/teams"
-    
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", "/teams", revalidate=True)
 
 
 def get_team(self, team_id: str) -> Dict[str, Any]:
@@ -50,22 +34,7 @@ def get_team(self, team_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/teams/{team_id}"
-    
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/teams/{team_id}")
 
 
 def get_team_agents(self, team_id: str) -> Dict[str, Any]:
@@ -82,22 +51,7 @@ def get_team_agents(self, team_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/teams/{team_id}/agents"
-    
-    try:
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/teams/{team_id}/agents")
 
 
 def get_team_presence(
@@ -121,28 +75,43 @@ def get_team_presence(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/teams/{team_id}/presence"
-    
     params = {}
     if page_key:
         params["pageKey"] = page_key
     if page_limit is not None:
         params["pageLimit"] = page_limit
     
-    try:
-        response = requests.get(url, headers=self.headers, params=params if params else None)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/teams/{team_id}/presence", params=params)
+
+
+def iter_team_presence(
+    self,
+    team_id: str,
+    page_limit: Optional[int] = None,
+    prefetch: bool = False,
+    max_items: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the presence status of all agents/admins in a team, following pagination lazily.
+    
+    Args:
+        team_id: The ID of the team (required).
+        page_limit: Optional limit for the number of results per page.
+        prefetch: Fetch the next page in the background while the current one is consumed.
+        max_items: Stop after this many presence entries.
+    
+    Yields:
+        Presence dictionaries, in the same shape as the items of get_team_presence.
+    
+    Raises:
+        HTTPError: If the API returns an HTTP error status (4xx, 5xx).
+        RequestException: If there's an error making the request.
+    """
+    return iterate_items(
+        lambda page_key: self.get_team_presence(team_id=team_id, page_key=page_key, page_limit=page_limit),
+        prefetch=prefetch,
+        max_items=max_items
+    )
 
 
 def create_team(self, name: str) -> Dict[str, Any]:
@@ -159,31 +128,11 @@ def create_team(self, name: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/teams"
-    
     payload = {
         "name": name
     }
-    
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-    
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", "/teams", json=payload)
 
 
 def patch_team_add_agents(
@@ -205,31 +154,11 @@ def patch_team_add_agents(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/teams/{team_id}/agents"
-    
     payload = {
         "agentIds": agent_ids
     }
-    
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-    
-    try:
-        response = requests.patch(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("PATCH", f"/teams/{team_id}/agents", json=payload)
 
 
 def delete_team_remove_agents(
@@ -252,35 +181,16 @@ def delete_team_remove_agents(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/teams/{team_id}/agents"
-    
     payload = {
         "agentIds": agent_ids
     }
-    
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-    
-    try:
-        response = requests.delete(url, json=payload, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Agents removed from team successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request(
+        "DELETE",
+        f"/teams/{team_id}/agents",
+        json=payload,
+        success_message="Agents removed from team successfully"
+    )
 
 
 def delete_team(self, team_id: str) -> Dict[str, Any]:
@@ -298,28 +208,5 @@ def delete_team(self, team_id: str) -> Dict[str, Any]:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/teams/{team_id}"
-    
-    headers = {
-        **self.headers
-    }
-    
-    try:
-        response = requests.delete(url, headers=headers)
-        response.raise_for_status()
-        if response.status_code == 204:
-            return {"success": True, "message": "Team deleted successfully"}
-        if response.content:
-            return response.json()
-        return {"success": True}
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("DELETE", f"/teams/{team_id}", success_message="Team deleted successfully")
 
@@ -2,56 +2,73 @@
 Users-related API methods for DixaClient.
 """
 
-import requests
-from typing import Dict, Any, Optional, List, Literal
-from requests.exceptions import RequestException, HTTPError
+from typing import Dict, Any, Optional, List, Literal, Iterator, Union
+from dixa_api.pagination import iterate_items
+from dixa_api.streaming import StreamedPage
 
 def get_end_users(
     self,
     page_key: Optional[str] = None,
-    page_limit: Optional[int] = None
-) -> Dict[str, Any]:
+    page_limit: Optional[int] = None,
+    stream: bool = False
+) -> Union[Dict[str, Any], StreamedPage]:
     """
     List all end users in an organization.
         
     Args:
         page_key: Base64 encoded form of pagination query parameters (optional).
         page_limit: Maximum number of results per page (optional).
+        stream: Decode the end users incrementally while the body is read (optional).
         
     Returns:
-        Dictionary containing the list of end users.
+        Dictionary containing the list of end users, or a StreamedPage yielding
+        them one at a time when stream is True.
         
     Raises:
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/endusers"
-        
     params = {}
     if page_key:
         params["pageKey"] = page_key
     if page_limit is not None:
         params["pageLimit"] = page_limit
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    if stream:
+        return self._request("GET", "/endusers", params=params, stream_items="data")
+    return self._request("GET", "/endusers", params=params)
+    
+
+
+def iter_end_users(
+    self,
+    page_limit: Optional[int] = None,
+    prefetch: bool = False,
+    max_items: Optional[int] = None,
+    stream: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all end users in an organization, following pagination lazily.
+    
+    Args:
+        page_limit: Maximum number of results per page (optional).
+        prefetch: Fetch the next page in the background while the current one is consumed.
+        max_items: Stop after this many end users.
+        stream: Decode each page incrementally off the socket instead of buffering it.
+            Keeps memory flat for large pages; prefetch is not applied when streaming.
     
+    Yields:
+        End user dictionaries, in the same shape as the items of get_end_users.
+    
+    Raises:
+        HTTPError: If the API returns an HTTP error status (4xx, 5xx).
+        RequestException: If there's an error making the request.
+    """
+    return iterate_items(
+        lambda page_key: self.get_end_users(page_key=page_key, page_limit=page_limit, stream=stream),
+        prefetch=prefetch and not stream,
+        max_items=max_items
+    )
 
 
 def get_end_user(
@@ -71,26 +88,7 @@ def get_end_user(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/endusers/{user_id}"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+    return self._request("GET", f"/endusers/{user_id}")
     
 
 
@@ -129,8 +127,6 @@ def create_end_user(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/endusers"
-        
     payload = {
         "displayName": display_name
     }
@@ -153,26 +149,8 @@ def create_end_user(
         payload["avatarUrl"] = avatar_url
     if external_id:
         payload["externalId"] = external_id
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", "/endusers", json=payload)
     
 
 
@@ -194,31 +172,11 @@ def create_end_users_bulk(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/endusers/bulk"
-        
     payload = {
         "data": end_users
     }
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("POST", "/endusers/bulk", json=payload)
     
 
 
@@ -259,8 +217,6 @@ def patch_end_user(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/endusers/{user_id}"
-        
     payload = {}
         
     if display_name:
@@ -283,26 +239,8 @@ def patch_end_user(
         payload["avatarUrl"] = avatar_url
     if external_id:
         payload["externalId"] = external_id
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.patch(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("PATCH", f"/endusers/{user_id}", json=payload)
     
 
 
@@ -324,31 +262,11 @@ def patch_end_users_bulk(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/endusers/bulk"
-        
     payload = {
         "data": end_users
     }
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.patch(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("PATCH", "/endusers/bulk", json=payload)
     
 
 
@@ -389,8 +307,6 @@ def update_end_user(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/endusers/{user_id}"
-        
     payload = {
         "displayName": display_name
     }
@@ -413,26 +329,8 @@ def update_end_user(
         payload["avatarUrl"] = avatar_url
     if external_id:
         payload["externalId"] = external_id
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.put(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("PUT", f"/endusers/{user_id}", json=payload)
     
 
 
@@ -454,31 +352,11 @@ def update_end_users_bulk(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/endusers/bulk"
-        
     payload = {
         "data": end_users
     }
-        
-    headers = {
-        "Content-Type": "application/json",
-        **self.headers
-    }
-        
-    try:
-        response = requests.put(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("PUT", "/endusers/bulk", json=payload)
     
 
 
@@ -503,35 +381,46 @@ def get_end_user_conversations(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/endusers/{user_id}/conversations"
-        
     params = {}
     if page_key:
         params["pageKey"] = page_key
     if page_limit is not None:
         params["pageLimit"] = page_limit
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("GET", f"/endusers/{user_id}/conversations", params=params)
     
 
 
+def iter_end_user_conversations(
+    self,
+    user_id: str,
+    page_limit: Optional[int] = None,
+    prefetch: bool = False,
+    max_items: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the conversations requested by an end user, following pagination lazily.
+    
+    Args:
+        user_id: The ID of the end user (required).
+        page_limit: Maximum number of results per page (optional).
+        prefetch: Fetch the next page in the background while the current one is consumed.
+        max_items: Stop after this many conversations.
+    
+    Yields:
+        Conversation dictionaries, in the same shape as the items of get_end_user_conversations.
+    
+    Raises:
+        HTTPError: If the API returns an HTTP error status (4xx, 5xx).
+        RequestException: If there's an error making the request.
+    """
+    return iterate_items(
+        lambda page_key: self.get_end_user_conversations(user_id=user_id, page_key=page_key, page_limit=page_limit),
+        prefetch=prefetch,
+        max_items=max_items
+    )
+
+
 def patch_end_user_anonymize(
     self,
     user_id: str,
@@ -551,28 +440,9 @@ def patch_end_user_anonymize(
         HTTPError: If the API returns an HTTP error status (4xx, 5xx).
         RequestException: If there's an error making the request.
     """
-    url = f"{self.base_url}/endusers/{user_id}/anonymize"
-        
     params = {}
     if force:
         params["force"] = "true"
-        
-    headers = {
-        **self.headers
-    }
-        
-    try:
-        response = requests.patch(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
-    except HTTPError as e:
-        error_msg = f"HTTP {response.status_code} error: {e}"
-        try:
-            error_detail = response.json()
-            error_msg += f" - {error_detail}"
-        except ValueError:
-            error_msg += f" - {response.text}"
-        raise HTTPError(error_msg, response=response) from e
-    except RequestException as e:
-        raise RequestException(f"Request failed: {e}") from e
+
+    return self._request("PATCH", f"/endusers/{user_id}/anonymize", params=params)
     
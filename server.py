@@ -1,10 +1,15 @@
+import inspect
 import os
 import sys
 from fastmcp import FastMCP
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Import shared variables - these are the same instances used in tools.base
-from tools.shared import _client_api_key, _api_key
+from tools.shared import _api_key
+from tools.http_auth import http_middleware
+from tools.log import get_logger, sampled
+
+log = get_logger("server")
 
 # Check for API key in command line arguments (for auth config support)
 # Format: python server.py --api-key YOUR_KEY
@@ -15,10 +20,14 @@ if len(sys.argv) > 1 and sys.argv[1] == "--api-key" and len(sys.argv) > 2:
     # Remove the args so FastMCP doesn't see them
     sys.argv = [sys.argv[0]]
 
-# For HTTP/SSE transport, we need to extract Authorization header from requests
+# For HTTP/SSE transport, the Authorization header is read by tools.http_auth (see http_app below)
+# Instructions are sent to every session, so their source indentation is stripped.
+# Tool schemas are dereferenced once at registration (see tools.registry) instead of
+# on every tools/list request.
 mcp = FastMCP(
     "Dixa MCP Server",
-    instructions="""
+    dereference_schemas=False,
+    instructions=inspect.cleandoc("""
         This MCP server provides access to the Dixa API, allowing you to interact with your Dixa organization.
         
         About Dixa:
@@ -36,7 +45,8 @@ mcp = FastMCP(
         - Settings: Manage contact endpoints, business hours schedules and status
         - Conversations: Manage conversations (get, create, add notes, tag, claim, close, anonymize, search, etc.)
         - Custom Attributes: Manage custom attributes for conversations and end users
-        - Analytics: Get aggregated analytics data (metrics, filter values) - requires discovering available metrics first
+        - Analytics: Get aggregated analytics data (metrics, filter values) and server-side breakdowns of analytics records - requires discovering available metrics first
+        - Diagnostics: Latency and Dixa API usage metrics of this MCP server
         
         Important Notes:
         - All modification endpoints (create, update, patch, delete) require explicit user confirmation before execution
@@ -81,350 +91,175 @@ mcp = FastMCP(
            - Step 1: Call `prepare_analytics_metric_query` without metric_id to discover available metrics.
            - Step 2: Call `prepare_analytics_metric_query` with a specific metric_id to get all information needed (filters, aggregations, filter values) in one call.
            - Step 3: Use `fetch_aggregated_data` to fetch the aggregated metric data with your desired filters and aggregations.
-           - Understanding Aggregation Results: For nested/pre-aggregated metrics (e.g., "conversation_assignments_per_agent"), data is first grouped (e.g., by agent) then aggregated. "Count" refers to the number of groups/entries matching filters, NOT the total count of underlying items. "Sum" refers to the total sum across all groups. Example: Count=22 and Sum=1171 for "conversation_assignments_per_agent" means 22 agents have assignments (Count = number of agent groups) and 1171 total assignments across those agents (Sum = total assignments). To get per-agent details, you would need separate calls filtering by individual agent_id for each agent.
+           - Understanding Aggregation Results: For nested/pre-aggregated metrics (e.g., "conversation_assignments_per_agent"), data is first grouped (e.g., by agent) then aggregated. "Count" refers to the number of groups/entries matching filters, NOT the total count of underlying items. "Sum" refers to the total sum across all groups. Example: Count=22 and Sum=1171 for "conversation_assignments_per_agent" means 22 agents have assignments (Count = number of agent groups) and 1171 total assignments across those agents (Sum = total assignments). To get per-agent details, pass `group_by="agent_id"` to `fetch_aggregated_data` instead of making separate calls per agent_id.
+           - Per-group aggregated data: `fetch_aggregated_data` with `group_by` (e.g. "agent_id", "queue_id", "channel") returns one row of aggregates per value of that filter attribute in a single call.
+           - Per-group breakdowns and distributions: Use `prepare_analytics_record_query` with one of the metric's "related_record_ids" to see the record fields, then `aggregate_analytics_records` with `group_by` (e.g. ["agent_id"]) and `aggregations` (e.g. ["count", "avg:<field>", "p90:<field>", "histogram:<field>"]). Records are paged and reduced on the server; only the compact table is returned.
            - Important: Analytics endpoints require a discovery workflow. Always start by calling the prepare tool without IDs to find available metrics, then call it again with specific IDs to get all information, and finally query the data.
-           - Note: Unaggregated data tools are currently disabled. Use aggregated data only.
+           - Note: Raw unaggregated record tools are disabled. Use aggregated data, or `aggregate_analytics_records` for breakdowns.
         
         General Pattern: When a tool requires an ID parameter (tag_id, conversation_id, agent_id, team_id, queue_id, etc.), you must first use the corresponding "list" or "fetch" tool to find that ID. Always check if the entity exists before trying to use it, or add it first if it doesn't exist.
-    """
+    """)
 )
 
-# Add Starlette middleware directly to the HTTP/SSE apps
-# FastMCP middleware runs at MCP protocol level, not HTTP level, so we need HTTP-level middleware
-def setup_http_middleware():
-    """Setup Starlette middleware to extract Authorization header from HTTP requests."""
-    try:
-        from starlette.middleware.base import BaseHTTPMiddleware
-        from starlette.requests import Request
-        from starlette.responses import Response
-        from typing import Callable, Awaitable
-        import sys
-        
-        class AuthExtractionMiddleware(BaseHTTPMiddleware):
-            async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-                # Log that middleware is running
-                print(f"[StarletteMiddleware] Processing request: {request.method} {request.url.path}", file=sys.stderr, flush=True)
-                
-                # Extract Authorization header from HTTP request
-                auth_header = request.headers.get("Authorization", "")
-                if auth_header:
-                    # Remove "Bearer " prefix if present
-                    token = auth_header.replace("Bearer ", "").strip()
-                    if token:
-                        # Store in context variable for use in tools
-                        _client_api_key.set(token)
-                        print(f"[StarletteMiddleware] ✓ Extracted API key from header: {token[:20]}...", file=sys.stderr, flush=True)
-                        print(f"[StarletteMiddleware] Context var set, value: {_client_api_key.get()[:20] if _client_api_key.get() else 'None'}...", file=sys.stderr, flush=True)
-                    else:
-                        print(f"[StarletteMiddleware] Authorization header present but empty after processing", file=sys.stderr, flush=True)
-                else:
-                    # Debug: show all headers to see what we're getting
-                    all_headers = dict(request.headers)
-                    print(f"[StarletteMiddleware] ✗ No Authorization header. All headers: {list(all_headers.keys())}", file=sys.stderr, flush=True)
-                    # Show a few key headers for debugging
-                    for key in ['authorization', 'Authorization', 'x-authorization', 'X-Authorization']:
-                        if key in all_headers:
-                            print(f"[StarletteMiddleware] Found {key}: {all_headers[key][:20]}...", file=sys.stderr, flush=True)
-                
-                response = await call_next(request)
-                
-                # Verify context var is still set after call
-                if _client_api_key.get():
-                    print(f"[StarletteMiddleware] Context var still set after call: {_client_api_key.get()[:20]}...", file=sys.stderr, flush=True)
-                else:
-                    print(f"[StarletteMiddleware] Context var lost after call", file=sys.stderr, flush=True)
-                
-                return response
-        
-        # Try to add middleware to FastMCP's HTTP/SSE apps
-        # These are created when the server starts, so we need to hook into them
-        apps_added = []
-        # Try HTTP app first (preferred), then SSE, then streamable HTTP
-        for app_attr in ['http_app', 'sse_app', 'streamable_http_app']:
-            if hasattr(mcp, app_attr):
-                app = getattr(mcp, app_attr)
-                if app and hasattr(app, 'add_middleware'):
-                    app.add_middleware(AuthExtractionMiddleware)
-                    apps_added.append(app_attr)
-                    print(f"[StarletteMiddleware] Added middleware to {app_attr}", file=sys.stderr, flush=True)
-        
-        if not apps_added:
-            print("[StarletteMiddleware] Could not find app to add middleware to", file=sys.stderr, flush=True)
-            # Try to access through transport after it's created
-            return False
-        return True
-    except Exception as e:
-        import sys
-        print(f"[StarletteMiddleware] Failed to setup: {e}", file=sys.stderr, flush=True)
-        import traceback
-        traceback.print_exc(file=sys.stderr)
-        return False
-
-# Try to setup immediately (might work if apps are already created)
-setup_http_middleware()
-
-# Also try FastMCP middleware as a fallback (though it might not have HTTP header access)
+# Per-tool deadlines, latency and upstream-call metrics.
+# dixa_api is imported on the first tool call, not at startup (see tools.registry).
 try:
+    import time
     from fastmcp.server.middleware import Middleware, MiddlewareContext
-    
-    class AuthExtractionMiddleware(Middleware):
-        """Middleware to extract Authorization header - fallback if HTTP middleware doesn't work."""
-        
+
+    class ToolDeadlineMiddleware(Middleware):
+        """Middleware giving every tool call a time budget shared by all of its Dixa API requests."""
+
         async def on_call_tool(self, context: MiddlewareContext, call_next):
-            """Try to extract Authorization header from context."""
-            import sys
-            # Try to get the Authorization header from the request
-            auth_header = None
-            
-            # Debug: log what's available in context
-            print(f"[FastMCPMiddleware] Context attributes: {dir(context)}", file=sys.stderr, flush=True)
-            
-            # Try different ways to access headers
-            if hasattr(context, 'headers'):
-                auth_header = context.headers.get("Authorization", "")
-                print(f"[FastMCPMiddleware] Found headers attribute", file=sys.stderr, flush=True)
-            elif hasattr(context, 'request'):
-                request = context.request
-                if hasattr(request, 'headers'):
-                    auth_header = request.headers.get("Authorization", "")
-                    print(f"[FastMCPMiddleware] Found request.headers", file=sys.stderr, flush=True)
-            elif hasattr(context, 'scope'):
-                scope = context.scope
-                if isinstance(scope, dict) and 'headers' in scope:
-                    headers = {k.decode(): v.decode() for k, v in scope['headers']}
-                    auth_header = headers.get("authorization", headers.get("Authorization", ""))
-                    print(f"[FastMCPMiddleware] Found scope.headers: {list(headers.keys())[:5]}", file=sys.stderr, flush=True)
-            
-            # Try to access the current ASGI scope from contextvars or task context
+            from dixa_api.deadline import DEFAULT_TOOL_BUDGET, set_deadline, reset_deadline
+            token = set_deadline(DEFAULT_TOOL_BUDGET)
             try:
-                import contextvars
-                # Try to get the current request scope
-                for var in contextvars.copy_context():
-                    if hasattr(var, 'scope') or (isinstance(var, dict) and 'headers' in var):
-                        scope = var if isinstance(var, dict) else getattr(var, 'scope', {})
-                        if isinstance(scope, dict) and 'headers' in scope:
-                            headers = {k.decode(): v.decode() if isinstance(v, bytes) else v 
-                                     for k, v in scope['headers']}
-                            if 'authorization' in headers or 'Authorization' in headers:
-                                auth_header = headers.get("authorization") or headers.get("Authorization")
-                                print(f"[FastMCPMiddleware] Found header in context var", file=sys.stderr, flush=True)
-            except Exception as e:
-                print(f"[FastMCPMiddleware] Error accessing context vars: {e}", file=sys.stderr, flush=True)
-            
-            if auth_header:
-                token = auth_header.replace("Bearer ", "").strip()
-                if token:
-                    _client_api_key.set(token)
-                    print(f"[FastMCPMiddleware] ✓ Extracted API key: {token[:20]}...", file=sys.stderr, flush=True)
-            else:
-                print(f"[FastMCPMiddleware] ✗ No Authorization header found", file=sys.stderr, flush=True)
-            
-            return await call_next(context)
-    
-    # Add the middleware to FastMCP
-    mcp.add_middleware(AuthExtractionMiddleware())
-    import sys
-    print("[FastMCP] Added auth extraction middleware (fallback)", file=sys.stderr, flush=True)
+                return await call_next(context)
+            finally:
+                reset_deadline(token)
+
+    class ToolMetricsMiddleware(Middleware):
+        """Middleware recording wall time and Dixa API usage of every tool call."""
+
+        async def on_call_tool(self, context: MiddlewareContext, call_next):
+            from dixa_api.deadline import remaining
+            from dixa_api.metrics import metrics, start_call, end_call
+            stats, token = start_call()
+            start = time.perf_counter()
+            error = False
+            try:
+                return await call_next(context)
+            except Exception:
+                error = True
+                raise
+            finally:
+                end_call(token)
+                elapsed = time.perf_counter() - start
+                metrics.record_tool(context.message.name, elapsed, stats, error=error,
+                                    budget_remaining=remaining())
+                log.debug("Tool %s %s in %.1f ms: %d Dixa API calls, %d cache hits",
+                          context.message.name, "failed" if error else "finished", elapsed * 1000,
+                          stats.upstream_calls, stats.cache_hits, extra=sampled())
+
+    # The deadline middleware runs first, so the metrics middleware sees the budget
+    mcp.add_middleware(ToolDeadlineMiddleware())
+    mcp.add_middleware(ToolMetricsMiddleware())
 except ImportError:
-    # FastMCP middleware might not be available in all versions
-    import sys
-    print("[FastMCP] FastMCP middleware not available", file=sys.stderr, flush=True)
-except Exception as e:
-    import sys
-    print(f"[FastMCP] Error setting up FastMCP middleware: {e}", file=sys.stderr, flush=True)
+    log.warning("FastMCP middleware not available, tool metrics disabled")
 
-# Monkey-patch the http_app and sse_app properties to add middleware when they're first accessed
-# This way we can intercept app creation even inside run()
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from typing import Callable, Awaitable
 
-class AuthExtractionMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        print(f"[HTTPMiddleware] Processing: {request.method} {request.url.path}", file=sys.stderr, flush=True)
-        auth_header = request.headers.get("Authorization", "")
-        if auth_header:
-            token = auth_header.replace("Bearer ", "").strip()
-            if token:
-                _client_api_key.set(token)
-                print(f"[HTTPMiddleware] ✓ Set API key: {token[:20]}...", file=sys.stderr, flush=True)
-        else:
-            all_headers = dict(request.headers)
-            print(f"[HTTPMiddleware] ✗ No Auth header. Keys: {list(all_headers.keys())[:10]}", file=sys.stderr, flush=True)
-        
-        response = await call_next(request)
-        return response
+# Bearer token for GET /metrics. Metrics cover every API key the process serves, so the
+# route only exists when a token is set, and the tool API keys don't unlock it.
+METRICS_TOKEN = os.getenv("DIXA_MCP_METRICS_TOKEN", "")
+
+if METRICS_TOKEN:
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def prometheus_metrics(request):
+        """Prometheus scrape endpoint (HTTP transport only)."""
+        import hmac
+        from starlette.responses import PlainTextResponse
+        from dixa_api.metrics import render_prometheus
+        if not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {METRICS_TOKEN}"):
+            return PlainTextResponse("Unauthorized", status_code=401, headers={"WWW-Authenticate": "Bearer"})
+        return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+# Serve streamable HTTP without MCP sessions, so any replica can answer any request.
+STATELESS = os.getenv("DIXA_MCP_STATELESS", "").lower() in ("1", "true", "yes")
+
+
+def http_options(transport: str, stateless: bool) -> Dict[str, Any]:
+    """
+    Keyword arguments for mcp.run() / mcp.http_app() serving `transport`.
+    
+    In stateless mode every request carries all it needs: the API key in its
+    Authorization header, and pagination state in the `page_key` cursor (signed with
+    DIXA_CURSOR_SECRET when set, see tools.cursors). No MCP session is created, and
+    responses are plain JSON rather than a per-request SSE stream, so requests can be
+    spread over replicas by a plain L4 balancer and a replica can stop without
+    cutting off a stream.
+    """
+    # Process-wide diagnostics tools would show one caller every other API key's usage
+    mcp.disable(names=set(STDIO_ONLY_TOOLS), components={"tool"})
+    options: Dict[str, Any] = {"transport": transport, "middleware": http_middleware()}
+    if stateless:
+        if transport == "sse":
+            raise SystemExit("Stateless mode requires the http transport: SSE sessions are bound to one process")
+        options.update(stateless_http=True, json_response=True)
+    return options
+
 
-# Store original property getters
-_original_http_app = None
-_original_sse_app = None
-_original_streamable_http_app = None
+def http_app(transport: Optional[str] = None, stateless: Optional[bool] = None):
+    """ASGI app of the HTTP/SSE server, for running it under an external ASGI server.
+    The transport defaults to DIXA_MCP_TRANSPORT, or "http", and stateless mode to
+    DIXA_MCP_STATELESS."""
+    return mcp.http_app(**http_options(transport or os.getenv("DIXA_MCP_TRANSPORT", "http"),
+                                       STATELESS if stateless is None else stateless))
 
-# Monkey-patch property getters to add middleware when apps are accessed
-if hasattr(type(mcp), 'http_app'):
-    _original_http_app = type(mcp).http_app
-    def http_app_with_middleware(self):
-        app = _original_http_app.__get__(self, type(self))
-        if app and hasattr(app, 'add_middleware'):
-            # Check if middleware already added
-            if not hasattr(app, '_auth_middleware_added'):
-                try:
-                    app.add_middleware(AuthExtractionMiddleware)
-                    app._auth_middleware_added = True
-                    print("[MonkeyPatch] Added middleware to http_app", file=sys.stderr, flush=True)
-                except Exception as e:
-                    print(f"[MonkeyPatch] Failed to add middleware to http_app: {e}", file=sys.stderr, flush=True)
-        return app
-    type(mcp).http_app = property(http_app_with_middleware)
 
-if hasattr(type(mcp), 'sse_app'):
-    _original_sse_app = type(mcp).sse_app
-    def sse_app_with_middleware(self):
-        app = _original_sse_app.__get__(self, type(self))
-        if app and hasattr(app, 'add_middleware'):
-            if not hasattr(app, '_auth_middleware_added'):
-                try:
-                    app.add_middleware(AuthExtractionMiddleware)
-                    app._auth_middleware_added = True
-                    print("[MonkeyPatch] Added middleware to sse_app", file=sys.stderr, flush=True)
-                except Exception as e:
-                    print(f"[MonkeyPatch] Failed to add middleware to sse_app: {e}", file=sys.stderr, flush=True)
-        return app
-    type(mcp).sse_app = property(sse_app_with_middleware)
+# Seconds a stopping worker waits for in-flight requests (and open streams) to finish.
+GRACEFUL_SHUTDOWN_SECONDS = float(os.getenv("DIXA_MCP_GRACEFUL_TIMEOUT", "10"))
+# Seconds a replacement worker may take to start during a reload before it is abandoned.
+WORKER_STARTUP_SECONDS = int(os.getenv("DIXA_MCP_WORKER_STARTUP_TIMEOUT", "60"))
 
-if hasattr(type(mcp), 'streamable_http_app'):
-    _original_streamable_http_app = type(mcp).streamable_http_app
-    def streamable_http_app_with_middleware(self):
-        app = _original_streamable_http_app.__get__(self, type(self))
-        if app and hasattr(app, 'add_middleware'):
-            if not hasattr(app, '_auth_middleware_added'):
-                try:
-                    app.add_middleware(AuthExtractionMiddleware)
-                    app._auth_middleware_added = True
-                    print("[MonkeyPatch] Added middleware to streamable_http_app", file=sys.stderr, flush=True)
-                except Exception as e:
-                    print(f"[MonkeyPatch] Failed to add middleware to streamable_http_app: {e}", file=sys.stderr, flush=True)
-        return app
-    type(mcp).streamable_http_app = property(streamable_http_app_with_middleware)
 
-print("[MonkeyPatch] Set up property interceptors for app middleware injection", file=sys.stderr, flush=True)
+def serve_workers(port: int, transport: str, workers: int) -> None:
+    """
+    Serve HTTP from `workers` processes accepting connections on one shared socket.
+    
+    uvicorn's supervisor starts the workers and replaces any that die. On SIGHUP it
+    restarts them one at a time for a graceful reload: each replacement must be up
+    before the old worker is stopped, and a stopping worker finishes its in-flight
+    requests. MCP sessions can't follow a client from one process to another, so the
+    workers run in stateless mode (see http_options), and their response caches share
+    one SQLite file (DIXA_SHARED_CACHE, by default .cache/shared_cache.sqlite).
+    """
+    import uvicorn
+    # Fails before any worker is started
+    http_options(transport, stateless=True)
+    # Inherited by the worker processes, which import this module afresh
+    os.environ["DIXA_MCP_TRANSPORT"] = transport
+    os.environ["DIXA_MCP_STATELESS"] = "true"
+    os.environ.setdefault("DIXA_SHARED_CACHE", os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), ".cache", "shared_cache.sqlite"))
+    uvicorn.run("server:http_app", factory=True, host="0.0.0.0", port=port, workers=workers,
+                timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_SECONDS,
+                timeout_worker_healthcheck=WORKER_STARTUP_SECONDS)
 
-# Import and register tools from the tools package
-from tools.organization import fetch_organization_details
-from tools.agents import fetch_agent_by_id, list_agents, list_agents_presence, list_agent_teams, add_agent, modify_agent_partial, update_agent_full, set_agent_working_channel
-from tools.settings import list_contact_endpoints, fetch_contact_endpoint_by_id, check_business_hours_status, list_business_hours_schedules
-from tools.conversations import fetch_conversation_by_id, list_conversation_flows, list_conversation_activity_log, list_conversation_notes, list_linked_conversations, list_conversation_messages, list_organization_activity_log, list_conversation_ratings, search_conversations, start_conversation, import_conversations, add_conversation_note, add_conversation_notes_bulk, anonymize_conversation, anonymize_conversation_message, tag_conversation_bulk, assign_conversation_to_agent, close_conversation, link_conversation_to_parent, set_conversation_followup_status, reopen_conversation, tag_conversation, remove_tag_from_conversation
-from tools.custom_attributes import fetch_custom_attribute_by_id, list_custom_attributes, update_conversation_custom_attributes, update_end_user_custom_attributes
-from tools.users import list_end_users, fetch_end_user_by_id, add_end_user, add_end_users_bulk, modify_end_user_partial, modify_end_users_bulk, update_end_user_full, update_end_users_bulk, list_end_user_conversations, anonymize_end_user
-from tools.knowledge import list_knowledge_articles, fetch_knowledge_article_by_id, add_knowledge_article, modify_knowledge_article, remove_knowledge_article, list_knowledge_categories, add_knowledge_category
-from tools.queues import list_queues, fetch_queue_by_id, check_queue_availability, check_conversation_queue_position, list_queue_agents, add_queue, assign_agents_to_queue, remove_agents_from_queue
-from tools.tags import list_tags, fetch_tag_by_id, list_conversation_tags, add_tag, activate_tag, deactivate_tag, remove_tag
-from tools.teams import list_teams, fetch_team_by_id, list_team_agents, list_team_presence, add_team, add_agents_to_team, remove_agents_from_team, remove_team
-from tools.analytics import fetch_aggregated_data, prepare_analytics_metric_query
-# NOTE: Unaggregated data tools are commented out to prevent conversation length errors
-# from tools.analytics import fetch_unaggregated_data, prepare_analytics_record_query
 
-# Register tools with FastMCP
-mcp.tool(fetch_organization_details)
-mcp.tool(fetch_agent_by_id)
-mcp.tool(list_agents)
-mcp.tool(list_agents_presence)
-mcp.tool(list_agent_teams)
-mcp.tool(add_agent)
-mcp.tool(modify_agent_partial)
-mcp.tool(update_agent_full)
-mcp.tool(set_agent_working_channel)
-mcp.tool(check_business_hours_status)
-mcp.tool(list_business_hours_schedules)
-mcp.tool(list_contact_endpoints)
-mcp.tool(fetch_contact_endpoint_by_id)
-mcp.tool(fetch_conversation_by_id)
-mcp.tool(list_conversation_flows)
-mcp.tool(list_conversation_activity_log)
-mcp.tool(list_conversation_notes)
-mcp.tool(list_linked_conversations)
-mcp.tool(list_conversation_messages)
-mcp.tool(list_organization_activity_log)
-mcp.tool(list_conversation_ratings)
-mcp.tool(search_conversations)
-mcp.tool(start_conversation)
-mcp.tool(import_conversations)
-mcp.tool(add_conversation_note)
-mcp.tool(add_conversation_notes_bulk)
-mcp.tool(anonymize_conversation)
-mcp.tool(anonymize_conversation_message)
-mcp.tool(update_conversation_custom_attributes)
-mcp.tool(tag_conversation_bulk)
-mcp.tool(assign_conversation_to_agent)
-mcp.tool(close_conversation)
-mcp.tool(link_conversation_to_parent)
-mcp.tool(set_conversation_followup_status)
-mcp.tool(reopen_conversation)
-mcp.tool(tag_conversation)
-mcp.tool(remove_tag_from_conversation)
-mcp.tool(fetch_custom_attribute_by_id)
-mcp.tool(list_custom_attributes)
-mcp.tool(update_end_user_custom_attributes)
-mcp.tool(list_end_users)
-mcp.tool(fetch_end_user_by_id)
-mcp.tool(add_end_user)
-mcp.tool(add_end_users_bulk)
-mcp.tool(modify_end_user_partial)
-mcp.tool(modify_end_users_bulk)
-mcp.tool(update_end_user_full)
-mcp.tool(update_end_users_bulk)
-mcp.tool(list_end_user_conversations)
-mcp.tool(anonymize_end_user)
-mcp.tool(list_knowledge_articles)
-mcp.tool(fetch_knowledge_article_by_id)
-mcp.tool(add_knowledge_article)
-mcp.tool(modify_knowledge_article)
-mcp.tool(remove_knowledge_article)
-mcp.tool(list_knowledge_categories)
-mcp.tool(add_knowledge_category)
-mcp.tool(list_queues)
-mcp.tool(fetch_queue_by_id)
-mcp.tool(check_queue_availability)
-mcp.tool(check_conversation_queue_position)
-mcp.tool(list_queue_agents)
-mcp.tool(add_queue)
-mcp.tool(assign_agents_to_queue)
-mcp.tool(remove_agents_from_queue)
-mcp.tool(list_tags)
-mcp.tool(fetch_tag_by_id)
-mcp.tool(list_conversation_tags)
-mcp.tool(add_tag)
-mcp.tool(activate_tag)
-mcp.tool(deactivate_tag)
-mcp.tool(remove_tag)
-mcp.tool(list_teams)
-mcp.tool(fetch_team_by_id)
-mcp.tool(list_team_agents)
-mcp.tool(list_team_presence)
-mcp.tool(add_team)
-mcp.tool(add_agents_to_team)
-mcp.tool(remove_agents_from_team)
-mcp.tool(remove_team)
-mcp.tool(prepare_analytics_metric_query)
-mcp.tool(fetch_aggregated_data)
-# NOTE: Unaggregated data tools are commented out to prevent conversation length errors
-# mcp.tool(prepare_analytics_record_query)
-# mcp.tool(fetch_unaggregated_data)
+# Register tools from the manifest in tools.registry. Tool modules (and the dixa_api
+# client they use) are imported on first call; JsonTool encodes dict results with the
+# dixa_api codec, and passthrough-capable tools (DIXA_MCP_PASSTHROUGH) have no output schema.
+from tools.registry import STDIO_ONLY_TOOLS, register_tools
+register_tools(mcp)
 
 
 if __name__ == "__main__":
     # For HTTP/SSE transport, use mcp.run() with transport="sse"
     # For subprocess transport (default), just use mcp.run()
     # You can also specify host and port for HTTP server
-    import sys
-    if len(sys.argv) > 1 and sys.argv[1] == "--http":
+    # --workers N (or DIXA_MCP_WORKERS) serves HTTP from N processes
+    # --stateless (or DIXA_MCP_STATELESS) serves HTTP without sessions, for replicas behind a balancer
+    args = sys.argv[1:]
+    workers = int(os.getenv("DIXA_MCP_WORKERS", "0"))
+    if "--workers" in args:
+        index = args.index("--workers")
+        workers = int(args[index + 1])
+        del args[index:index + 2]
+    stateless = STATELESS
+    if "--stateless" in args:
+        args.remove("--stateless")
+        stateless = True
+    if args and args[0] == "--http":
         # Run as HTTP server on port 8000 (default)
-        port = int(sys.argv[2]) if len(sys.argv) > 2 else 8000
+        port = int(args[1]) if len(args) > 1 else 8000
         # Try HTTP transport first (preferred), fallback to SSE if needed
-        transport_type = sys.argv[3] if len(sys.argv) > 3 else "http"
-        # The middleware will be added automatically by our monkey-patched run method
-        mcp.run(transport=transport_type, host="0.0.0.0", port=port)
+        transport_type = args[2] if len(args) > 2 else "http"
+        if workers:
+            serve_workers(port, transport_type, workers)
+        else:
+            # The auth middleware extracts the API key from each request's Authorization header
+            mcp.run(host="0.0.0.0", port=port, **http_options(transport_type, stateless))
     else:
         # Run as subprocess (default for Claude Desktop)
         mcp.run()
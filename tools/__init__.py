@@ -2,13 +2,18 @@
 Tools package for Dixa MCP Server.
 
 This package contains all MCP tools organized by Dixa API categories.
-Each category has its own subdirectory with related tools.
+Each category has its own subdirectory with related tools. The server registers
+them from the manifest in tools.registry, which imports each tool module on first use.
 """
 
-# Import all tools to make them available
-from tools.organization import fetch_organization_details
-
 __all__ = [
     "fetch_organization_details",
 ]
 
+
+def __getattr__(name):
+    # Imported on access, so importing tools.shared or tools.registry stays cheap
+    if name == "fetch_organization_details":
+        from tools.organization import fetch_organization_details
+        return fetch_organization_details
+    raise AttributeError(f"module 'tools' has no attribute {name!r}")
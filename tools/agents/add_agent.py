@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def add_agent(
@@ -56,8 +56,8 @@ async def add_agent(
             }
         }
     """
-    client = get_dixa_client()
-    return client.create_agent(
+    client = get_async_dixa_client()
+    return await client.create_agent(
         display_name=display_name,
         email=email,
         phone_number=phone_number,
@@ -3,7 +3,7 @@ Tool for retrieving agent/admin information from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def fetch_agent_by_id(agent_id: str) -> Dict[str, Any]:
@@ -32,6 +32,6 @@ async def fetch_agent_by_id(agent_id: str) -> Dict[str, Any]:
             }
         }
     """
-    client = get_dixa_client()
-    return client.get_agent(agent_id)
+    client = get_async_dixa_client()
+    return await client.get_agent(agent_id)
 
@@ -3,7 +3,7 @@ Tool for retrieving teams for a specific agent/admin from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_agent_teams(agent_id: str) -> Dict[str, Any]:
@@ -24,6 +24,6 @@ async def list_agent_teams(agent_id: str) -> Dict[str, Any]:
             ]
         }
     """
-    client = get_dixa_client()
-    return client.get_agent_teams(agent_id)
+    client = get_async_dixa_client()
+    return await client.get_agent_teams(agent_id)
 
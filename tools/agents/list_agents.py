@@ -3,7 +3,7 @@ Tool for listing agents/admins from the Dixa API.
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_agents(
@@ -43,8 +43,8 @@ async def list_agents(
             ]
         }
     """
-    client = get_dixa_client()
-    return client.get_agents(
+    client = get_async_dixa_client()
+    return await client.get_agents(
         email=email,
         phone=phone,
         page_key=page_key,
@@ -3,7 +3,7 @@ Tool for listing agent/admin presence status from the Dixa API.
 """
 
 from typing import List, Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_agents_presence() -> List[Dict[str, Any]]:
@@ -24,6 +24,6 @@ async def list_agents_presence() -> List[Dict[str, Any]]:
             ...
         ]
     """
-    client = get_dixa_client()
-    return client.get_agents_presence()
+    client = get_async_dixa_client()
+    return await client.get_agents_presence()
 
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def modify_agent_partial(
@@ -54,8 +54,8 @@ async def modify_agent_partial(
             }
         }
     """
-    client = get_dixa_client()
-    return client.patch_agent(
+    client = get_async_dixa_client()
+    return await client.patch_agent(
         agent_id=agent_id,
         display_name=display_name,
         additional_emails=additional_emails,
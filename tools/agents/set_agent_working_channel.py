@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Literal
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 # Accepted channel values
 ChannelType = Literal["Email", "InteractiveChat", "Messaging", "Speak"]
@@ -32,8 +32,8 @@ async def set_agent_working_channel(
         Dictionary with success status. On success (204), returns {"success": True, "message": "Agent working channel updated successfully"}.
         On error, returns the error response.
     """
-    client = get_dixa_client()
-    return client.update_agent_working_channel(
+    client = get_async_dixa_client()
+    return await client.update_agent_working_channel(
         agent_id=agent_id,
         channel=channel,
         working=working
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def update_agent_full(
@@ -58,8 +58,8 @@ async def update_agent_full(
             }
         }
     """
-    client = get_dixa_client()
-    return client.update_agent(
+    client = get_async_dixa_client()
+    return await client.update_agent(
         agent_id=agent_id,
         display_name=display_name,
         phone_number=phone_number,
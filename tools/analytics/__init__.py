@@ -6,12 +6,14 @@ from tools.analytics.fetch_aggregated_data import fetch_aggregated_data
 # NOTE: Unaggregated data tools are commented out to prevent conversation length errors
 # from tools.analytics.fetch_unaggregated_data import fetch_unaggregated_data
 from tools.analytics.prepare_analytics_metric_query import prepare_analytics_metric_query
-# from tools.analytics.prepare_analytics_record_query import prepare_analytics_record_query
+from tools.analytics.prepare_analytics_record_query import prepare_analytics_record_query
+from tools.analytics.aggregate_analytics_records import aggregate_analytics_records
 
 __all__ = [
     "fetch_aggregated_data",
     # "fetch_unaggregated_data",  # Commented out to prevent conversation length errors
     "prepare_analytics_metric_query",
-    # "prepare_analytics_record_query",  # Commented out to prevent conversation length errors
+    "prepare_analytics_record_query",
+    "aggregate_analytics_records",
 ]
 
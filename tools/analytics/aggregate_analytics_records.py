@@ -0,0 +1,199 @@
+"""
+Tool for aggregating metric records (unaggregated data) server-side.
+"""
+
+import json
+from typing import Dict, Any, Optional, List, Union
+from requests.exceptions import ConnectionError, Timeout
+from urllib3.exceptions import ReadTimeoutError
+from tools.base import get_async_dixa_client
+from tools.analytics.record_aggregator import RecordAccumulator
+
+# Upper bound on records scanned per call, to keep a single tool call bounded in time.
+DEFAULT_MAX_RECORDS = 50000
+
+
+async def aggregate_analytics_records(
+    record_id: str,
+    timezone: str,
+    period_filter: Optional[Union[Dict[str, Any], str]] = None,
+    csid_filter: Optional[Union[List[int], str]] = None,
+    filters: Optional[Union[List[Dict[str, Any]], str]] = None,
+    group_by: Optional[Union[List[str], str]] = None,
+    aggregations: Optional[Union[List[str], str]] = None,
+    histogram_bins: int = 10,
+    max_groups: int = 100,
+    max_records: int = DEFAULT_MAX_RECORDS
+) -> Dict[str, Any]:
+    """
+    Group and aggregate unaggregated analytics records on the server and return only the result.
+
+    This tool pages through ALL metric records matching the query on the server side and reduces
+    them to a compact table, e.g. per-agent counts, averages, percentiles or histograms.
+    The individual records are never returned, so this is safe to use on large datasets.
+
+    Use this instead of making N separate `fetch_aggregated_data` calls (one per agent/queue/channel)
+    when you need a per-group breakdown, or when you need statistics the aggregated endpoint does not
+    offer (percentiles, histograms, distinct counts).
+
+    ⚠️ REQUIRED PREREQUISITES:
+    1. Call `prepare_analytics_metric_query` with a metric_id - its "related_record_ids" lists the record IDs
+       for that metric, and its filters apply to records too.
+    2. Call `prepare_analytics_record_query` with the record_id to see the record fields (fields_metadata)
+       you can group by and aggregate.
+
+    IMPORTANT - Filter Selection (Discriminated Union), same as `fetch_aggregated_data`:
+    - period_filter + filters (required) → csidFilter NOT included
+    - csid_filter + filters (optional) → periodFilter NOT included
+    - filters only → periodFilter and csidFilter NOT included
+
+    Args:
+        record_id: The record identifier (required). Examples: "closed_conversations", "ratings".
+        timezone: IANA timezone name (required). Examples: "Europe/Copenhagen", "UTC".
+        period_filter: Time period filter (PREFERRED). MUST be passed as a dictionary/object.
+            Example: {"_type": "Preset", "value": {"_type": "PreviousWeek"}}
+            When using period_filter, the filters parameter is REQUIRED.
+        csid_filter: Array of conversation IDs (integers). Only used if period_filter is not provided.
+        filters: Array of filter objects, e.g. [{"attribute": "channel", "values": ["email"]}].
+            Each filter's "values" must be a non-empty array.
+        group_by: Record field name(s) to group by (optional), e.g. ["agent_id"] or ["queue_id", "channel"].
+            Without group_by, a single overall row is returned.
+            Labels of grouped fields (e.g. agent names) are included as "<field>_label" when available.
+        aggregations: Aggregations to compute per group (optional, default ["count"]).
+            Format: "<operation>" or "<operation>:<field>". Operations:
+            - "count": number of records in the group
+            - "count_distinct:<field>": number of distinct values of a field
+            - "sum", "avg", "min", "max", "median": over a numeric field, e.g. "avg:handling_time"
+            - "p<N>": percentile of a numeric field, e.g. "p90:first_response_time"
+            - "histogram:<field>": equal-width histogram of a numeric field (see histogram_bins)
+        histogram_bins: Number of bins for histogram aggregations (default 10).
+        max_groups: Maximum number of groups returned, largest first (default 100).
+        max_records: Maximum number of records scanned (default 50000). If reached, "truncated" is true.
+
+    Returns:
+        Dictionary with the aggregated table:
+        {
+            "record_id": "closed_conversations",
+            "records_scanned": 1171,
+            "truncated": false,
+            "group_by": ["agent_id"],
+            "aggregations": ["count", "avg:handling_time"],
+            "total_groups": 22,
+            "groups": [
+                {"agent_id": "a1b2...", "agent_id_label": "Jane Doe", "records": 96, "count": 96, "avg:handling_time": 312.5},
+                ...
+            ]
+        }
+        If the tool's time budget runs out during the scan, the groups cover the records
+        scanned so far, and "partial" and "timed_out" are true. If the connection breaks off
+        after some records were read, "partial" is true and "error" says why.
+
+    Example Usage:
+        # Closed conversations per agent last week, with median handling time
+        aggregate_analytics_records(
+            record_id="closed_conversations",
+            timezone="Europe/Copenhagen",
+            period_filter={"_type": "Preset", "value": {"_type": "PreviousWeek"}},
+            filters=[{"attribute": "channel", "values": ["email", "chat"]}],
+            group_by=["agent_id"],
+            aggregations=["count", "median:handling_time"]
+        )
+    """
+    # Parse JSON strings if provided as strings
+    if period_filter and isinstance(period_filter, str):
+        period_filter = json.loads(period_filter)
+    if csid_filter and isinstance(csid_filter, str):
+        csid_filter = json.loads(csid_filter)
+    if csid_filter and not isinstance(csid_filter, list):
+        csid_filter = None
+    if filters and isinstance(filters, str):
+        filters = json.loads(filters)
+    if filters and not isinstance(filters, list):
+        filters = None
+    if group_by and isinstance(group_by, str):
+        group_by = json.loads(group_by) if group_by.lstrip().startswith("[") else [group_by]
+    if aggregations and isinstance(aggregations, str):
+        aggregations = json.loads(aggregations) if aggregations.lstrip().startswith("[") else [aggregations]
+
+    # Only keep filters with a non-empty values array
+    if filters:
+        filters = [
+            f for f in filters
+            if isinstance(f, dict) and "attribute" in f and isinstance(f.get("values"), list) and f["values"]
+        ] or None
+
+    has_valid_period = period_filter is not None
+    has_valid_csid = bool(csid_filter)
+    has_valid_filters = bool(filters)
+
+    if not has_valid_period and not has_valid_csid and not has_valid_filters:
+        raise ValueError("At least one of period_filter, csid_filter, or filters must be provided. period_filter is the preferred option.")
+    if has_valid_period and not has_valid_filters:
+        raise ValueError("When using period_filter, at least one filter in the filters array is required. Use prepare_analytics_metric_query to discover available filter attributes and values.")
+    if max_records < 1:
+        raise ValueError(f"max_records must be at least 1, but got {max_records}")
+
+    # Validates the aggregation specs before any request is made
+    accumulator = RecordAccumulator(
+        group_by=list(group_by or []),
+        aggregations=list(aggregations or ["count"]),
+        histogram_bins=histogram_bins
+    )
+
+    # Build request based on provided parameters (discriminated union)
+    request = {
+        "id": record_id,
+        "timezone": timezone
+    }
+    if has_valid_period:
+        request["periodFilter"] = period_filter
+        request["filters"] = filters
+    elif has_valid_csid:
+        request["csidFilter"] = csid_filter
+        if has_valid_filters:
+            request["filters"] = filters
+    else:
+        request["filters"] = filters
+
+    client = get_async_dixa_client()
+    truncated = False
+    interrupted: Optional[Exception] = None
+    # Fetch one record past the cap to detect truncation. Pages are decoded incrementally,
+    # so only the accumulated columns (not whole record pages) are held in memory.
+    try:
+        async for record in client.iter_analytics_metric_records(
+            request=request,
+            page_limit=300,
+            max_items=max_records + 1,
+            stream=True
+        ):
+            if accumulator.records < max_records:
+                accumulator.add(record)
+            else:
+                truncated = True
+    except (Timeout, ConnectionError) as e:
+        # The tool's time budget ran out, or the stream broke off mid-page (a read timeout
+        # while a streamed page is decoded surfaces as a ConnectionError); return what has
+        # been accumulated so far. A connection failure before any record is an error.
+        if accumulator.records == 0 and not isinstance(e, Timeout):
+            raise
+        interrupted = e
+
+    result = {
+        "record_id": record_id,
+        "records_scanned": accumulator.records,
+        "truncated": truncated,
+        "group_by": accumulator.group_by,
+        "aggregations": [spec for spec, _, _ in accumulator.aggregations],
+        "total_groups": len(accumulator.groups),
+        "groups": accumulator.results(max_groups=max_groups)
+    }
+    if interrupted is not None:
+        result["partial"] = True
+        if isinstance(interrupted, Timeout) or (interrupted.args and isinstance(interrupted.args[0], ReadTimeoutError)):
+            result["timed_out"] = True
+        else:
+            result["error"] = str(interrupted)
+    if accumulator.skipped_values:
+        result["non_numeric_values_skipped"] = accumulator.skipped_values
+    return result
@@ -0,0 +1,95 @@
+"""
+Concurrent fan-out helpers shared by the analytics tools.
+
+Preparing a metric or record query needs one filter-values lookup per filter attribute.
+These helpers issue those lookups concurrently with a bounded concurrency limit. The
+lookups share the tool call's deadline, so when it runs out the remaining lookups fail
+fast and the tool returns what it has, marked as partial.
+"""
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, TypeVar, Union
+
+from requests.exceptions import Timeout
+
+from dixa_api import AsyncDixaClient
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Maximum number of upstream requests a single tool call may have in flight.
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("DIXA_ANALYTICS_CONCURRENCY", "8"))
+
+
+async def gather_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> List[Union[R, BaseException]]:
+    """
+    Await `func(item)` for every item, running at most `max_concurrency` at a time.
+
+    Args:
+        func: Coroutine function called once per item.
+        items: Items to process.
+        max_concurrency: Maximum number of calls in flight at once.
+
+    Returns:
+        Results in the same order as `items`. A call that raised is represented by
+        its exception, so one failure does not cancel the others.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+
+async def collect_filter_values(
+    client: AsyncDixaClient,
+    filters: List[Dict[str, Any]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> List[Dict[str, Any]]:
+    """
+    Fetch the possible values of every filter attribute of a metric or record.
+
+    Args:
+        client: Client used for the lookups.
+        filters: The "filters" list from a metric or record description.
+        max_concurrency: Maximum number of lookups in flight at once.
+
+    Returns:
+        One entry per filter attribute with its attribute name, description and values.
+        If the values of an attribute can't be fetched, its values list is empty, and
+        if that was because the request timed out, the entry has "timed_out": True.
+    """
+    filter_infos = [f for f in filters or [] if f.get("filterAttribute")]
+    results = await gather_bounded(
+        lambda info: client.get_analytics_filter_values(filter_attribute=info["filterAttribute"]),
+        filter_infos,
+        max_concurrency=max_concurrency,
+    )
+
+    available_filters = []
+    for filter_info, filter_values in zip(filter_infos, results):
+        entry = {
+            "attribute": filter_info["filterAttribute"],
+            "description": filter_info.get("description", ""),
+        }
+        if isinstance(filter_values, BaseException):
+            # If filter values can't be fetched, still include the attribute info
+            entry["values"] = []
+            if isinstance(filter_values, Timeout):
+                entry["timed_out"] = True
+        else:
+            entry["values"] = filter_values.get("data", [])
+        available_filters.append(entry)
+    return available_filters
+
+
+def is_partial(available_filters: List[Dict[str, Any]]) -> bool:
+    """Whether any filter values are missing because the tool ran out of time."""
+    return any(entry.get("timed_out") for entry in available_filters)
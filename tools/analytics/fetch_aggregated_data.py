@@ -4,7 +4,16 @@ Tool for getting metric data (aggregated) from the Dixa Analytics API.
 
 import json
 from typing import Dict, Any, Optional, List, Union
-from tools.base import get_dixa_client
+from requests.exceptions import Timeout
+from tools.base import get_async_dixa_client
+from tools.analytics.fanout import gather_bounded
+from tools.log import get_logger, log_payload
+
+log = get_logger("analytics.fetch_aggregated_data")
+
+# Concurrency for group_by fan-out, kept low to stay under API rate limits
+# (HTTP 429 responses are retried by the client's request scheduler).
+GROUP_BY_MAX_CONCURRENCY = 4
 
 
 async def fetch_aggregated_data(
@@ -13,7 +22,9 @@ async def fetch_aggregated_data(
     period_filter: Optional[Union[Dict[str, Any], str]] = None,
     csid_filter: Optional[Union[List[int], str]] = None,
     filters: Optional[Union[List[Dict[str, Any]], str]] = None,
-    aggregations: Optional[Union[List[str], str]] = None
+    aggregations: Optional[Union[List[str], str]] = None,
+    group_by: Optional[str] = None,
+    max_groups: int = 100
 ) -> Dict[str, Any]:
     """
     Get aggregated metric data from the Dixa Analytics API.
@@ -91,7 +102,8 @@ async def fetch_aggregated_data(
             - When using period_filter: filters is REQUIRED and must contain at least one filter.
             - When using csid_filter: filters is optional.
             - Can be used alone (without period_filter or csid_filter) - must contain at least one filter.
-            - Each filter's "values" must be a non-empty array. Filters with null or empty values are automatically removed.
+            - Each filter's "values" must be a non-empty array. Filters with null or empty values are automatically removed
+              (except a filter on the group_by attribute, which is an error).
             - At least one of period_filter, csid_filter, or filters must be provided.
             You MUST call `prepare_analytics_metric_query` with your metric_id first to build valid filters.
             This tool returns all available filter attributes with their valid values.
@@ -99,6 +111,15 @@ async def fetch_aggregated_data(
         
         aggregations: Aggregation methods to apply (optional). Examples: ["Count", "Percentage", "Average", "Sum"]
             You MUST call `prepare_analytics_metric_query` with your metric_id first to see which aggregations are available.
+        
+        group_by: Filter attribute to break the result down by (optional). Examples: "agent_id", "queue_id", "channel".
+            The metric is fetched once per value of this attribute (values come from the filter values endpoint,
+            the same ones `prepare_analytics_metric_query` lists) and returned as one compact table.
+            If `filters` already contains this attribute, only those values are used as groups; that filter
+            must have a non-empty "values" array.
+            When group_by is set, period_filter does not need any other filter.
+        
+        max_groups: Maximum number of group values queried when group_by is set (default 100).
     
     Returns:
         Dictionary containing aggregated metric data:
@@ -141,9 +162,23 @@ async def fetch_aggregated_data(
         - Count = 22: There are 22 agents with conversation assignments (number of agent groups)
         - Sum = 1171: There are 1171 total conversation assignments across those 22 agents
         
-        ⚠️ LIMITATION: To get per-agent breakdowns (e.g., how many assignments each individual agent has),
-        you currently need to make N separate calls filtering by individual agent_id for each agent.
-        The aggregated endpoint does not provide per-group breakdowns in a single call.
+        PER-GROUP BREAKDOWNS: To get per-agent breakdowns (e.g., how many assignments each individual agent has),
+        pass group_by="agent_id". The response then contains one row per agent:
+        {
+            "data": {
+                "id": "conversation_assignments_per_agent",
+                "group_by": "agent_id",
+                "groups": [
+                    {"value": "a1b2...", "label": "Jane Doe", "aggregates": {"Count": 1, "Sum": 96.0}},
+                    ...
+                ],
+                "total_groups": 22,
+                "truncated": false,
+                "errors": []
+            }
+        }
+        Groups are sorted by their first aggregate value (largest first). Groups whose request failed
+        are listed in "errors".
     
     Example Usage:
         # Get closed conversations count for last week (filters required when using period_filter)
@@ -179,6 +214,15 @@ async def fetch_aggregated_data(
             csid_filter=[12345, 12346, 12347],
             filters=[{"attribute": "channel", "values": ["email"]}]  # Optional when using csid_filter
         )
+        
+        # Per-agent breakdown of assignments last week, in one call
+        fetch_aggregated_data(
+            metric_id="conversation_assignments_per_agent",
+            timezone="Europe/Copenhagen",
+            period_filter={"_type": "Preset", "value": {"_type": "PreviousWeek"}},
+            aggregations=["Sum"],
+            group_by="agent_id"
+        )
     """
     # Parse JSON strings if provided as strings
     if period_filter and isinstance(period_filter, str):
@@ -204,8 +248,10 @@ async def fetch_aggregated_data(
         for filter_obj in filters:
             if isinstance(filter_obj, dict) and "attribute" in filter_obj:
                 values = filter_obj.get("values")
-                # Only include filter if values is a non-empty array
-                if isinstance(values, list) and len(values) > 0:
+                # Only include filter if values is a non-empty array. A filter on the
+                # group_by attribute is kept, so one without values is reported instead
+                # of silently grouping by every value
+                if isinstance(values, list) and len(values) > 0 or (group_by and filter_obj["attribute"] == group_by):
                     validated_filters.append(filter_obj)
         filters = validated_filters if validated_filters else None
     
@@ -213,12 +259,14 @@ async def fetch_aggregated_data(
     has_valid_csid = csid_filter and isinstance(csid_filter, list) and len(csid_filter) > 0
     has_valid_period = period_filter is not None
     has_valid_filters = filters and isinstance(filters, list) and len(filters) > 0
+    # With group_by, every group request carries a filter on the group_by attribute
+    has_group_filter = bool(group_by)
     
-    if not has_valid_period and not has_valid_csid and not has_valid_filters:
+    if not has_valid_period and not has_valid_csid and not has_valid_filters and not has_group_filter:
         raise ValueError("At least one of period_filter, csid_filter, or filters must be provided. period_filter is the preferred option.")
     
     # Validate that when using periodFilter, at least one filter is required
-    if has_valid_period and not has_valid_filters:
+    if has_valid_period and not has_valid_filters and not has_group_filter:
         raise ValueError("When using period_filter, at least one filter in the filters array is required. Use prepare_analytics_metric_query to discover available filter attributes and values.")
     
     # The API uses a discriminated union with three possible structures:
@@ -279,9 +327,80 @@ async def fetch_aggregated_data(
         request["aggregations"] = aggregations
     
     # Log the exact payload being sent
-    payload_json = json.dumps(request, indent=2)
-    print(f"[fetch_aggregated_data] Request payload:\n{payload_json}")
+    log_payload(log, "Request payload", request)
     
-    client = get_dixa_client()
-    return client.post_analytics_metric_data(request=request)
+    client = get_async_dixa_client()
+    if group_by:
+        return await _fetch_grouped(client, request, group_by, filters or [], max_groups)
+    return await client.post_analytics_metric_data(request=request)
+
+
+async def _fetch_grouped(
+    client,
+    request: Dict[str, Any],
+    group_by: str,
+    filters: List[Dict[str, Any]],
+    max_groups: int
+) -> Dict[str, Any]:
+    """Fetch the metric once per value of the group_by attribute and merge the results into one table."""
+    # If the caller already filters on the group_by attribute, only those values become groups
+    base_filters = [f for f in filters if f.get("attribute") != group_by]
+    group_filter = next((f for f in filters if f.get("attribute") == group_by), None)
+    requested = group_filter.get("values") if group_filter is not None else None
+    if group_filter is not None and not (isinstance(requested, list) and requested):
+        raise ValueError(f"The filter on group_by attribute '{group_by}' must have a non-empty 'values' list. Remove it to group by every value of '{group_by}'.")
+    
+    # Group values (and their labels) come from the filter values endpoint, which is
+    # paginated: every page is read, so no group is dropped and total_groups is exact
+    labels: Dict[Any, Any] = {}
+    async for item in client.iter_analytics_filter_values(filter_attribute=group_by):
+        if isinstance(item, dict):
+            labels[item.get("value")] = item.get("label")
+        else:
+            labels[item] = None
+    
+    values = list(requested) if requested is not None else list(labels)
+    if not values:
+        raise ValueError(f"No values found for group_by attribute '{group_by}'. Use prepare_analytics_metric_query to check the available filter attributes.")
+    
+    total_groups = len(values)
+    values = values[:max_groups]
+    
+    async def fetch_group(value: Any) -> Dict[str, Any]:
+        group_request = dict(request)
+        group_request["filters"] = base_filters + [{"attribute": group_by, "values": [value]}]
+        return await client.post_analytics_metric_data(request=group_request)
+    
+    results = await gather_bounded(fetch_group, values, max_concurrency=GROUP_BY_MAX_CONCURRENCY)
+    
+    groups = []
+    errors = []
+    for value, result in zip(values, results):
+        if isinstance(result, BaseException):
+            errors.append({"value": value, "label": labels.get(value), "error": str(result)})
+            continue
+        aggregates = {
+            aggregate.get("measure"): aggregate.get("value")
+            for aggregate in (result.get("data") or {}).get("aggregates", [])
+        }
+        groups.append({"value": value, "label": labels.get(value), "aggregates": aggregates})
+    
+    def sort_key(group: Dict[str, Any]):
+        first = next(iter(group["aggregates"].values()), None)
+        return (first is None, -first if isinstance(first, (int, float)) else 0)
+    
+    groups.sort(key=sort_key)
+    
+    return {
+        "data": {
+            "id": request["id"],
+            "group_by": group_by,
+            "groups": groups,
+            "total_groups": total_groups,
+            "truncated": total_groups > len(values),
+            # Groups are missing because the tool's time budget ran out
+            "partial": any(isinstance(result, Timeout) for result in results),
+            "errors": errors
+        }
+    }
 
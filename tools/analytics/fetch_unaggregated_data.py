@@ -4,7 +4,10 @@ Tool for getting metric records data (unaggregated) from the Dixa Analytics API.
 
 import json
 from typing import Dict, Any, Optional, List, Union
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
+from tools.log import get_logger, log_payload
+
+log = get_logger("analytics.fetch_unaggregated_data")
 
 
 async def fetch_unaggregated_data(
@@ -258,7 +261,7 @@ async def fetch_unaggregated_data(
     
     Remember: The full response data is always available in the tool response. You don't need to store everything in context - extract and summarize what's needed to answer the user's question efficiently.
     """
-    client = get_dixa_client()
+    client = get_async_dixa_client()
     
     # Validate page_limit if provided (only when page_key is not provided)
     # When page_key is provided, page_limit is optional and not validated strictly
@@ -366,21 +369,19 @@ async def fetch_unaggregated_data(
         request["filters"] = filters
     
     # Log the exact payload being sent
-    payload_json = json.dumps(request, indent=2)
     if page_key:
-        print(f"[fetch_unaggregated_data] Using page_key for pagination (POST request with same payload + pageKey query param)")
+        log.debug("Using page_key for pagination (POST request with same payload + pageKey query param)")
     else:
-        print(f"[fetch_unaggregated_data] Request payload:\n{payload_json}")
+        log_payload(log, "Request payload", request)
     
-    result = client.post_analytics_metric_records_data(
+    result = await client.post_analytics_metric_records_data(
         request=request,
         page_key=page_key,
         page_limit=page_limit
     )
     
     # Log the response
-    response_json = json.dumps(result, indent=2)
-    print(f"[fetch_unaggregated_data] Response:\n{response_json}")
+    log_payload(log, "Response", result)
     
     return result
 
@@ -2,9 +2,12 @@
 Tool for preparing analytics metric queries by gathering all required information in one call.
 """
 
-import json
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
+from tools.log import get_logger, log_payload
+from tools.analytics.fanout import collect_filter_values, is_partial
+
+log = get_logger("analytics.prepare_analytics_metric_query")
 
 
 async def prepare_analytics_metric_query(metric_id: Optional[str] = None, page_key: Optional[str] = None, page_limit: Optional[int] = None) -> Dict[str, Any]:
@@ -62,40 +65,22 @@ async def prepare_analytics_metric_query(metric_id: Optional[str] = None, page_k
             "related_record_ids": ["closed_conversations"]
         }
     """
-    client = get_dixa_client()
+    client = get_async_dixa_client()
     
     # If no metric_id provided, list all available metrics
     if metric_id is None:
-        result = client.get_analytics_metrics_catalogue(
+        result = await client.get_analytics_metrics_catalogue(
             page_key=page_key,
             page_limit=page_limit
         )
-        print(f"[prepare_analytics_metric_query] Response (listing all metrics):\n{json.dumps(result, indent=2)}")
+        log_payload(log, "Response (listing all metrics)", result)
         return result
     
     # Step 1: Get metric details
-    metric_details = client.get_analytics_metric_description(metric_id=metric_id)
+    metric_details = await client.get_analytics_metric_description(metric_id=metric_id)
     
-    # Step 2: Get filter values for all available filter attributes
-    available_filters = []
-    if "filters" in metric_details.get("data", {}):
-        for filter_info in metric_details["data"]["filters"]:
-            filter_attribute = filter_info.get("filterAttribute")
-            if filter_attribute:
-                try:
-                    filter_values = client.get_analytics_filter_values(filter_attribute=filter_attribute)
-                    available_filters.append({
-                        "attribute": filter_attribute,
-                        "description": filter_info.get("description", ""),
-                        "values": filter_values.get("data", [])
-                    })
-                except Exception:
-                    # If filter values can't be fetched, still include the attribute info
-                    available_filters.append({
-                        "attribute": filter_attribute,
-                        "description": filter_info.get("description", ""),
-                        "values": []
-                    })
+    # Step 2: Get filter values for all available filter attributes (fetched concurrently)
+    available_filters = await collect_filter_values(client, metric_details.get("data", {}).get("filters", []))
     
     # Build comprehensive response
     result = {
@@ -105,7 +90,10 @@ async def prepare_analytics_metric_query(metric_id: Optional[str] = None, page_k
         "available_aggregations": metric_details.get("data", {}).get("aggregations", []),
         "related_record_ids": metric_details.get("data", {}).get("relatedRecordIds", [])
     }
+    if is_partial(available_filters):
+        # The tool's time budget ran out before every filter's values were fetched
+        result["partial"] = True
     
-    print(f"[prepare_analytics_metric_query] Response (metric_id={metric_id}):\n{json.dumps(result, indent=2)}")
+    log_payload(log, f"Response (metric_id={metric_id})", result)
     return result
 
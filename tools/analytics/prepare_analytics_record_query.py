@@ -3,25 +3,27 @@ Tool for preparing analytics record queries by gathering all required informatio
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
+from tools.analytics.fanout import collect_filter_values, is_partial
 
 
 async def prepare_analytics_record_query(record_id: Optional[str] = None, page_key: Optional[str] = None, page_limit: Optional[int] = None) -> Dict[str, Any]:
     """
-    Prepare all information needed to build a valid payload for fetch_unaggregated_data.
+    Prepare all information needed to build a valid payload for aggregate_analytics_records.
     
     🚨 MANDATORY: You MUST first use `prepare_analytics_metric_query` and `fetch_aggregated_data` before using this tool.
     Aggregated data is faster, more efficient, and usually provides the insights you need.
-    Only use this tool if you have already tried aggregated data and determined it's insufficient for your needs.
+    Only use this tool if you have already tried aggregated data and determined it's insufficient for your needs
+    (e.g. you need a per-agent/per-queue breakdown, percentiles or histograms).
     
-    🔄 When using `fetch_unaggregated_data`, remember to paginate through ALL pages to collect complete datasets.
-    Check for "pageKey" in responses and continue making calls until all data is collected.
+    The "fields_metadata" in the response lists the record fields you can use as `group_by` fields and
+    aggregation fields in `aggregate_analytics_records`.
     
     This tool combines multiple prerequisite calls into a single operation:
     - If record_id is not provided: Lists all available records (replaces list_analytics_records)
     - If record_id is provided: Fetches record details (available filters and field metadata) and filter values
     
-    Use this tool BEFORE calling fetch_unaggregated_data to get all required information
+    Use this tool BEFORE calling aggregate_analytics_records to get all required information
     needed to construct a valid request payload.
     
     Args:
@@ -63,38 +65,20 @@ async def prepare_analytics_record_query(record_id: Optional[str] = None, page_k
             "related_metric_ids": ["closed_conversations"]
         }
     """
-    client = get_dixa_client()
+    client = get_async_dixa_client()
     
     # If no record_id provided, list all available records
     if record_id is None:
-        return client.get_analytics_records_catalogue(
+        return await client.get_analytics_records_catalogue(
             page_key=page_key,
             page_limit=page_limit
         )
     
     # Step 1: Get record details
-    record_details = client.get_analytics_record_description(record_id=record_id)
+    record_details = await client.get_analytics_record_description(record_id=record_id)
     
-    # Step 2: Get filter values for all available filter attributes
-    available_filters = []
-    if "filters" in record_details.get("data", {}):
-        for filter_info in record_details["data"]["filters"]:
-            filter_attribute = filter_info.get("filterAttribute")
-            if filter_attribute:
-                try:
-                    filter_values = client.get_analytics_filter_values(filter_attribute=filter_attribute)
-                    available_filters.append({
-                        "attribute": filter_attribute,
-                        "description": filter_info.get("description", ""),
-                        "values": filter_values.get("data", [])
-                    })
-                except Exception:
-                    # If filter values can't be fetched, still include the attribute info
-                    available_filters.append({
-                        "attribute": filter_attribute,
-                        "description": filter_info.get("description", ""),
-                        "values": []
-                    })
+    # Step 2: Get filter values for all available filter attributes (fetched concurrently)
+    available_filters = await collect_filter_values(client, record_details.get("data", {}).get("filters", []))
     
     # Build comprehensive response
     result = {
@@ -104,6 +88,9 @@ async def prepare_analytics_record_query(record_id: Optional[str] = None, page_k
         "fields_metadata": record_details.get("data", {}).get("fieldsMetadata", []),
         "related_metric_ids": record_details.get("data", {}).get("relatedMetricIds", [])
     }
+    if is_partial(available_filters):
+        # The tool's time budget ran out before every filter's values were fetched
+        result["partial"] = True
     
     return result
 
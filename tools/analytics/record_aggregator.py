@@ -0,0 +1,225 @@
+"""
+Columnar accumulator for unaggregated analytics records.
+
+Records from the metric records endpoint are streamed into per-group numeric columns,
+so only the group-by keys and the aggregated fields are kept in memory. The
+accumulator then reduces those columns to counts, sums, averages, percentiles
+and histograms.
+"""
+
+import json
+import math
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+# Operations that need no field ("count") or take one ("avg:handling_time")
+SIMPLE_OPERATIONS = ("count", "count_distinct", "sum", "avg", "min", "max", "median", "histogram")
+
+
+def flatten_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten a metric record to a {field name: value} mapping.
+
+    The primary timestamp is included under its field name, and field labels
+    are added under "<name>_label" when present.
+    """
+    row: Dict[str, Any] = {}
+    primary = record.get("primaryTimestampField") or {}
+    if primary.get("name"):
+        row[primary["name"]] = primary.get("timestamp")
+    for entry in record.get("fields") or []:
+        name = entry.get("name")
+        field = entry.get("field") or {}
+        if not name:
+            continue
+        row[name] = field.get("value")
+        if field.get("label") is not None:
+            row[f"{name}_label"] = field["label"]
+    return row
+
+
+def hashable(value: Any) -> Any:
+    """
+    A hashable stand-in for a field value, for group keys and distinct sets.
+
+    List and dict values (e.g. a tags field) become a ("json", <canonical JSON>) tuple,
+    which can't equal any scalar field value; other values are returned unchanged.
+    """
+    if isinstance(value, (list, dict)):
+        return ("json", json.dumps(value, sort_keys=True, separators=(",", ":"), default=str))
+    return value
+
+
+def parse_aggregation(spec: str) -> Tuple[str, Optional[str]]:
+    """
+    Parse an aggregation spec such as "count", "avg:rating" or "p90:handling_time".
+
+    Returns:
+        The operation and the field it applies to (None for "count").
+
+    Raises:
+        ValueError: If the spec is malformed or the operation is unknown.
+    """
+    op, _, field = spec.partition(":")
+    op = op.strip().lower()
+    field = field.strip() or None
+    is_percentile = op.startswith("p") and op[1:].replace(".", "", 1).isdigit()
+    if op not in SIMPLE_OPERATIONS and not is_percentile:
+        raise ValueError(
+            f"Unknown aggregation '{spec}'. Use one of {', '.join(SIMPLE_OPERATIONS)} "
+            "or a percentile such as p50/p90/p99, followed by ':<field>' (e.g. 'avg:rating')."
+        )
+    if is_percentile and not 0 <= float(op[1:]) <= 100:
+        raise ValueError(f"Percentile in '{spec}' must be between 0 and 100")
+    if op != "count" and field is None:
+        raise ValueError(f"Aggregation '{spec}' needs a field, e.g. '{op}:<field>'")
+    return op, field
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Return the pct-th percentile of already sorted values, interpolating linearly."""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return sorted_values[low]
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def histogram(values: List[float], bins: int) -> List[Dict[str, Any]]:
+    """Bucket values into `bins` equal-width bins between their minimum and maximum."""
+    if not values:
+        return []
+    low, high = min(values), max(values)
+    if low == high:
+        return [{"start": low, "end": high, "count": len(values)}]
+    width = (high - low) / bins
+    counts = [0] * bins
+    for value in values:
+        counts[min(int((value - low) / width), bins - 1)] += 1
+    return [
+        {"start": low + i * width, "end": low + (i + 1) * width, "count": count}
+        for i, count in enumerate(counts)
+    ]
+
+
+class _Group:
+    """Columns accumulated for one group-by key."""
+
+    __slots__ = ("count", "values", "labels", "numeric", "distinct")
+
+    def __init__(self, values: Tuple[Any, ...]) -> None:
+        self.count = 0
+        # The group-by values as they appeared in the first record (the key may be hashable() forms)
+        self.values = values
+        self.labels: Dict[str, Any] = {}
+        self.numeric: Dict[str, array] = {}
+        self.distinct: Dict[str, set] = {}
+
+
+class RecordAccumulator:
+    """Streams flattened records into per-group columns and reduces them on demand."""
+
+    def __init__(self, group_by: List[str], aggregations: List[str], histogram_bins: int = 10):
+        """
+        Initialize the accumulator.
+
+        Args:
+            group_by: Field names to group by (empty for a single overall group).
+            aggregations: Aggregation specs, see parse_aggregation.
+            histogram_bins: Number of bins used by "histogram" aggregations.
+
+        Raises:
+            ValueError: If an aggregation spec is invalid.
+        """
+        self.group_by = group_by
+        self.aggregations = [(spec, *parse_aggregation(spec)) for spec in aggregations]
+        self.histogram_bins = max(1, histogram_bins)
+        self.numeric_fields = sorted({f for _, op, f in self.aggregations if f and op != "count_distinct"})
+        self.distinct_fields = sorted({f for _, op, f in self.aggregations if op == "count_distinct"})
+        self.groups: Dict[Tuple[Any, ...], _Group] = {}
+        self.records = 0
+        self.skipped_values = 0
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Add one raw metric record."""
+        row = flatten_record(record)
+        values = tuple(row.get(field) for field in self.group_by)
+        key = tuple(hashable(value) for value in values)
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = _Group(values)
+            for field in self.group_by:
+                if row.get(f"{field}_label") is not None:
+                    group.labels[f"{field}_label"] = row[f"{field}_label"]
+        group.count += 1
+        self.records += 1
+        for field in self.numeric_fields:
+            value = row.get(field)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                if value is not None:
+                    self.skipped_values += 1
+                continue
+            column = group.numeric.get(field)
+            if column is None:
+                column = group.numeric[field] = array("d")
+            column.append(value)
+        for field in self.distinct_fields:
+            value = row.get(field)
+            if value is not None:
+                group.distinct.setdefault(field, set()).add(hashable(value))
+
+    def _reduce(self, group: _Group) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        sorted_cache: Dict[str, List[float]] = {}
+        for spec, op, field in self.aggregations:
+            if op == "count":
+                result[spec] = group.count if field is None else len(group.numeric.get(field, ()))
+                continue
+            if op == "count_distinct":
+                result[spec] = len(group.distinct.get(field, ()))
+                continue
+            values = group.numeric.get(field)
+            if not values:
+                result[spec] = [] if op == "histogram" else None
+            elif op == "sum":
+                result[spec] = math.fsum(values)
+            elif op == "avg":
+                result[spec] = math.fsum(values) / len(values)
+            elif op == "min":
+                result[spec] = min(values)
+            elif op == "max":
+                result[spec] = max(values)
+            elif op == "histogram":
+                result[spec] = histogram(values, self.histogram_bins)
+            else:
+                if field not in sorted_cache:
+                    sorted_cache[field] = sorted(values)
+                pct = 50.0 if op == "median" else float(op[1:])
+                result[spec] = percentile(sorted_cache[field], pct)
+        return result
+
+    def results(self, max_groups: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Reduce every group to its aggregates.
+
+        Args:
+            max_groups: Return only the largest groups (by record count).
+
+        Returns:
+            One row per group with the group-by values, their labels, "records" and
+            one key per aggregation spec, sorted by record count (largest first).
+        """
+        ordered = sorted(self.groups.items(), key=lambda item: item[1].count, reverse=True)
+        if max_groups is not None:
+            ordered = ordered[:max_groups]
+        rows = []
+        for _, group in ordered:
+            row: Dict[str, Any] = dict(zip(self.group_by, group.values))
+            row.update(group.labels)
+            row["records"] = group.count
+            row.update(self._reduce(group))
+            rows.append(row)
+        return rows
@@ -6,83 +6,276 @@ API key extraction and DixaClient initialization.
 """
 
 import os
-import sys
-from typing import Optional
-from dixa_api import DixaClient
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from fastmcp.tools import FunctionTool, ToolResult
+from mcp.types import TextContent
+from dixa_api import DixaClient, AsyncDixaClient
+from dixa_api.codec import RawJson, codec
+from dixa_api.metrics import metrics
 
 # Import shared variables - these are the same instances used in server.py
-from tools.shared import _client_api_key, _api_key
+from tools import cursors, shared
+from tools.shared import Credential, _client_api_key
+from tools.http_auth import request_credential
+from tools.log import get_logger, sampled
 
+log = get_logger("auth")
 
-def get_api_key() -> str:
+# Most API keys with a live client; the least recently used client is closed beyond this.
+MAX_CLIENTS = int(os.getenv("DIXA_MCP_MAX_CLIENTS", "256"))
+# Seconds after which an unused client is closed (0 keeps clients until evicted).
+CLIENT_IDLE_SECONDS = float(os.getenv("DIXA_MCP_CLIENT_IDLE_SECONDS", "600"))
+
+# Opt-in: read tools whose result is the unmodified upstream body forward it undecoded
+PASSTHROUGH = os.getenv("DIXA_MCP_PASSTHROUGH", "").lower() in ("1", "true", "yes")
+
+# The --api-key / DIXA_API_KEY credential, resolved on first use
+_fallback_credential: Optional[Credential] = None
+
+
+def _resolve_fallback() -> Optional[Credential]:
+    global _fallback_credential
+    if _fallback_credential is None:
+        api_key = shared._api_key or os.getenv("DIXA_API_KEY")
+        if api_key:
+            _fallback_credential = Credential(api_key)
+            log.debug("Using API key %s from %s", _fallback_credential.label,
+                      "cmdline" if shared._api_key else "env")
+    return _fallback_credential
+
+
+def get_credential() -> Credential:
     """
-    Get the API key from various sources in priority order:
+    Get the credential (API key and its fingerprint) of the current tool call, from
+    these sources in priority order:
     1. HTTP Authorization header (for remote HTTP/SSE servers)
     2. Context variable (from middleware)
     3. Command-line argument
     4. Environment variable
     
+    The header is parsed once per HTTP request by tools.http_auth, and the command-line
+    and environment key once per process, so this is a few attribute lookups per call.
+    
     Returns:
-        The API key string.
+        The resolved Credential.
         
     Raises:
         ValueError: If no API key is found in any source.
     """
-    # Try to get headers from the HTTP request using FastMCP's built-in function
-    api_key_from_header = None
-    try:
-        from fastmcp.server.dependencies import get_http_headers
-        headers = get_http_headers()
-        if headers:
-            # Headers are typically lowercase in HTTP
-            auth_header = headers.get("authorization") or headers.get("Authorization", "")
-            if auth_header:
-                # Remove "Bearer " prefix if present
-                api_key_from_header = auth_header.replace("Bearer ", "").strip()
-                # Debug logging
-                import sys
-                print(f"[tools.base] ✓ Extracted API key from HTTP headers: {api_key_from_header[:20]}...", file=sys.stderr, flush=True)
-    except (ImportError, Exception) as e:
-        # Debug logging
-        import sys
-        print(f"[tools.base] Could not get HTTP headers: {e}", file=sys.stderr, flush=True)
-    
-    # Priority: HTTP header > context var (from middleware) > command-line arg > env var
-    final_api_key = (
-        api_key_from_header or
-        _client_api_key.get() or 
-        _api_key or 
-        os.getenv("DIXA_API_KEY")
-    )
-    
-    # Debug logging
-    import sys
-    if final_api_key:
-        auth_source = "http_header" if api_key_from_header else ("context_var" if _client_api_key.get() else ("cmdline" if _api_key else "env"))
-        print(f"[tools.base] Using API key from: {auth_source}", file=sys.stderr, flush=True)
-    else:
-        print(f"[tools.base] No API key found. Context var: {_client_api_key.get()}, Cmdline: {_api_key}, Env: {os.getenv('DIXA_API_KEY') is not None}", file=sys.stderr, flush=True)
-    
-    if not final_api_key:
+    credential = request_credential()
+    source = "header"
+    if credential is None:
+        api_key = _client_api_key.get()
+        source = "context" if api_key else "fallback"
+        credential = Credential(api_key) if api_key else _resolve_fallback()
+    if credential is None:
+        log.warning("No API key found in the Authorization header, --api-key or DIXA_API_KEY")
         raise ValueError(
             "API key is required but not found. "
             "For remote servers, ensure the Authorization header is set in your Claude Desktop config. "
             "For local servers, set DIXA_API_KEY environment variable or use --api-key command-line argument."
         )
+    log.debug("Tool call uses API key %s from %s", credential, source, extra=sampled())
+    return credential
+
+
+def get_api_key() -> str:
+    """
+    Get the API key of the current tool call (see get_credential for the sources).
     
-    return final_api_key
+    Returns:
+        The API key string.
+        
+    Raises:
+        ValueError: If no API key is found in any source.
+    """
+    return get_credential().api_key
+
+
+class _ClientEntry:
+    __slots__ = ("client", "async_client", "last_used", "in_use", "evicted")
+
+    def __init__(self, client: DixaClient, now: float):
+        self.client = client
+        self.async_client = AsyncDixaClient(client=client)
+        self.last_used = now
+        # Tool calls still using the client, and whether the registry has dropped it;
+        # a dropped client is closed once the last of those calls releases it
+        self.in_use = 0
+        self.evicted = False
+
+
+# Entries looked up by the tool call in progress (see JsonTool.run), released when it ends
+_call_entries: ContextVar[Optional[List[_ClientEntry]]] = ContextVar("call_entries", default=None)
+
+
+class ClientRegistry:
+    """
+    Ready clients per API key fingerprint, in least recently used order.
+    
+    A lookup moves its client to the end; clients that have not been used for
+    `idle_seconds` are closed from the front on later lookups, as is the least recently
+    used client once more than `max_clients` keys have one. A lookup inside a tool call
+    holds the entry until the call ends (release), and a client dropped while a call
+    holds it is only closed then, so a long call never has its connections closed.
+    """
+
+    def __init__(self, max_clients: int = MAX_CLIENTS, idle_seconds: float = CLIENT_IDLE_SECONDS):
+        self.max_clients = max(1, max_clients)
+        self.idle_seconds = idle_seconds
+        self._entries: "OrderedDict[str, _ClientEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_reap = 0.0
+
+    def get(self, credential: Credential) -> _ClientEntry:
+        """The entry for a credential, creating its client on first use."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(credential.fingerprint)
+            created = entry is None
+            if created:
+                entry = _ClientEntry(DixaClient(api_key=credential.api_key), now)
+                self._entries[credential.fingerprint] = entry
+                metrics.increment("clients_created")
+            else:
+                self._entries.move_to_end(credential.fingerprint)
+                entry.last_used = now
+            held = _call_entries.get()
+            if held is not None and entry not in held:
+                entry.in_use += 1
+                held.append(entry)
+            # A new client may take the registry past max_clients, so it always evicts
+            if not created and now < self._next_reap:
+                return entry
+            evicted = self._evict(now)
+        for client in evicted:
+            client.close()
+        return entry
+
+    def release(self, entries: List[_ClientEntry]) -> None:
+        """End a tool call's use of the entries it looked up, closing dropped clients no longer in use."""
+        now = time.monotonic()
+        closed = []
+        with self._lock:
+            for entry in entries:
+                entry.in_use -= 1
+                entry.last_used = now
+                if entry.evicted and entry.in_use == 0:
+                    closed.append(entry.client)
+        for client in closed:
+            client.close()
+
+    def _drop(self, entry: _ClientEntry, evicted: List[DixaClient]) -> None:
+        entry.evicted = True
+        if entry.in_use == 0:
+            evicted.append(entry.client)
+
+    def _evict(self, now: float) -> List[DixaClient]:
+        evicted: List[DixaClient] = []
+        while len(self._entries) > self.max_clients:
+            self._drop(self._entries.popitem(last=False)[1], evicted)
+            metrics.increment("clients_evicted", reason="lru")
+        if self.idle_seconds > 0:
+            # Idle clients are looked for a few times per idle period, not on every lookup
+            self._next_reap = now + self.idle_seconds / 8
+            # Oldest first, so the scan stops at the first client still in use
+            while self._entries:
+                fingerprint, entry = next(iter(self._entries.items()))
+                if entry.in_use or now - entry.last_used < self.idle_seconds:
+                    break
+                del self._entries[fingerprint]
+                self._drop(entry, evicted)
+                metrics.increment("clients_evicted", reason="idle")
+        return evicted
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# One client per API key, so its pooled keep-alive connections are reused across
+# tool calls instead of being rebuilt on every invocation.
+clients = ClientRegistry()
 
 
 def get_dixa_client() -> DixaClient:
     """
     Get a DixaClient instance with the appropriate API key.
     
+    Clients are cached per API key, so repeated tool calls (e.g. list -> fetch -> act
+    chains) run on warm connections from the same session pool.
+    
     Returns:
         A configured DixaClient instance.
         
     Raises:
         ValueError: If no API key is found.
     """
-    api_key = get_api_key()
-    return DixaClient(api_key=api_key)
+    return clients.get(get_credential()).client
+
 
+def get_async_dixa_client() -> AsyncDixaClient:
+    """
+    Get an AsyncDixaClient for use inside async tools.
+    
+    The async client shares the cached DixaClient (and its connection pool) for the
+    current API key, and runs each request on a worker thread so the event loop stays free.
+    
+    Returns:
+        A configured AsyncDixaClient instance.
+        
+    Raises:
+        ValueError: If no API key is found.
+    """
+    return clients.get(get_credential()).async_client
+
+
+class JsonTool(FunctionTool):
+    """
+    FunctionTool that serializes dict results with the dixa_api JSON codec.
+    
+    FastMCP converts a dict result through pydantic twice, once for the structured
+    content and again for the text block. Dixa responses are already plain JSON, so
+    they are encoded once with the (orjson when installed) codec instead. RawJson
+    results (passthrough mode) are emitted as text content without being decoded;
+    tools returning them must be registered with output_schema=None.
+    
+    With DIXA_CURSOR_SECRET set, the continuation keys of dict results are replaced by
+    signed cursor tokens (tools.cursors), which are turned back into page keys when
+    passed as the `page_key` argument.
+    """
+
+    async def run(self, arguments: Dict[str, Any]) -> ToolResult:
+        # The clients this call looks up stay open until it returns (ClientRegistry.release)
+        token = _call_entries.set([])
+        try:
+            if cursors.SECRET and arguments.get("page_key"):
+                page_key = cursors.unseal(str(arguments["page_key"]), get_credential(), self.name)
+                arguments = {**arguments, "page_key": page_key}
+            return await super().run(arguments)
+        finally:
+            clients.release(_call_entries.get())
+            _call_entries.reset(token)
+
+    def convert_result(self, raw_value: Any) -> ToolResult:
+        if cursors.SECRET and isinstance(raw_value, dict):
+            raw_value = cursors.seal_page(raw_value, get_credential(), self.name)
+        if isinstance(raw_value, RawJson):
+            return ToolResult.model_construct(
+                content=[TextContent(type="text", text=raw_value.decode("utf-8"))],
+                structured_content=None,
+                meta=None,
+                is_error=False,
+            )
+        wrap_result = bool(self.output_schema and self.output_schema.get("x-fastmcp-wrap-result"))
+        if not isinstance(raw_value, dict) or wrap_result:
+            return super().convert_result(raw_value)
+        return ToolResult.model_construct(
+            content=[TextContent(type="text", text=codec.dumps_str(raw_value))],
+            structured_content=raw_value,
+            meta=None,
+            is_error=False,
+        )
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def add_conversation_note(
@@ -39,8 +39,8 @@ async def add_conversation_note(
             }
         }
     """
-    client = get_dixa_client()
-    return client.create_conversation_note(
+    client = get_async_dixa_client()
+    return await client.create_conversation_note(
         conversation_id=conversation_id,
         message=message,
         agent_id=agent_id,
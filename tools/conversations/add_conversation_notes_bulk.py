@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def add_conversation_notes_bulk(
@@ -52,8 +52,8 @@ async def add_conversation_notes_bulk(
         Note: The response includes both successful and failed note creations. Check the "_type" field
         to determine if each note was created successfully ("BulkActionSuccess") or failed ("BulkActionFailure").
     """
-    client = get_dixa_client()
-    return client.create_conversation_notes_bulk(
+    client = get_async_dixa_client()
+    return await client.create_conversation_notes_bulk(
         conversation_id=conversation_id,
         notes=notes
     )
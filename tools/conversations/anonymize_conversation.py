@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def anonymize_conversation(
@@ -36,8 +36,8 @@ async def anonymize_conversation(
             }
         }
     """
-    client = get_dixa_client()
-    return client.patch_conversation_anonymize(
+    client = get_async_dixa_client()
+    return await client.patch_conversation_anonymize(
         conversation_id=conversation_id,
         force=force
     )
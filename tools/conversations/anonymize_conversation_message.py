@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def anonymize_conversation_message(
@@ -36,8 +36,8 @@ async def anonymize_conversation_message(
             }
         }
     """
-    client = get_dixa_client()
-    return client.patch_conversation_message_anonymize(
+    client = get_async_dixa_client()
+    return await client.patch_conversation_message_anonymize(
         conversation_id=conversation_id,
         message_id=message_id
     )
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def assign_conversation_to_agent(
@@ -33,8 +33,8 @@ async def assign_conversation_to_agent(
         Dictionary with success status. On success (204), returns {"success": True, "message": "Conversation claimed successfully"}.
         On error, returns the error response.
     """
-    client = get_dixa_client()
-    return client.update_conversation_claim(
+    client = get_async_dixa_client()
+    return await client.update_conversation_claim(
         conversation_id=conversation_id,
         agent_id=agent_id,
         force=force
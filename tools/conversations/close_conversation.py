@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def close_conversation(
@@ -27,8 +27,8 @@ async def close_conversation(
         Dictionary with success status. On success (204), returns {"success": True, "message": "Conversation closed successfully"}.
         On error, returns the error response.
     """
-    client = get_dixa_client()
-    return client.update_conversation_close(
+    client = get_async_dixa_client()
+    return await client.update_conversation_close(
         conversation_id=conversation_id,
         user_id=user_id
     )
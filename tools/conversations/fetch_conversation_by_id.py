@@ -2,13 +2,14 @@
 Tool for getting a conversation from the Dixa API.
 """
 
-from typing import Dict, Any
-from tools.base import get_dixa_client
+from typing import Dict, Any, Union
+from dixa_api.codec import RawJson
+from tools.base import PASSTHROUGH, get_async_dixa_client
 
 
 async def fetch_conversation_by_id(
     conversation_id: str
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], RawJson]:
     """
     Get a conversation by its ID.
     
@@ -17,7 +18,8 @@ async def fetch_conversation_by_id(
     
     Returns:
         Dictionary containing the conversation details.
+        With DIXA_MCP_PASSTHROUGH set, the upstream JSON body is returned undecoded.
     """
-    client = get_dixa_client()
-    return client.get_conversation(conversation_id=conversation_id)
+    client = get_async_dixa_client()
+    return await client.get_conversation(conversation_id=conversation_id, raw=PASSTHROUGH)
 
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def import_conversations(
@@ -30,6 +30,6 @@ async def import_conversations(
     Returns:
         Dictionary containing the import results.
     """
-    client = get_dixa_client()
-    return client.create_conversations_import(conversations=conversations)
+    client = get_async_dixa_client()
+    return await client.create_conversations_import(conversations=conversations)
 
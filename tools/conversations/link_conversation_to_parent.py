@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def link_conversation_to_parent(
@@ -31,8 +31,8 @@ async def link_conversation_to_parent(
         Dictionary with success status. On success (204), returns {"success": True, "message": "Conversation linked successfully"}.
         On error, returns the error response.
     """
-    client = get_dixa_client()
-    return client.update_conversation_link(
+    client = get_async_dixa_client()
+    return await client.update_conversation_link(
         conversation_id=conversation_id,
         parent_conversation_id=parent_conversation_id
     )
@@ -2,13 +2,14 @@
 Tool for getting (listing) messages for a conversation from the Dixa API.
 """
 
-from typing import Dict, Any
-from tools.base import get_dixa_client
+from typing import Dict, Any, Union
+from dixa_api.codec import RawJson
+from tools.base import PASSTHROUGH, get_async_dixa_client
 
 
 async def list_conversation_messages(
     conversation_id: str
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], RawJson]:
     """
     List messages for a conversation.
     
@@ -17,7 +18,8 @@ async def list_conversation_messages(
     
     Returns:
         Dictionary containing the list of messages for the conversation.
+        With DIXA_MCP_PASSTHROUGH set, the upstream JSON body is returned undecoded.
     """
-    client = get_dixa_client()
-    return client.get_conversation_messages(conversation_id=conversation_id)
+    client = get_async_dixa_client()
+    return await client.get_conversation_messages(conversation_id=conversation_id, raw=PASSTHROUGH)
 
@@ -3,7 +3,7 @@ Tool for getting (listing) internal notes for a conversation from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_conversation_notes(
@@ -18,6 +18,6 @@ async def list_conversation_notes(
     Returns:
         Dictionary containing the list of internal notes for the conversation.
     """
-    client = get_dixa_client()
-    return client.get_conversation_notes(conversation_id=conversation_id)
+    client = get_async_dixa_client()
+    return await client.get_conversation_notes(conversation_id=conversation_id)
 
@@ -3,7 +3,7 @@ Tool for getting (listing) linked conversations for a conversation from the Dixa
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_linked_conversations(
@@ -18,6 +18,6 @@ async def list_linked_conversations(
     Returns:
         Dictionary containing the list of linked conversations.
     """
-    client = get_dixa_client()
-    return client.get_conversation_linked(conversation_id=conversation_id)
+    client = get_async_dixa_client()
+    return await client.get_conversation_linked(conversation_id=conversation_id)
 
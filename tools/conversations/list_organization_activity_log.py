@@ -3,7 +3,7 @@ Tool for getting (listing) the organization activity log from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_organization_activity_log() -> Dict[str, Any]:
@@ -13,6 +13,6 @@ async def list_organization_activity_log() -> Dict[str, Any]:
     Returns:
         Dictionary containing the organization activity log entries.
     """
-    client = get_dixa_client()
-    return client.get_organization_activity_log()
+    client = get_async_dixa_client()
+    return await client.get_organization_activity_log()
 
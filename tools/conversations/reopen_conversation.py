@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def reopen_conversation(
@@ -25,8 +25,8 @@ async def reopen_conversation(
         Dictionary with success status. On success (204), returns {"success": True, "message": "Conversation reopened successfully"}.
         On error, returns the error response.
     """
-    client = get_dixa_client()
-    return client.update_conversation_reopen(
+    client = get_async_dixa_client()
+    return await client.update_conversation_reopen(
         conversation_id=conversation_id
     )
 
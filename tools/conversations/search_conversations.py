@@ -3,7 +3,7 @@ Tool for searching conversations with filters from the Dixa API.
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def search_conversations(
@@ -53,8 +53,8 @@ async def search_conversations(
     if page_limit is not None and page_limit > 50:
         raise ValueError(f"page_limit must be less than or equal to 50, but got {page_limit}")
     
-    client = get_dixa_client()
-    return client.post_search_conversations(
+    client = get_async_dixa_client()
+    return await client.post_search_conversations(
         page_key=page_key,
         page_limit=page_limit,
         filters=filters,
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def set_conversation_followup_status(
@@ -27,8 +27,8 @@ async def set_conversation_followup_status(
         Dictionary with success status. On success (204), returns {"success": True, "message": "Conversation follow-up status updated successfully"}.
         On error, returns the error response.
     """
-    client = get_dixa_client()
-    return client.update_conversation_followup(
+    client = get_async_dixa_client()
+    return await client.update_conversation_followup(
         conversation_id=conversation_id,
         follow_up=follow_up
     )
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional, List, Literal
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 # Accepted conversation types
 ConversationType = Literal["Callback", "Chat", "ContactForm", "Email", "Sms"]
@@ -63,8 +63,8 @@ async def start_conversation(
             }
         }
     """
-    client = get_dixa_client()
-    return client.create_conversation(
+    client = get_async_dixa_client()
+    return await client.create_conversation(
         requester_id=requester_id,
         conversation_type=conversation_type,
         message_content=message_content,
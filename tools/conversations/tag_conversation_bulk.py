@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def tag_conversation_bulk(
@@ -27,8 +27,8 @@ async def tag_conversation_bulk(
     Returns:
         Dictionary containing the bulk tagging operation details.
     """
-    client = get_dixa_client()
-    return client.create_conversation_tags_bulk(
+    client = get_async_dixa_client()
+    return await client.create_conversation_tags_bulk(
         conversation_id=conversation_id,
         tag_names=tag_names
     )
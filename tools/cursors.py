@@ -0,0 +1,106 @@
+"""
+Signed pagination cursors, so any server replica can continue a listing.
+
+List tools hand out Dixa's continuation key for the next page (a top-level or
+`meta.pageKey`, or the `pageKey` of the `meta.next` URL). When DIXA_CURSOR_SECRET is
+set, clients get an opaque cursor token in its place: the page key together with the
+tool and the API key fingerprint it was issued to, signed with HMAC-SHA256. A replica
+configured with the same secret verifies the token passed back as `page_key` and
+recovers the page key, so paging needs no server-side session and no affinity to the
+replica that served the previous page, and a cursor can't be altered or used with
+another API key or tool.
+
+Without the secret, page keys are passed through unchanged.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from tools.shared import Credential
+
+# Shared by all replicas behind a balancer; unset disables cursor tokens.
+SECRET = os.getenv("DIXA_CURSOR_SECRET", "")
+
+# Prefix of every cursor token (bumped if the token layout changes).
+PREFIX = "dxc1."
+
+_key = SECRET.encode("utf-8")
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(payload: str) -> str:
+    return _b64encode(hmac.new(_key, payload.encode("ascii"), hashlib.sha256).digest()[:18])
+
+
+def seal(page_key: str, credential: Credential, tool: str) -> str:
+    """The cursor token for a page key returned by `tool` to `credential`."""
+    payload = _b64encode(json.dumps([tool, credential.fingerprint, page_key],
+                                    separators=(",", ":")).encode("utf-8"))
+    return PREFIX + payload + "." + _sign(payload)
+
+
+def unseal(token: str, credential: Credential, tool: str) -> str:
+    """
+    The page key of a cursor token.
+
+    Raises:
+        ValueError: If the token was not issued by `tool` to `credential` under the
+            current secret, or has been altered.
+    """
+    page_key: Optional[str] = None
+    if token.startswith(PREFIX):
+        payload, _, signature = token[len(PREFIX):].partition(".")
+        if hmac.compare_digest(signature, _sign(payload)):
+            try:
+                issued_tool, fingerprint, page_key = json.loads(_b64decode(payload))
+            except (ValueError, TypeError):
+                page_key = None
+            else:
+                if issued_tool != tool or fingerprint != credential.fingerprint:
+                    page_key = None
+    if not isinstance(page_key, str):
+        raise ValueError(
+            f"page_key is not a cursor returned by {tool} for this API key. "
+            "Pass the pageKey from the previous page unchanged, or omit page_key to start from the first page."
+        )
+    return page_key
+
+
+def _seal_next_url(url: str, credential: Credential, tool: str) -> str:
+    parts = urlsplit(url)
+    query = [(name, seal(value, credential, tool) if name == "pageKey" else value)
+             for name, value in parse_qsl(parts.query, keep_blank_values=True)]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def seal_page(page: Dict[str, Any], credential: Credential, tool: str) -> Dict[str, Any]:
+    """
+    A page result with its continuation keys replaced by cursor tokens.
+
+    The page itself may be a cached response shared with other calls, so it is copied
+    (only where a key is replaced) rather than modified.
+    """
+    if isinstance(page.get("pageKey"), str):
+        page = {**page, "pageKey": seal(page["pageKey"], credential, tool)}
+    meta = page.get("meta")
+    if isinstance(meta, dict):
+        sealed = dict(meta)
+        if isinstance(meta.get("pageKey"), str):
+            sealed["pageKey"] = seal(meta["pageKey"], credential, tool)
+        if isinstance(meta.get("next"), str) and "pageKey=" in meta["next"]:
+            sealed["next"] = _seal_next_url(meta["next"], credential, tool)
+        if sealed != meta:
+            page = {**page, "meta": sealed}
+    return page
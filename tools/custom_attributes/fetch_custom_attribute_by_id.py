@@ -3,7 +3,7 @@ Tool for getting a custom attribute definition by ID from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def fetch_custom_attribute_by_id(
@@ -32,6 +32,6 @@ async def fetch_custom_attribute_by_id(
             }
         }
     """
-    client = get_dixa_client()
-    return client.get_custom_attribute(custom_attribute_id=custom_attribute_id)
+    client = get_async_dixa_client()
+    return await client.get_custom_attribute(custom_attribute_id=custom_attribute_id)
 
@@ -3,7 +3,7 @@ Tool for getting (listing) all custom attribute definitions from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_custom_attributes() -> Dict[str, Any]:
@@ -29,6 +29,6 @@ async def list_custom_attributes() -> Dict[str, Any]:
             ]
         }
     """
-    client = get_dixa_client()
-    return client.get_custom_attributes()
+    client = get_async_dixa_client()
+    return await client.get_custom_attributes()
 
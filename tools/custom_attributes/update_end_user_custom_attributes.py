@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def update_end_user_custom_attributes(
@@ -47,8 +47,8 @@ async def update_end_user_custom_attributes(
             ]
         }
     """
-    client = get_dixa_client()
-    return client.patch_end_user_custom_attributes(
+    client = get_async_dixa_client()
+    return await client.patch_end_user_custom_attributes(
         user_id=user_id,
         custom_attributes=custom_attributes
     )
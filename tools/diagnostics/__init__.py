@@ -0,0 +1,9 @@
+"""
+Diagnostics tools for the Dixa MCP Server.
+
+This module contains tools for inspecting the server itself, such as latency and upstream-call metrics.
+"""
+
+from tools.diagnostics.fetch_server_metrics import fetch_server_metrics
+
+__all__ = ["fetch_server_metrics"]
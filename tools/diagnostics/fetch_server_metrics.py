@@ -0,0 +1,28 @@
+"""
+Tool for retrieving the MCP server's latency and upstream-call metrics.
+"""
+
+from typing import Dict, Any
+from dixa_api.metrics import metrics_snapshot
+
+
+async def fetch_server_metrics() -> Dict[str, Any]:
+    """
+    Fetch latency and Dixa API usage metrics of this MCP server.
+    
+    Use this to diagnose slow tool calls: it shows, per tool, how long calls took and how
+    many Dixa API requests they made. Only available in stdio mode; over HTTP the same data
+    is exported as Prometheus text on the /metrics route, if DIXA_MCP_METRICS_TOKEN is set.
+    
+    Returns:
+        Dictionary with:
+        - "tools": per tool name: calls, errors, avg_seconds, max_seconds, upstream_calls,
+          upstream_errors, upstream_seconds, bytes_in, bytes_out, cache_hits, cache_misses, retries
+        - "upstream": per "<METHOD> <endpoint family>" (e.g. "GET agents"): requests, errors,
+          avg_seconds, max_seconds, bytes_in, bytes_out
+        - "counters": other counters, e.g. retries by reason
+        - "cache": response cache hits, misses and occupancy
+        - "rate_limit": token bucket state per API key fingerprint
+        - "uptime_seconds": seconds since the metrics were started
+    """
+    return metrics_snapshot()
@@ -0,0 +1,93 @@
+"""
+API key extraction for the HTTP transports (streamable HTTP and SSE).
+
+AuthContextMiddleware is a plain ASGI middleware: it reads the Authorization header
+once per HTTP request, straight from the ASGI scope, and stores the resolved
+Credential (key and fingerprint) in the request's state and the key in the
+_client_api_key context variable. Unlike Starlette's BaseHTTPMiddleware it does not
+wrap the request in an extra task and response stream, so it adds next to nothing
+per request and leaves streaming responses alone.
+
+Tools run in the MCP session's task rather than in the request that carried the tool
+call, so get_api_key reads the credential from the state of the HTTP request behind
+the current MCP message (request_credential) before falling back to the context
+variable. In stdio mode no middleware is built and that lookup is skipped.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastmcp.server.dependencies import get_http_request
+from starlette.middleware import Middleware
+
+from tools.log import get_logger, sampled
+from tools.shared import Credential, _client_api_key
+
+log = get_logger("auth")
+
+# Key in the ASGI scope "state" (request.state) holding the request's Credential.
+CREDENTIAL_STATE = "dixa_credential"
+
+# Set once an AuthContextMiddleware exists, i.e. the server is serving HTTP.
+_serving_http = False
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def parse_authorization(value: bytes) -> Optional[str]:
+    """The API key of an Authorization header value, with or without a "Bearer" scheme."""
+    token = value.decode("latin-1").strip()
+    if token[:7].lower() == "bearer ":
+        token = token[7:].strip()
+    return token or None
+
+
+class AuthContextMiddleware:
+    """ASGI middleware making the request's Authorization header available to tools."""
+
+    def __init__(self, app: Callable[[Scope, Receive, Send], Awaitable[None]]):
+        global _serving_http
+        self.app = app
+        _serving_http = True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        api_key = None
+        for name, value in scope["headers"]:
+            # ASGI servers deliver header names lowercased
+            if name == b"authorization":
+                api_key = parse_authorization(value)
+                break
+        if api_key is None:
+            log.debug("HTTP %s %s without an Authorization header", scope["method"], scope["path"],
+                      extra=sampled())
+            await self.app(scope, receive, send)
+            return
+        credential = Credential(api_key)
+        log.debug("HTTP %s %s with API key %s", scope["method"], scope["path"], credential, extra=sampled())
+        scope.setdefault("state", {})[CREDENTIAL_STATE] = credential
+        token = _client_api_key.set(api_key)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _client_api_key.reset(token)
+
+
+def http_middleware() -> List[Middleware]:
+    """ASGI middleware for FastMCP's http_app() / run(transport="http" | "sse")."""
+    return [Middleware(AuthContextMiddleware)]
+
+
+def request_credential() -> Optional[Credential]:
+    """Credential of the HTTP request behind the current MCP message, if there is one."""
+    if not _serving_http:
+        return None
+    try:
+        request = get_http_request()
+    except RuntimeError:
+        return None
+    state = request.scope.get("state")
+    return state.get(CREDENTIAL_STATE) if state else None
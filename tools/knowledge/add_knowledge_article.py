@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def add_knowledge_article(
@@ -33,8 +33,8 @@ async def add_knowledge_article(
     Returns:
         Dictionary containing the created knowledge article.
     """
-    client = get_dixa_client()
-    return client.create_knowledge_article(
+    client = get_async_dixa_client()
+    return await client.create_knowledge_article(
         title=title,
         content=content,
         category_id=category_id,
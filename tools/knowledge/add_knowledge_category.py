@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def add_knowledge_category(
@@ -26,8 +26,8 @@ async def add_knowledge_category(
     Returns:
         Dictionary containing the created knowledge category.
     """
-    client = get_dixa_client()
-    return client.create_knowledge_category(
+    client = get_async_dixa_client()
+    return await client.create_knowledge_category(
         name=name,
         parent_id=parent_id
     )
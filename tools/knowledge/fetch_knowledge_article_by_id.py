@@ -3,7 +3,7 @@ Tool for getting a knowledge article by ID from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def fetch_knowledge_article_by_id(
@@ -18,6 +18,6 @@ async def fetch_knowledge_article_by_id(
     Returns:
         Dictionary containing the knowledge article information.
     """
-    client = get_dixa_client()
-    return client.get_knowledge_article(article_id=article_id)
+    client = get_async_dixa_client()
+    return await client.get_knowledge_article(article_id=article_id)
 
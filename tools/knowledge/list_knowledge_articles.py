@@ -3,7 +3,7 @@ Tool for listing knowledge articles from the Dixa API.
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_knowledge_articles(
@@ -20,8 +20,8 @@ async def list_knowledge_articles(
     Returns:
         Dictionary containing the list of knowledge articles.
     """
-    client = get_dixa_client()
-    return client.get_knowledge_articles(
+    client = get_async_dixa_client()
+    return await client.get_knowledge_articles(
         page_key=page_key,
         page_limit=page_limit
     )
@@ -3,7 +3,7 @@ Tool for listing knowledge categories from the Dixa API.
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_knowledge_categories(
@@ -20,8 +20,8 @@ async def list_knowledge_categories(
     Returns:
         Dictionary containing the list of knowledge categories.
     """
-    client = get_dixa_client()
-    return client.get_knowledge_categories(
+    client = get_async_dixa_client()
+    return await client.get_knowledge_categories(
         page_key=page_key,
         page_limit=page_limit
     )
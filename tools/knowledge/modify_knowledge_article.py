@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def modify_knowledge_article(
@@ -36,8 +36,8 @@ async def modify_knowledge_article(
     Returns:
         Dictionary containing the updated knowledge article.
     """
-    client = get_dixa_client()
-    return client.patch_knowledge_article(
+    client = get_async_dixa_client()
+    return await client.patch_knowledge_article(
         article_id=article_id,
         title=title,
         content=content,
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def remove_knowledge_article(
@@ -25,6 +25,6 @@ async def remove_knowledge_article(
         Dictionary with success status. On success (204), returns {"success": True, "message": "Knowledge article deleted successfully"}.
         On error, returns the error response.
     """
-    client = get_dixa_client()
-    return client.delete_knowledge_article(article_id=article_id)
+    client = get_async_dixa_client()
+    return await client.delete_knowledge_article(article_id=article_id)
 
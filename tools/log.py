@@ -0,0 +1,128 @@
+"""
+Logging for the MCP server and its tools.
+
+Log records are handed to a queue and written to stderr by a background thread, so a
+log call on the request path costs an enqueue rather than a formatted write and flush.
+Stdout is never used: in stdio mode it carries the MCP protocol.
+
+- Levels: DIXA_MCP_LOG_LEVEL (default INFO). Per-request diagnostics are DEBUG.
+- Lazy formatting: pass arguments (`logger.debug("x=%s", x)`), not f-strings, so
+  nothing is formatted for records that are filtered out.
+- Sampling: hot-path records passed with `extra=sampled()` are only written once every
+  DIXA_MCP_LOG_SAMPLE_EVERY times per call site.
+- Redaction: log API keys by their Credential.label (see dixa_api.fingerprint). As a
+  safety net, Authorization/Bearer values in any message are masked before it is written.
+- Payload dumps: full request/response bodies are logged with log_payload(), which
+  does nothing unless DIXA_MCP_LOG_PAYLOADS=1 and DEBUG is enabled.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+ROOT_LOGGER = "dixa_mcp"
+
+LOG_LEVEL = os.getenv("DIXA_MCP_LOG_LEVEL", "INFO").upper()
+SAMPLE_EVERY = max(1, int(os.getenv("DIXA_MCP_LOG_SAMPLE_EVERY", "100")))
+LOG_PAYLOADS = os.getenv("DIXA_MCP_LOG_PAYLOADS", "").lower() in ("1", "true", "yes")
+
+_SECRET_PATTERN = re.compile(
+    r"(?i)(authorization['\"]?\s*[:=]\s*['\"]?(?:bearer\s+)?|bearer\s+)(?!key#)[^\s'\",}]+"
+)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_configure_lock = threading.Lock()
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock QueueHandler formats the message here, on the caller's thread, so it
+        # can be pickled; records stay in this process, so the writer thread formats them
+        return record
+
+
+class RedactingFormatter(logging.Formatter):
+    """Formatter that masks Authorization header and Bearer token values."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return _SECRET_PATTERN.sub(r"\1[redacted]", super().format(record))
+
+
+class SamplingFilter(logging.Filter):
+    """Pass only every n-th record of call sites that log with `extra=sampled(n)`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._counts: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        every = getattr(record, "sample_every", 1)
+        if every <= 1:
+            return True
+        site = (record.pathname, record.lineno)
+        with self._lock:
+            count = self._counts.get(site, 0)
+            self._counts[site] = count + 1
+        return count % every == 0
+
+
+def sampled(every: int = SAMPLE_EVERY) -> Dict[str, int]:
+    """`extra` for a hot-path log call that should only be written once every `every` calls."""
+    return {"sample_every": every}
+
+
+def configure_logging(level: str = LOG_LEVEL, stream: Any = None) -> None:
+    """Route the dixa_mcp loggers through a queue to a background stderr writer (idempotent)."""
+    global _listener
+    with _configure_lock:
+        if _listener is not None:
+            return
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel(getattr(logging, level, logging.INFO))
+        root.propagate = False
+
+        handler = logging.StreamHandler(stream or sys.stderr)
+        handler.setFormatter(RedactingFormatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        queue_handler = _QueueHandler(records)
+        # Sampled-out records are dropped before they are queued
+        queue_handler.addFilter(SamplingFilter())
+        root.addHandler(queue_handler)
+
+        _listener = logging.handlers.QueueListener(records, handler)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger under the dixa_mcp hierarchy, e.g. get_logger("auth") -> "dixa_mcp.auth"."""
+    configure_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+class _Deferred:
+    """Calls `render` only when the log record is actually formatted."""
+
+    __slots__ = ("render",)
+
+    def __init__(self, render: Callable[[], str]):
+        self.render = render
+
+    def __str__(self) -> str:
+        return self.render()
+
+
+def log_payload(logger: logging.Logger, label: str, value: Any) -> None:
+    """Log a full request/response body at DEBUG, only when DIXA_MCP_LOG_PAYLOADS is set."""
+    if not LOG_PAYLOADS or not logger.isEnabledFor(logging.DEBUG):
+        return
+    from dixa_api.codec import codec
+
+    logger.debug("%s:\n%s", label, _Deferred(lambda: codec.dumps_pretty(value)))
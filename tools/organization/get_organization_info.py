@@ -3,7 +3,7 @@ Tool for retrieving organization information from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def fetch_organization_details() -> Dict[str, Any]:
@@ -18,6 +18,6 @@ async def fetch_organization_details() -> Dict[str, Any]:
     Returns:
         Dictionary containing organization information from Dixa.
     """
-    client = get_dixa_client()
-    return client.get_organization()
+    client = get_async_dixa_client()
+    return await client.get_organization()
 
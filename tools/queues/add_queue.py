@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def add_queue(
@@ -54,8 +54,8 @@ async def add_queue(
     Returns:
         Dictionary containing the created queue.
     """
-    client = get_dixa_client()
-    return client.create_queue(
+    client = get_async_dixa_client()
+    return await client.create_queue(
         name=name,
         call_functionality=call_functionality,
         is_default=is_default,
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def assign_agents_to_queue(
@@ -49,8 +49,8 @@ async def assign_agents_to_queue(
         Note: The response includes both successful and failed assignments. Check the "_type" field
         to determine if each agent was assigned successfully ("BulkActionSuccess") or failed ("BulkActionFailure").
     """
-    client = get_dixa_client()
-    return client.patch_queue_assign_agents(
+    client = get_async_dixa_client()
+    return await client.patch_queue_assign_agents(
         queue_id=queue_id,
         agent_ids=agent_ids
     )
@@ -3,7 +3,7 @@ Tool for getting the position of a conversation in its queue from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def check_conversation_queue_position(
@@ -20,8 +20,8 @@ async def check_conversation_queue_position(
     Returns:
         Dictionary containing the conversation's position in the queue.
     """
-    client = get_dixa_client()
-    return client.get_queue_conversation_position(
+    client = get_async_dixa_client()
+    return await client.get_queue_conversation_position(
         queue_id=queue_id,
         conversation_id=conversation_id
     )
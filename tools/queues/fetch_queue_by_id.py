@@ -3,7 +3,7 @@ Tool for getting a queue by ID from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def fetch_queue_by_id(queue_id: str) -> Dict[str, Any]:
@@ -16,6 +16,6 @@ async def fetch_queue_by_id(queue_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing the queue information.
     """
-    client = get_dixa_client()
-    return client.get_queue(queue_id=queue_id)
+    client = get_async_dixa_client()
+    return await client.get_queue(queue_id=queue_id)
 
@@ -3,7 +3,7 @@ Tool for listing agents in a queue from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_queue_agents(queue_id: str) -> Dict[str, Any]:
@@ -16,6 +16,6 @@ async def list_queue_agents(queue_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing a list of agents/admins that are members of the queue.
     """
-    client = get_dixa_client()
-    return client.get_queue_agents(queue_id=queue_id)
+    client = get_async_dixa_client()
+    return await client.get_queue_agents(queue_id=queue_id)
 
@@ -3,7 +3,7 @@ Tool for listing queues from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_queues() -> Dict[str, Any]:
@@ -13,6 +13,6 @@ async def list_queues() -> Dict[str, Any]:
     Returns:
         Dictionary containing the list of queues in an organization.
     """
-    client = get_dixa_client()
-    return client.get_queues()
+    client = get_async_dixa_client()
+    return await client.get_queues()
 
@@ -0,0 +1,296 @@
+"""
+Manifest-driven tool registration.
+
+Every MCP tool is listed in TOOLS. At startup each entry is registered as a LazyTool,
+whose name, description and input/output schemas come from a stub function: the
+tool's signature and docstring, read from its source file with `ast` and compiled
+without the body. Nothing in the tool's module is executed, so neither the tool
+module nor its dependencies (the dixa_api client, requests, ...) are imported until
+the tool is first called. Claude Desktop starts a new stdio server for every session,
+which then pays only for FastMCP itself.
+
+The generated schemas are kept in the schema cache (tools.schema_cache), so stubs are
+only built for tools whose source changed since the cache was written.
+
+Set DIXA_MCP_EAGER_TOOLS=1 to import every tool module up front instead.
+`python benchmarks/bench_startup.py` measures both.
+"""
+
+import ast
+import importlib
+import json
+import os
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastmcp.tools import FunctionTool, ToolResult
+from fastmcp.utilities.json_schema import dereference_refs
+from pydantic import PrivateAttr
+
+from tools.log import get_logger
+from tools.schema_cache import TOOL_FIELDS, SchemaCache, cache_path, source_key
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+log = get_logger("registry")
+
+EAGER = os.getenv("DIXA_MCP_EAGER_TOOLS", "").lower() in ("1", "true", "yes")
+
+
+class ToolEntry:
+    """A manifest entry: the module defining a tool function of the same name."""
+
+    __slots__ = ("module", "passthrough", "stdio_only")
+
+    def __init__(self, module: str, passthrough: bool = False, stdio_only: bool = False):
+        """
+        Args:
+            module: Dotted module path, e.g. "tools.tags.list_tags".
+            passthrough: The tool may return RawJson (DIXA_MCP_PASSTHROUGH), so it is
+                registered without an output schema.
+            stdio_only: The tool shows process-wide data, so it is disabled when the
+                server is shared by several API keys over HTTP.
+        """
+        self.module = module
+        self.passthrough = passthrough
+        self.stdio_only = stdio_only
+
+    @property
+    def name(self) -> str:
+        return self.module.rsplit(".", 1)[1]
+
+    @property
+    def path(self) -> str:
+        return os.path.join(TOOLS_DIR, *self.module.split(".")[1:]) + ".py"
+
+    def options(self) -> Dict[str, Any]:
+        """Extra keyword arguments for FunctionTool.from_function."""
+        return {"output_schema": None} if self.passthrough else {}
+
+
+TOOLS: Tuple[ToolEntry, ...] = (
+    ToolEntry("tools.organization.fetch_organization_details"),
+    ToolEntry("tools.agents.fetch_agent_by_id"),
+    ToolEntry("tools.agents.list_agents"),
+    ToolEntry("tools.agents.list_agents_presence"),
+    ToolEntry("tools.agents.list_agent_teams"),
+    ToolEntry("tools.agents.add_agent"),
+    ToolEntry("tools.agents.modify_agent_partial"),
+    ToolEntry("tools.agents.update_agent_full"),
+    ToolEntry("tools.agents.set_agent_working_channel"),
+    ToolEntry("tools.settings.check_business_hours_status"),
+    ToolEntry("tools.settings.list_business_hours_schedules"),
+    ToolEntry("tools.settings.list_contact_endpoints"),
+    ToolEntry("tools.settings.fetch_contact_endpoint_by_id"),
+    ToolEntry("tools.conversations.fetch_conversation_by_id", passthrough=True),
+    ToolEntry("tools.conversations.list_conversation_flows"),
+    ToolEntry("tools.conversations.list_conversation_activity_log"),
+    ToolEntry("tools.conversations.list_conversation_notes"),
+    ToolEntry("tools.conversations.list_linked_conversations"),
+    ToolEntry("tools.conversations.list_conversation_messages", passthrough=True),
+    ToolEntry("tools.conversations.list_organization_activity_log"),
+    ToolEntry("tools.conversations.list_conversation_ratings"),
+    ToolEntry("tools.conversations.search_conversations"),
+    ToolEntry("tools.conversations.start_conversation"),
+    ToolEntry("tools.conversations.import_conversations"),
+    ToolEntry("tools.conversations.add_conversation_note"),
+    ToolEntry("tools.conversations.add_conversation_notes_bulk"),
+    ToolEntry("tools.conversations.anonymize_conversation"),
+    ToolEntry("tools.conversations.anonymize_conversation_message"),
+    ToolEntry("tools.custom_attributes.update_conversation_custom_attributes"),
+    ToolEntry("tools.conversations.tag_conversation_bulk"),
+    ToolEntry("tools.conversations.assign_conversation_to_agent"),
+    ToolEntry("tools.conversations.close_conversation"),
+    ToolEntry("tools.conversations.link_conversation_to_parent"),
+    ToolEntry("tools.conversations.set_conversation_followup_status"),
+    ToolEntry("tools.conversations.reopen_conversation"),
+    ToolEntry("tools.conversations.tag_conversation"),
+    ToolEntry("tools.conversations.remove_tag_from_conversation"),
+    ToolEntry("tools.custom_attributes.fetch_custom_attribute_by_id"),
+    ToolEntry("tools.custom_attributes.list_custom_attributes"),
+    ToolEntry("tools.custom_attributes.update_end_user_custom_attributes"),
+    ToolEntry("tools.users.list_end_users"),
+    ToolEntry("tools.users.fetch_end_user_by_id"),
+    ToolEntry("tools.users.add_end_user"),
+    ToolEntry("tools.users.add_end_users_bulk"),
+    ToolEntry("tools.users.modify_end_user_partial"),
+    ToolEntry("tools.users.modify_end_users_bulk"),
+    ToolEntry("tools.users.update_end_user_full"),
+    ToolEntry("tools.users.update_end_users_bulk"),
+    ToolEntry("tools.users.list_end_user_conversations"),
+    ToolEntry("tools.users.anonymize_end_user"),
+    ToolEntry("tools.knowledge.list_knowledge_articles"),
+    ToolEntry("tools.knowledge.fetch_knowledge_article_by_id"),
+    ToolEntry("tools.knowledge.add_knowledge_article"),
+    ToolEntry("tools.knowledge.modify_knowledge_article"),
+    ToolEntry("tools.knowledge.remove_knowledge_article"),
+    ToolEntry("tools.knowledge.list_knowledge_categories"),
+    ToolEntry("tools.knowledge.add_knowledge_category"),
+    ToolEntry("tools.queues.list_queues"),
+    ToolEntry("tools.queues.fetch_queue_by_id"),
+    ToolEntry("tools.queues.check_queue_availability"),
+    ToolEntry("tools.queues.check_conversation_queue_position"),
+    ToolEntry("tools.queues.list_queue_agents"),
+    ToolEntry("tools.queues.add_queue"),
+    ToolEntry("tools.queues.assign_agents_to_queue"),
+    ToolEntry("tools.queues.remove_agents_from_queue"),
+    ToolEntry("tools.tags.list_tags", passthrough=True),
+    ToolEntry("tools.tags.fetch_tag_by_id"),
+    ToolEntry("tools.tags.list_conversation_tags"),
+    ToolEntry("tools.tags.add_tag"),
+    ToolEntry("tools.tags.activate_tag"),
+    ToolEntry("tools.tags.deactivate_tag"),
+    ToolEntry("tools.tags.remove_tag"),
+    ToolEntry("tools.teams.list_teams"),
+    ToolEntry("tools.teams.fetch_team_by_id"),
+    ToolEntry("tools.teams.list_team_agents"),
+    ToolEntry("tools.teams.list_team_presence"),
+    ToolEntry("tools.teams.add_team"),
+    ToolEntry("tools.teams.add_agents_to_team"),
+    ToolEntry("tools.teams.remove_agents_from_team"),
+    ToolEntry("tools.teams.remove_team"),
+    ToolEntry("tools.analytics.prepare_analytics_metric_query"),
+    ToolEntry("tools.analytics.fetch_aggregated_data"),
+    ToolEntry("tools.analytics.prepare_analytics_record_query"),
+    ToolEntry("tools.analytics.aggregate_analytics_records"),
+    ToolEntry("tools.diagnostics.fetch_server_metrics", stdio_only=True),
+    # NOTE: fetch_unaggregated_data is left out to prevent conversation length errors;
+    # aggregate_analytics_records reduces records server-side instead
+    # ToolEntry("tools.analytics.fetch_unaggregated_data"),
+)
+
+
+# Names of the tools disabled over HTTP (see ToolEntry.stdio_only).
+STDIO_ONLY_TOOLS: Tuple[str, ...] = tuple(entry.name for entry in TOOLS if entry.stdio_only)
+
+
+class LazyTool(FunctionTool):
+    """
+    A tool registered from its generated schemas; the real module is imported on the first call.
+
+    The first call builds the real JsonTool, which validates arguments against the
+    actual function and serializes its result, and every call is delegated to it.
+    """
+
+    _module: str = PrivateAttr(default="")
+    _tool: Optional[FunctionTool] = PrivateAttr(default=None)
+
+    def load(self) -> FunctionTool:
+        """Import the tool's module and return the real tool."""
+        if self._tool is None:
+            from tools.base import JsonTool
+            fn = getattr(importlib.import_module(self._module), self.name)
+            self._tool = JsonTool.from_function(fn, name=self.name, output_schema=self.output_schema)
+        return self._tool
+
+    async def run(self, arguments: Dict[str, Any]) -> ToolResult:
+        return await self.load().run(arguments)
+
+
+def _stub_namespace() -> Dict[str, Any]:
+    return {name: getattr(typing, name) for name in typing.__all__}
+
+
+def build_stub(entry: ToolEntry) -> Callable[..., Any]:
+    """
+    Compile a body-less copy of the tool function from its source.
+
+    Module-level assignments are kept, so aliases such as
+    ``ChannelType = Literal[...]`` or default-value constants resolve. Assignments
+    that need anything beyond the typing module are skipped.
+
+    Raises:
+        LookupError: If the module does not define the tool function.
+        NameError: If the signature uses a name the stub can't resolve.
+    """
+    with open(entry.path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), entry.path)
+
+    namespace = _stub_namespace()
+    function = None
+    for node in tree.body:
+        if isinstance(node, (ast.Assign, ast.AnnAssign)):
+            try:
+                exec(compile(ast.Module(body=[node], type_ignores=[]), entry.path, "exec"), namespace)
+            except Exception:
+                continue
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == entry.name:
+            function = node
+    if function is None:
+        raise LookupError(f"{entry.module} does not define {entry.name}()")
+
+    body: List[ast.stmt] = []
+    docstring = ast.get_docstring(function, clean=False)
+    if docstring is not None:
+        body.append(ast.Expr(ast.Constant(docstring)))
+    body.append(ast.Expr(ast.Constant(Ellipsis)))
+    function.body = body
+    function.decorator_list = []
+    if entry.passthrough:
+        # Passthrough tools have no output schema, so their RawJson return type is not needed
+        function.returns = None
+    module = ast.fix_missing_locations(ast.Module(body=[function], type_ignores=[]))
+    exec(compile(module, entry.path, "exec"), namespace)
+    stub = namespace[entry.name]
+    stub.__module__ = entry.module
+    return stub
+
+
+def _not_loaded(**arguments: Any) -> Any:
+    raise RuntimeError("Lazy tools run through LazyTool.run, which imports the real function")
+
+
+def _without_refs(schema: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    # Schemas are dereferenced once here instead of on every tools/list request
+    if schema is None or ("$defs" not in schema and "$ref" not in json.dumps(schema)):
+        return schema
+    return dereference_refs(schema)
+
+
+def tool_fields(entry: ToolEntry, cache: Optional[SchemaCache] = None) -> Dict[str, Any]:
+    """
+    Return the name, description and schemas of an entry's tool, from the cache when its source is unchanged.
+
+    Raises:
+        LookupError, NameError, SyntaxError: If the stub can't be built.
+    """
+    key = source_key(entry.path, entry.passthrough) if cache is not None else ""
+    fields = cache.get(entry.module, key) if cache is not None else None
+    if fields is None:
+        tool = FunctionTool.from_function(build_stub(entry), **entry.options())
+        fields = {name: getattr(tool, name) for name in TOOL_FIELDS}
+        fields["parameters"] = _without_refs(fields["parameters"])
+        fields["output_schema"] = _without_refs(fields["output_schema"])
+        if cache is not None:
+            cache.put(entry.module, key, fields)
+    return fields
+
+
+def build_tool(entry: ToolEntry, cache: Optional[SchemaCache] = None) -> FunctionTool:
+    """Build the tool for an entry: lazy unless DIXA_MCP_EAGER_TOOLS is set or the stub can't be built."""
+    if not EAGER:
+        try:
+            tool = LazyTool(fn=_not_loaded, **tool_fields(entry, cache))
+        except (LookupError, NameError, SyntaxError) as e:
+            log.warning("Importing %s eagerly: %s", entry.module, e)
+        else:
+            tool._module = entry.module
+            return tool
+    from tools.base import JsonTool
+    fn = getattr(importlib.import_module(entry.module), entry.name)
+    tool = JsonTool.from_function(fn, **entry.options())
+    return tool.model_copy(update={"parameters": _without_refs(tool.parameters),
+                                   "output_schema": _without_refs(tool.output_schema)})
+
+
+def register_tools(mcp: Any, entries: Tuple[ToolEntry, ...] = TOOLS) -> None:
+    """
+    Register every manifest entry with the FastMCP server.
+
+    Schemas come from the schema cache (see tools.schema_cache) where possible and are
+    already dereferenced, so the server can be created with dereference_schemas=False.
+    """
+    cache = SchemaCache(cache_path())
+    for entry in entries:
+        mcp.add_tool(build_tool(entry, cache))
+    cache.save()
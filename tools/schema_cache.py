@@ -0,0 +1,125 @@
+"""
+On-disk cache of the generated tool list.
+
+Building a tool's input and output schemas means FastMCP inspecting its signature and
+pydantic generating JSON schemas, which is most of the server's startup time after
+the imports. The schemas only change when a tool's source does, so the registry
+stores each generated tool (name, description and schemas) in a JSON file keyed by a
+hash of the tool's source file, and rebuilds only entries whose source has changed.
+The whole file is ignored when the FastMCP or pydantic version changes, or
+tools/registry.py (the manifest and stub builder) does.
+
+The cache lives at DIXA_MCP_SCHEMA_CACHE (default: .cache/tool_schemas.json in the
+repository; set it to "off" to disable). The server refreshes it whenever an entry is
+stale; build it ahead of time, e.g. in a Docker image, with:
+
+    python -m tools.schema_cache
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Dict, Optional
+
+from tools.log import get_logger
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CACHE_VERSION = 1
+# Fields of a generated tool that the cache stores and restores.
+TOOL_FIELDS = ("name", "description", "parameters", "output_schema")
+
+
+def cache_path() -> Optional[str]:
+    """Location of the cache file, or None if caching is disabled."""
+    path = os.getenv("DIXA_MCP_SCHEMA_CACHE", os.path.join(ROOT, ".cache", "tool_schemas.json"))
+    return None if path.lower() in ("", "0", "off", "false", "no") else path
+
+
+def _file_hash(path: str, extra: str = "") -> str:
+    digest = hashlib.sha256(extra.encode("utf-8"))
+    with open(path, "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def generator_key() -> str:
+    """Identity of everything besides a tool's own source that shapes its schemas."""
+    import fastmcp
+    import pydantic
+    from tools import registry
+
+    return _file_hash(registry.__file__, f"{CACHE_VERSION}:{fastmcp.__version__}:{pydantic.VERSION}")
+
+
+def source_key(path: str, passthrough: bool) -> str:
+    """Cache key of one tool: its source file and registration options."""
+    return _file_hash(path, f"passthrough={passthrough}")
+
+
+class SchemaCache:
+    """Generated tools by module, plus which of them changed since the file was read."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.generator = generator_key()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        if path is None:
+            return
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("generator") == self.generator:
+            self.entries = data.get("tools", {})
+
+    def get(self, module: str, key: str) -> Optional[Dict[str, Any]]:
+        """Cached tool fields for a module, if its source is unchanged."""
+        entry = self.entries.get(module)
+        if entry is None or entry.get("source") != key:
+            return None
+        return entry["tool"]
+
+    def put(self, module: str, key: str, fields: Dict[str, Any]) -> None:
+        self.entries[module] = {"source": key, "tool": fields}
+        self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache if anything changed; a read-only location is not an error."""
+        if self.path is None or not self.dirty:
+            return
+        data = {"generator": self.generator, "tools": self.entries}
+        try:
+            directory = os.path.dirname(self.path) or "."
+            os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file first, so concurrent servers never read a partial cache
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tool_schemas.")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError as e:
+            get_logger("schema_cache").warning("Could not write %s: %s", self.path, e)
+
+
+def main() -> None:
+    """Build (or refresh) the cache for every tool in the manifest."""
+    from tools.registry import TOOLS, tool_fields
+
+    path = cache_path()
+    if path is None:
+        sys.exit("DIXA_MCP_SCHEMA_CACHE is disabled")
+    cache = SchemaCache(path)
+    for entry in TOOLS:
+        tool_fields(entry, cache)
+    cache.save()
+    print(f"{len(TOOLS)} tools cached in {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ Tool for checking business hours status from the Dixa API.
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def check_business_hours_status(
@@ -27,8 +27,8 @@ async def check_business_hours_status(
             }
         }
     """
-    client = get_dixa_client()
-    return client.get_business_hours_status(
+    client = get_async_dixa_client()
+    return await client.get_business_hours_status(
         schedule_id=schedule_id,
         timestamp=timestamp
     )
@@ -6,7 +6,7 @@ receives contacts (e.g., phone numbers, email addresses).
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def fetch_contact_endpoint_by_id(
@@ -38,6 +38,6 @@ async def fetch_contact_endpoint_by_id(
             }
         }
     """
-    client = get_dixa_client()
-    return client.get_contact_endpoint(contact_endpoint_id=contact_endpoint_id)
+    client = get_async_dixa_client()
+    return await client.get_contact_endpoint(contact_endpoint_id=contact_endpoint_id)
 
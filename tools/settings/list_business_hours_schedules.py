@@ -3,7 +3,7 @@ Tool for listing business hours schedules from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_business_hours_schedules() -> Dict[str, Any]:
@@ -24,6 +24,6 @@ async def list_business_hours_schedules() -> Dict[str, Any]:
             }
         }
     """
-    client = get_dixa_client()
-    return client.get_business_hours_schedules()
+    client = get_async_dixa_client()
+    return await client.get_business_hours_schedules()
 
@@ -6,7 +6,7 @@ receives contacts (e.g., phone numbers, email addresses).
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_contact_endpoints(
@@ -38,6 +38,6 @@ async def list_contact_endpoints(
             ]
         }
     """
-    client = get_dixa_client()
-    return client.get_contact_endpoints(_type=_type)
+    client = get_async_dixa_client()
+    return await client.get_contact_endpoints(_type=_type)
 
@@ -16,3 +16,42 @@ _client_api_key: ContextVar[Optional[str]] = ContextVar('client_api_key', defaul
 # This will be set by server.py when it processes command-line arguments
 _api_key: Optional[str] = None
 
+
+
+class Credential:
+    """
+    A resolved API key together with its fingerprint, computed once per key source.
+    
+    The fingerprint (dixa_api.fingerprint.key_fingerprint, as used by the client's cache
+    keys and rate-limit buckets) identifies the key in client lookups and log lines, so
+    the raw key never has to appear in either.
+    """
+
+    __slots__ = ("api_key", "_fingerprint")
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        self._fingerprint: Optional[str] = None
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            # Imported on first use, not at startup: loading the dixa_api package is what
+            # lazy tool registration defers, and the first tool call imports it anyway
+            from dixa_api.fingerprint import key_fingerprint
+            self._fingerprint = key_fingerprint(self.api_key)
+        return self._fingerprint
+
+    @property
+    def label(self) -> str:
+        """Short label for log lines, e.g. "key#1a2b3c4d"."""
+        from dixa_api.fingerprint import fingerprint_label
+        return fingerprint_label(self.fingerprint)
+
+    def __str__(self) -> str:
+        # Log lines pass the credential itself, so the label is only computed for
+        # records that are actually written
+        return self.label
+
+    def __repr__(self) -> str:
+        return f"Credential({self.label})"
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def add_tag(
@@ -27,6 +27,6 @@ async def add_tag(
         Dictionary containing the created tag or an existing tag with the same name.
         Note that the tag is not updated to match the input in case it already exists.
     """
-    client = get_dixa_client()
-    return client.create_tag(name=name, color=color)
+    client = get_async_dixa_client()
+    return await client.create_tag(name=name, color=color)
 
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def deactivate_tag(tag_id: str) -> Dict[str, Any]:
@@ -26,6 +26,6 @@ async def deactivate_tag(tag_id: str) -> Dict[str, Any]:
         Dictionary with success status. On success (204), returns {"success": True, "message": "Tag deactivated successfully"}.
         On error, returns the error response.
     """
-    client = get_dixa_client()
-    return client.patch_tag_deactivate(tag_id=tag_id)
+    client = get_async_dixa_client()
+    return await client.patch_tag_deactivate(tag_id=tag_id)
 
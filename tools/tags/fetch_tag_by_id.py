@@ -3,7 +3,7 @@ Tool for getting a tag by ID from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def fetch_tag_by_id(tag_id: str) -> Dict[str, Any]:
@@ -16,6 +16,6 @@ async def fetch_tag_by_id(tag_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing the tag information.
     """
-    client = get_dixa_client()
-    return client.get_tag(tag_id=tag_id)
+    client = get_async_dixa_client()
+    return await client.get_tag(tag_id=tag_id)
 
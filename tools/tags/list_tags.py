@@ -2,11 +2,12 @@
 Tool for listing tags from the Dixa API.
 """
 
-from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from typing import Dict, Any, Optional, Union
+from dixa_api.codec import RawJson
+from tools.base import PASSTHROUGH, get_async_dixa_client
 
 
-async def list_tags(include_deactivated: Optional[bool] = None) -> Dict[str, Any]:
+async def list_tags(include_deactivated: Optional[bool] = None) -> Union[Dict[str, Any], RawJson]:
     """
     List all tags in an organization. Only active tags are returned by default.
     To include deactivated tags use include_deactivated=True.
@@ -17,7 +18,8 @@ async def list_tags(include_deactivated: Optional[bool] = None) -> Dict[str, Any
     
     Returns:
         Dictionary containing the list of all tags in an organization.
+        With DIXA_MCP_PASSTHROUGH set, the upstream JSON body is returned undecoded.
     """
-    client = get_dixa_client()
-    return client.get_tags(include_deactivated=include_deactivated)
+    client = get_async_dixa_client()
+    return await client.get_tags(include_deactivated=include_deactivated, raw=PASSTHROUGH)
 
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def add_agents_to_team(
@@ -30,8 +30,8 @@ async def add_agents_to_team(
     Returns:
         Dictionary containing the operation result.
     """
-    client = get_dixa_client()
-    return client.patch_team_add_agents(
+    client = get_async_dixa_client()
+    return await client.patch_team_add_agents(
         team_id=team_id,
         agent_ids=agent_ids
     )
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def add_team(name: str) -> Dict[str, Any]:
@@ -22,6 +22,6 @@ async def add_team(name: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing the created team.
     """
-    client = get_dixa_client()
-    return client.create_team(name=name)
+    client = get_async_dixa_client()
+    return await client.create_team(name=name)
 
@@ -3,7 +3,7 @@ Tool for getting a team by ID from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def fetch_team_by_id(team_id: str) -> Dict[str, Any]:
@@ -16,6 +16,6 @@ async def fetch_team_by_id(team_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing the team information.
     """
-    client = get_dixa_client()
-    return client.get_team(team_id=team_id)
+    client = get_async_dixa_client()
+    return await client.get_team(team_id=team_id)
 
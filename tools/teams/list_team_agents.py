@@ -3,7 +3,7 @@ Tool for listing agents in a team from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_team_agents(team_id: str) -> Dict[str, Any]:
@@ -16,6 +16,6 @@ async def list_team_agents(team_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing a list of agents/admins in the specified team.
     """
-    client = get_dixa_client()
-    return client.get_team_agents(team_id=team_id)
+    client = get_async_dixa_client()
+    return await client.get_team_agents(team_id=team_id)
 
@@ -3,7 +3,7 @@ Tool for listing team presence status from the Dixa API.
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_team_presence(
@@ -22,8 +22,8 @@ async def list_team_presence(
     Returns:
         Dictionary containing the list of agents/admins presence status in the specified team.
     """
-    client = get_dixa_client()
-    return client.get_team_presence(
+    client = get_async_dixa_client()
+    return await client.get_team_presence(
         team_id=team_id,
         page_key=page_key,
         page_limit=page_limit
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def remove_agents_from_team(
@@ -31,8 +31,8 @@ async def remove_agents_from_team(
         Dictionary with success status. On success (204), returns {"success": True, "message": "Agents removed from team successfully"}.
         On error, returns the error response.
     """
-    client = get_dixa_client()
-    return client.delete_team_remove_agents(
+    client = get_async_dixa_client()
+    return await client.delete_team_remove_agents(
         team_id=team_id,
         agent_ids=agent_ids
     )
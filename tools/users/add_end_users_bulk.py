@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def add_end_users_bulk(
@@ -35,6 +35,6 @@ async def add_end_users_bulk(
     Returns:
         Dictionary containing the results of the bulk creation operation.
     """
-    client = get_dixa_client()
-    return client.create_end_users_bulk(end_users=end_users)
+    client = get_async_dixa_client()
+    return await client.create_end_users_bulk(end_users=end_users)
 
@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def anonymize_end_user(
@@ -26,8 +26,8 @@ async def anonymize_end_user(
     Returns:
         Dictionary containing the anonymization request details.
     """
-    client = get_dixa_client()
-    return client.patch_end_user_anonymize(
+    client = get_async_dixa_client()
+    return await client.patch_end_user_anonymize(
         user_id=user_id,
         force=force
     )
@@ -3,7 +3,7 @@ Tool for getting an end user by ID from the Dixa API.
 """
 
 from typing import Dict, Any
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def fetch_end_user_by_id(
@@ -18,6 +18,6 @@ async def fetch_end_user_by_id(
     Returns:
         Dictionary containing the end user details.
     """
-    client = get_dixa_client()
-    return client.get_end_user(user_id=user_id)
+    client = get_async_dixa_client()
+    return await client.get_end_user(user_id=user_id)
 
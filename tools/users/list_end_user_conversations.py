@@ -3,7 +3,7 @@ Tool for getting (listing) conversations for an end user from the Dixa API.
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_end_user_conversations(
@@ -22,8 +22,8 @@ async def list_end_user_conversations(
     Returns:
         Dictionary containing the list of conversations for the end user.
     """
-    client = get_dixa_client()
-    return client.get_end_user_conversations(
+    client = get_async_dixa_client()
+    return await client.get_end_user_conversations(
         user_id=user_id,
         page_key=page_key,
         page_limit=page_limit
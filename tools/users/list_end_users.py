@@ -3,7 +3,7 @@ Tool for getting (listing) all end users from the Dixa API.
 """
 
 from typing import Dict, Any, Optional
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def list_end_users(
@@ -20,8 +20,8 @@ async def list_end_users(
     Returns:
         Dictionary containing the list of end users.
     """
-    client = get_dixa_client()
-    return client.get_end_users(
+    client = get_async_dixa_client()
+    return await client.get_end_users(
         page_key=page_key,
         page_limit=page_limit
     )
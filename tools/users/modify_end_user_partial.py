@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, Optional, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def modify_end_user_partial(
@@ -44,8 +44,8 @@ async def modify_end_user_partial(
     Returns:
         Dictionary containing the updated end user.
     """
-    client = get_dixa_client()
-    return client.patch_end_user(
+    client = get_async_dixa_client()
+    return await client.patch_end_user(
         user_id=user_id,
         display_name=display_name,
         email=email,
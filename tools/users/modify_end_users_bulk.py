@@ -6,7 +6,7 @@ The AI assistant MUST obtain explicit user confirmation before calling this tool
 """
 
 from typing import Dict, Any, List
-from tools.base import get_dixa_client
+from tools.base import get_async_dixa_client
 
 
 async def modify_end_users_bulk(
@@ -25,6 +25,6 @@ async def modify_end_users_bulk(
     Returns:
         Dictionary containing the results of the bulk patch operation.
     """
-    client = get_dixa_client()
-    return client.patch_end_users_bulk(end_users=end_users)
+    client = get_async_dixa_client()
+    return await client.patch_end_users_bulk(end_users=end_users)
 